@@ -6,17 +6,63 @@ from lib.tkinter_classes import ControlPanel as CP
 from lib.tkinter_classes import BoardWindow as BW
 import sys, random
 from lib.xml_functions import process_xml_hex_flower
+from lib.scheduler import WalkScheduler
+from lib.markov import chain_diagnostics
+from lib.store import WalkStore
+from lib.walklog import WalkLogWriter
 
 def initiate_walk():
-    global start
+    global scheduler
+    if scheduler is not None:
+        scheduler.stop()
     walk = BasicWalk(hf=hf, start=start, moves=walk_length, diagnostic=diagnostic)
-    for i in range(walk_length):
-        current_hex = walk.completeMove(root, diagnostic=diagnostic,
-                          output_file=walk_output_file)
-    msg = "All moves also written to output file: {}.".format(walk_output_file)
-    label = tk.Label(root.frame, text=msg)
-    label.grid(row=28, column=0, columnspan=2, sticky=tk.W)
-    start = int(current_hex)
+    root.results.clear()
+    root.status.config(text='')
+
+    def show_move(number, move):
+        global start
+        walk.showMove(root, number, diagnostic=diagnostic,
+                      output_file=walk_output_file)
+        board.renderer.highlight(move[0])
+        start = int(move[0])
+
+    def walk_finished(stopped):
+        msg = "All moves also written to output file: {}.".format(walk_output_file)
+        if stopped:
+            msg = "Walk stopped. Moves so far written to output file: {}.".format(
+                walk_output_file)
+        # The engine makes moves ahead of the display, so only the start and
+        # the moves shown (and written to the output file) are kept.
+        shown = walk.moves[:scheduler.displayed + 1]
+        if walk_store_file:
+            # Each walk is its own run in the store, with its time and flower.
+            with WalkStore(walk_store_file) as store:
+                run_id = store.start_run(hf, xmlfile, note='app')
+                store.add_walk(run_id, shown)
+            msg += " Stored as run {} in {}.".format(run_id, walk_store_file)
+        if walk_log_file:
+            with WalkLogWriter(walk_log_file) as log:
+                log.write_walk(shown)
+        root.status.config(text=msg)
+
+    # The scheduler makes the moves in the background and shows one every
+    # walk_interval milliseconds, so the windows stay responsive.
+    scheduler = WalkScheduler(root, walk, on_move=show_move,
+                              interval=walk_interval, on_finish=walk_finished,
+                              diagnostic=diagnostic)
+    scheduler.start()
+
+def pause_walk():
+    if scheduler is not None:
+        scheduler.pause()
+
+def resume_walk():
+    if scheduler is not None:
+        scheduler.resume()
+
+def stop_walk():
+    if scheduler is not None:
+        scheduler.stop()
 
 
 # Setting default values. This should be changed at some point to allow the
@@ -28,9 +74,17 @@ side = 40
 logging = True
 log_file = "./log/log"
 walk_length = 15
+walk_interval = 3000
 walk_output_file = "./output/walk_resulfs.csv"
+# Set to a file name, such as "./output/walks.sqlite", to also keep every
+# walk in a SQLite store.
+walk_store_file = ""
+# Set to a file name, such as "./output/walk_log.csv", to also append every
+# walk to a seekable walk log.
+walk_log_file = ""
 start = 1
 walk_type = 'basic'
+scheduler = None
 
 root = CP()
 
@@ -41,7 +95,7 @@ if logging:
 # and imbedded self-termination).
 w_answer = sd.askinteger("Walk Length",
     "How long do you want this walk to be (default is 15 steps)?",
-    parent=root, minvalue=10, maxvalue=75, initialvalue=walk_length)
+    parent=root, minvalue=10, initialvalue=walk_length)
 if w_answer != 15:
     walk_length = w_answer
 
@@ -52,23 +106,32 @@ f_answer = sd.askstring("Output File",
 if f_answer != walk_output_file:
     walk_output_file = f_answer
 
-# Next, we designate the starting hex.
-s_answer = sd.askinteger("Starting Hex",
-    "Which hex do want to start the walk?\n 1-10 is preferable, 1-19 is acceptable.",
-    parent=root, minvalue=1, maxvalue=19, initialvalue=start)
-if s_answer != start:
-    start = s_answer
-
 # Now, we get the desired xml file containing the Hex Flower data.
 xmlfile = None
 while xmlfile == '' or xmlfile is None:
     xmlfile = root.openfile()
-if diagnostic:
-    print(f"Information collected: Walk is {w_answer} steps, starting at {s_answer}.")
-    print(f"Hex Flower file is {xmlfile} with output to {f_answer}.")
 hf = process_xml_hex_flower(xmlfile=xmlfile, canvas_width=canvas_width,
                             canvas_height=canvas_height, side=side,
                             diagnostic=diagnostic)
+
+# Next, we designate the starting hex. Instead of a rule of thumb, the prompt
+# gives the number of steps after which this flower has forgotten its start.
+chain = chain_diagnostics(hf)
+fastest = min(chain['mixing_times'].values())
+quick = [str(h) for h, t in chain['mixing_times'].items() if t == fastest]
+prompt = "Which hex do want to start the walk?\n"
+prompt += f"The walk forgets its start after {chain['mixing_time']:g} steps "
+prompt += f"({fastest:g} from hexes {', '.join(quick)})."
+if not chain['irreducible'] or chain['period'] != 1:
+    prompt += "\nWarning: this flower is reducible or periodic."
+s_answer = sd.askinteger("Starting Hex", prompt, parent=root, minvalue=1,
+                         maxvalue=len(hf.hexes), initialvalue=start)
+if s_answer != start:
+    start = s_answer
+if diagnostic:
+    print(f"Information collected: Walk is {w_answer} steps, starting at {s_answer}.")
+    print(f"Hex Flower file is {xmlfile} with output to {f_answer}.")
+
 board = BW(root, width=canvas_width, height=canvas_height)
 # A canvas is needed for the window that we write the polygons that form the
 # HexFlower. We add control buttons using the C.place() method to make the 
@@ -77,10 +140,19 @@ board = BW(root, width=canvas_width, height=canvas_height)
 #canvas.grid(row=0, column=0)
 
 ttk.Button(board,
-           text='Close',
+           text='Close', width=8,
            command=board.destroy).place(x=0, y=375)
 ttk.Button(board,
-           text='Start Walk',
-           command=initiate_walk).place(x=100, y=375)
+           text='Start Walk', width=8,
+           command=initiate_walk).place(x=80, y=375)
+ttk.Button(board,
+           text='Pause', width=8,
+           command=pause_walk).place(x=160, y=375)
+ttk.Button(board,
+           text='Resume', width=8,
+           command=resume_walk).place(x=240, y=375)
+ttk.Button(board,
+           text='Stop Walk', width=8,
+           command=stop_walk).place(x=320, y=375)
 hf.drawHexFlower(board, diagnostic=diagnostic, width=3)
 tk.mainloop()
\ No newline at end of file
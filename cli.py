@@ -0,0 +1,641 @@
+"""
+Command line runner for Hex Flowers, for batch jobs, cron, and CI. Unlike
+app.py it opens no windows and asks no questions. tkinter is never imported,
+and PIL only is for the render command.
+
+Examples:
+    python cli.py walk data/basic_hex_flower.xml --start 1 --length 365 \\
+        --walks 1000 --seed 42 --format csv --output walks.csv
+    python cli.py walk data/*.xml --walks 10000 --format summary
+    python cli.py render data/basic_hex_flower.xml --format svg --out-dir out
+    python cli.py render data/basic_hex_flower.xml --heatmap stationary
+    python cli.py catalog data --out-dir thumbs --sizes 64 256
+    python cli.py gif data/basic_hex_flower.xml --log walks.log --walk 3 \\
+        --output walk3.gif
+    python cli.py optimize data/generic_wind_speed_hex_flower.xml \\
+        --frequency severe=0.05 --dwell severe=2 --seed 1
+    python cli.py compare data/uniform_basic_hex_flower.xml \\
+        data/nuniform_basic_hex_flower.xml
+    python cli.py campaign regions.csv --days 1095 --start-date 2026-01-01 \\
+        --seed 7 --output campaign.npz
+"""
+import argparse, csv, json, os, sys
+
+def load_flower(path, args):
+    from xml.etree.ElementTree import ParseError
+    from lib.xml_functions import process_xml_hex_flower
+    try:
+        return process_xml_hex_flower(xmlfile=path, side=args.side,
+                                      canvas_width=args.canvas_width,
+                                      canvas_height=args.canvas_height)
+    except (ParseError, KeyError, IndexError, TypeError, AttributeError) as e:
+        # A missing or malformed element surfaces as one of these deep in
+        # the parser; report the file instead of a traceback.
+        raise ValueError(f"{path} is not a valid Hex Flower file "
+                         f"({type(e).__name__}: {e})") from e
+
+def zone_columns(hf) -> tuple:
+    """
+    Returns (types, effects), arrays indexed by hex id - 1, so zones can be
+    looked up for a whole array of walk paths at once.
+    """
+    import numpy as np
+    types = np.array([hex.zone.type for hex in hf.hexes], dtype=object)
+    effects = np.array([hex.zone.effect for hex in hf.hexes], dtype=object)
+    return types, effects
+
+def write_csv(out, flower, paths, hf, header):
+    types, effects = zone_columns(hf)
+    writer = csv.writer(out)
+    if header:
+        writer.writerow(('flower', 'walk', 'step', 'hex', 'zone', 'effect'))
+    walks, steps = paths.shape
+    for w in range(walks):
+        row = paths[w] - 1
+        writer.writerows(zip([flower] * steps, [w] * steps, range(steps),
+                             paths[w].tolist(), types[row], effects[row]))
+
+def summarize(flower, paths, hf) -> dict:
+    """
+    Returns the share of visits to each hex, zone type, and zone effect over
+    every step of every walk.
+    """
+    import numpy as np
+    from lib.simulation import visit_counts
+    counts = visit_counts(paths, len(hf.hexes))
+    share = counts / max(counts.sum(), 1)
+    types, effects = zone_columns(hf)
+    by_type, by_effect = {}, {}
+    for i in range(len(hf.hexes)):
+        by_type[types[i]] = by_type.get(types[i], 0.0) + float(share[i])
+        key = str(effects[i])
+        by_effect[key] = by_effect.get(key, 0.0) + float(share[i])
+    return {'flower': flower, 'walks': int(paths.shape[0]),
+            'steps': int(paths.shape[1] - 1),
+            'hexes': {i + 1: float(share[i]) for i in range(len(hf.hexes))},
+            'zones': by_type, 'effects': by_effect}
+
+def print_summary(out, summary):
+    out.write("{flower}: {walks} walks of {steps} steps\n".format(**summary))
+    for title, key in (('Hex', 'hexes'), ('Zone', 'zones'), ('Effect', 'effects')):
+        out.write(f"  {title}:\n")
+        for name, share in summary[key].items():
+            out.write(f"    {name!s:<20} {share:8.4f}\n")
+
+def walk_command(args) -> int:
+    import numpy as np
+    from lib.simulation import simulate_walks
+    # Each flower gets its own seed, spawned from --seed (or fresh entropy),
+    # and recorded with its walks, so any one run can be repeated on its own.
+    seeds = [int(s.generate_state(1)[0])
+             for s in np.random.SeedSequence(args.seed).spawn(len(args.flowers))]
+    if args.format == 'npy':
+        if not args.output or len(args.flowers) != 1:
+            raise ValueError("--format npy needs one flower and an --output file")
+        from lib.runs import save_walk_paths
+        hf = load_flower(args.flowers[0], args)
+        save_walk_paths(args.output, simulate_walks(hf, args.start, args.length,
+                                                    walks=args.walks, seed=seeds[0]))
+        return 0
+    if args.format == 'log':
+        if not args.output:
+            raise ValueError("--format log needs an --output file")
+        from lib.walklog import WalkLogWriter
+        for path, seed in zip(args.flowers, seeds):
+            hf = load_flower(path, args)
+            with WalkLogWriter(args.output, hf) as log:
+                first = log.write_paths(simulate_walks(hf, args.start, args.length,
+                                                       walks=args.walks, seed=seed))
+            print(f"{path}: walks {first} to {first + args.walks - 1}, seed {seed}")
+        return 0
+    if args.format == 'sqlite':
+        if not args.output:
+            raise ValueError("--format sqlite needs an --output database")
+        from lib.store import WalkStore
+        with WalkStore(args.output) as store:
+            for path, seed in zip(args.flowers, seeds):
+                hf = load_flower(path, args)
+                run_id = store.start_run(hf, path, campaign=args.campaign, seed=seed)
+                store.add_walks(run_id, simulate_walks(hf, args.start, args.length,
+                                                       walks=args.walks, seed=seed))
+                print(f"{path}: run {run_id}, seed {seed}")
+        return 0
+    out = open(args.output, 'w', newline='') if args.output else sys.stdout
+    try:
+        results = []
+        for n, (path, seed) in enumerate(zip(args.flowers, seeds)):
+            hf = load_flower(path, args)
+            paths = simulate_walks(hf, args.start, args.length,
+                                   walks=args.walks, seed=seed)
+            if args.format == 'csv':
+                write_csv(out, path, paths, hf, header=(n == 0))
+            elif args.format == 'json':
+                results.append({'flower': path, 'start': args.start,
+                                'length': args.length, 'seed': seed,
+                                'paths': paths.tolist()})
+            else:
+                summary = summarize(path, paths, hf)
+                if args.output:
+                    results.append(summary)
+                else:
+                    print_summary(out, summary)
+        if results:
+            json.dump(results, out, indent=1 if args.format == 'summary' else None)
+            out.write("\n")
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    return 0
+
+def heatmap_fills(hf, args):
+    # The heatmap fills of a render, or None to keep the zone colors. The
+    # frequency heatmap shades visits in a walk log, or in simulated walks.
+    if not args.heatmap:
+        return None
+    from lib.heatmap import heat_values, heat_fills
+    paths = None
+    if args.heatmap == 'frequency':
+        if args.log:
+            from lib.runs import load_walk_paths
+            paths = load_walk_paths(args.log, flower=args.log_flower)[0]
+        else:
+            from lib.simulation import simulate_walks
+            paths = simulate_walks(hf, args.start, args.length,
+                                   walks=args.walks, seed=args.seed)
+    values = heat_values(hf, mode=args.heatmap, paths=paths)
+    return heat_fills(hf, values, colors=tuple(args.colors))
+
+def render_command(args) -> int:
+    from lib.export import export_png, export_svg
+    if args.log and len(args.flowers) != 1:
+        raise ValueError("--log needs exactly one flower")
+    os.makedirs(args.out_dir, exist_ok=True)
+    for path in args.flowers:
+        hf = load_flower(path, args)
+        fills = heatmap_fills(hf, args)
+        stem = os.path.splitext(os.path.basename(path))[0]
+        if args.heatmap:
+            stem = f"{stem}_{args.heatmap}"
+        target = os.path.join(args.out_dir, f"{stem}.{args.format}")
+        if args.format == 'png':
+            export_png(hf, target, scale=args.scale, fills=fills)
+        else:
+            export_svg(hf, target, scale=args.scale, fills=fills)
+        print(target)
+    return 0
+
+def catalog_command(args) -> int:
+    from lib.catalog import export_catalog
+    summary = export_catalog(args.xml_dir, args.out_dir, sizes=args.sizes,
+                             processes=args.processes, side=args.side,
+                             canvas_width=args.canvas_width,
+                             canvas_height=args.canvas_height,
+                             force=args.force)
+    print(f"{args.out_dir}: {len(summary['rendered'])} rendered, "
+          f"{len(summary['skipped'])} unchanged, {len(summary['failed'])} failed")
+    for xmlfile, error in summary['failed'].items():
+        print(f"  {xmlfile}: {error}", file=sys.stderr)
+    return 1 if summary['failed'] else 0
+
+def read_moves(args) -> list:
+    """
+    Returns the hex ids of one walk from --log, which may be a seekable walk
+    log from 'walk --format log', a .npy or CSV log from 'walk --format npy'
+    or 'walk --format csv', or a showMove output file of one walk.
+    """
+    from lib.walklog import HEADER, WalkLogReader, build_index, index_path
+    first = None
+    if os.path.splitext(args.log)[1].lower() != '.npy':
+        with open(args.log, newline='') as myfile:
+            first = next(csv.reader(myfile), None)
+    if first is not None and tuple(first) == HEADER:
+        if not os.path.exists(index_path(args.log)):
+            build_index(args.log)
+        with WalkLogReader(args.log) as log:
+            return [move[2] for move in log.replay(args.walk, args.step, args.count)]
+    if first is None or first[0] == 'flower':
+        from lib.runs import load_walk_paths
+        paths, walks = load_walk_paths(args.log, flower=args.log_flower)
+        moves = paths if walks is None else paths[walks == args.walk]
+    else:
+        from lib.export import read_walk_log
+        moves = read_walk_log(args.log)
+    stop = None if args.count is None else args.step + args.count
+    return [int(m) for m in moves[args.step:stop]]
+
+def gif_command(args) -> int:
+    from lib.export import export_walk_gif, export_walk_frames
+    if len(args.flowers) != 1:
+        raise ValueError("gif needs exactly one flower")
+    hf = load_flower(args.flowers[0], args)
+    moves = read_moves(args)
+    if not moves:
+        raise ValueError(f"{args.log} has no moves for walk {args.walk} from step {args.step}")
+    if max(moves) > len(hf.hexes) or min(moves) < 1:
+        raise ValueError(f"{args.log} has hex ids outside [1, {len(hf.hexes)}]")
+    options = dict(scale=args.scale, highlight=args.highlight)
+    if args.frames:
+        paths = export_walk_frames(hf, moves, args.frames, **options)
+        print(f"{args.frames}: {len(paths)} frames")
+    else:
+        export_walk_gif(hf, moves, args.output, duration=args.duration, **options)
+        print(f"{args.output}: {len(moves)} frames")
+    return 0
+
+def parse_targets(items, name) -> dict:
+    """
+    Turns ['severe=0.05', ...] into {'severe': 0.05, ...}.
+    """
+    targets = {}
+    for item in items or ():
+        zone, sep, value = item.rpartition('=')
+        if not sep or not zone:
+            raise ValueError(f"--{name} takes ZONE=VALUE, not {item}")
+        targets[zone] = float(value)
+    return targets
+
+def optimize_command(args) -> int:
+    from lib.optimize import optimize_flower
+    from lib.xml_functions import write_xml_hex_flower
+    frequency = parse_targets(args.frequency, 'frequency')
+    dwell = parse_targets(args.dwell, 'dwell')
+    os.makedirs(args.out_dir, exist_ok=True)
+    for path in args.flowers:
+        hf = load_flower(path, args)
+        new, report = optimize_flower(hf, frequency=frequency, dwell=dwell,
+                                      moves=tuple(args.moves),
+                                      iterations=args.iterations,
+                                      restarts=args.restarts,
+                                      processes=args.processes, seed=args.seed)
+        stem = os.path.splitext(os.path.basename(path))[0]
+        target = os.path.join(args.out_dir, f"{stem}_optimized.xml")
+        write_xml_hex_flower(new, target)
+        print(f"{target}: score {report['score']:.6f}")
+        for key in ('frequency', 'dwell'):
+            for zone, (achieved, goal) in report[key].items():
+                print(f"  {key} {zone:<12} {achieved:8.4f} (target {goal:g})")
+        for change in report['changes']:
+            print(f"  {change}")
+    return 0
+
+def compare_command(args) -> int:
+    from lib.compare import compare_flowers, comparison_json, format_comparison
+    flowers = {path: load_flower(path, args) for path in args.flowers}
+    report = compare_flowers(flowers, sensitivity=not args.no_sensitivity,
+                             eps=args.eps)
+    out = open(args.output, 'w') if args.output else sys.stdout
+    try:
+        if args.format == 'json':
+            json.dump(comparison_json(report), out, indent=1)
+        else:
+            out.write(format_comparison(report, top=args.top))
+        out.write("\n")
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    return 0
+
+def runs_command(args) -> int:
+    from lib.runs import analyze_walks, format_runs, load_walk_paths
+    if args.log and len(args.flowers) != 1:
+        raise ValueError("--log needs exactly one flower")
+    for path in args.flowers:
+        hf = load_flower(path, args)
+        if args.log:
+            paths, walks = load_walk_paths(args.log, flower=args.log_flower)
+        else:
+            from lib.simulation import simulate_walks
+            paths = simulate_walks(hf, args.start, args.length,
+                                   walks=args.walks, seed=args.seed)
+            walks = None
+        report = analyze_walks(hf, paths, walks=walks, by=args.by,
+                               complete_only=args.complete_only)
+        print(f"{path}: {format_runs(report)}")
+    return 0
+
+def start_value(text):
+    # A start hex id, or 'stationary' for the long-run distribution.
+    return text if text == 'stationary' else int(text)
+
+def estimate_command(args) -> int:
+    from lib.montecarlo import adaptive_walks, adaptive_difference
+    options = dict(precision=args.precision, relative=args.relative,
+                   confidence=args.confidence, batch=args.batch,
+                   max_walks=args.max_walks, seed=args.seed,
+                   antithetic=args.antithetic, stratify=args.stratify)
+    other = load_flower(args.versus, args) if args.versus else None
+    for path in args.flowers:
+        hf = load_flower(path, args)
+        if other is None:
+            result = adaptive_walks(hf, args.start, args.length, args.stat, **options)
+            title = path
+        else:
+            result = adaptive_difference(hf, other, args.start, args.length,
+                                         args.stat, common=not args.independent,
+                                         **options)
+            title = f"{path} minus {args.versus}"
+        state = 'converged' if result['converged'] else 'stopped at --max-walks'
+        print(f"{title}: {result['walks']} walks in {result['batches']} batches, "
+              f"{result['seconds']:.2f} s, {state}")
+        for name, s in result['statistics'].items():
+            print(f"  {name:<24} {s['estimate']:.5f} +/- {s['half_width']:.5f}")
+    return 0
+
+def mixing_command(args) -> int:
+    from lib.markov import chain_diagnostics
+    failed = False
+    results = []
+    for path in args.flowers:
+        d = chain_diagnostics(load_flower(path, args), eps=args.eps)
+        problems = []
+        if not d['irreducible']:
+            problems.append("reducible: some hexes cannot be reached from others")
+        if d['period'] != 1:
+            problems.append(f"periodic with period {d['period']}")
+        failed = failed or bool(problems)
+        if args.format == 'json':
+            results.append(dict(d, flower=path, problems=problems))
+            continue
+        print(f"{path}:")
+        for problem in problems:
+            print(f"  WARNING {problem}")
+        print(f"  spectral gap      {d['spectral_gap']:.4f}")
+        print(f"  relaxation time   {d['relaxation_time']:.2f} steps")
+        print(f"  mixing time       {d['mixing_time']:g} steps (eps {args.eps:g})")
+        print("  warm-up steps by start hex:")
+        for hex_id, t in d['mixing_times'].items():
+            print(f"    {hex_id:>3} {t:g}")
+    if args.format == 'json':
+        from lib.compare import comparison_json
+        json.dump(comparison_json(results), sys.stdout, indent=1)
+        sys.stdout.write("\n")
+    return 1 if failed and args.check else 0
+
+def day_command(args) -> int:
+    from lib.store import WalkStore
+    if (args.run is None) == (args.campaign is None):
+        raise ValueError("give either --run or --campaign")
+    if not os.path.exists(args.database):
+        raise ValueError(f"{args.database} does not exist")
+    writer = csv.writer(sys.stdout)
+    writer.writerow(('run', 'walk', 'hex', 'zone', 'effect'))
+    with WalkStore(args.database) as store:
+        writer.writerows(store.day(args.day, run_id=args.run, campaign=args.campaign))
+    return 0
+
+def replay_command(args) -> int:
+    from lib.walklog import WalkLogReader, build_index, index_path
+    if not os.path.exists(index_path(args.log)):
+        build_index(args.log)
+    writer = csv.writer(sys.stdout)
+    with WalkLogReader(args.log) as log:
+        writer.writerows(log.replay(args.walk, args.step, args.count))
+    return 0
+
+def load_regions(path, args) -> list:
+    """
+    Reads a regions CSV file with the columns name, flowers (XML files,
+    separated by ';', one per season or one for the year), start, and
+    steps_per_day. Each flower file is loaded once.
+    """
+    from lib.campaign import Region
+    flowers = {}
+    regions = []
+    with open(path, newline='') as myfile:
+        for row in csv.DictReader(myfile):
+            files = [f.strip() for f in row['flowers'].split(';') if f.strip()]
+            for f in files:
+                if f not in flowers:
+                    flowers[f] = load_flower(f, args)
+            regions.append(Region(row['name'], [flowers[f] for f in files],
+                                  start=int(row.get('start') or 1),
+                                  steps_per_day=int(row.get('steps_per_day') or 1)))
+    return regions
+
+def campaign_command(args) -> int:
+    from lib.campaign import simulate_campaign, write_campaign
+    regions = load_regions(args.regions, args)
+    columns = simulate_campaign(regions, args.days, start_date=args.start_date,
+                                seed=args.seed)
+    write_campaign(columns, args.output)
+    print(f"{args.output}: {len(regions)} regions, {args.days} days")
+    return 0
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog='cli.py',
+        description="Run Hex Flower walks and renders without a display.")
+    layout = argparse.ArgumentParser(add_help=False)
+    layout.add_argument('flowers', nargs='+', help="Hex Flower XML file(s)")
+    layout.add_argument('--side', type=float, default=40,
+                        help="length of a hex side (default 40)")
+    layout.add_argument('--canvas-width', type=int, default=400)
+    layout.add_argument('--canvas-height', type=int, default=400)
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    walk = commands.add_parser('walk', parents=[layout],
+        help="simulate Basic Walks on each flower")
+    walk.add_argument('--start', type=int, default=1,
+                      help="start hex id (default 1)")
+    walk.add_argument('--length', type=int, default=15,
+                      help="moves per walk (default 15)")
+    walk.add_argument('--walks', type=int, default=1,
+                      help="number of walks per flower (default 1)")
+    walk.add_argument('--seed', type=int, default=None,
+                      help="random seed for repeatable runs")
+    walk.add_argument('--format', choices=('csv', 'json', 'summary', 'npy', 'sqlite', 'log'),
+                      default='csv', help="output format (default csv)")
+    walk.add_argument('--output', '-o', default=None,
+                      help="output file (default stdout)")
+    walk.add_argument('--campaign', default=None,
+                      help="campaign name for runs stored with --format sqlite")
+    walk.set_defaults(func=walk_command)
+
+    render = commands.add_parser('render', parents=[layout],
+        help="render each flower to PNG or SVG")
+    render.add_argument('--format', choices=('png', 'svg'), default='png')
+    render.add_argument('--scale', type=float, default=1.0)
+    render.add_argument('--out-dir', default='./output')
+    render.add_argument('--heatmap', choices=('frequency', 'stationary', 'dwell'),
+                        default=None,
+                        help="shade hexes by visit frequency, long-run share of "
+                             "time, or expected dwell instead of zone colors")
+    render.add_argument('--colors', nargs='+', default=['white', 'red'],
+                        help="heatmap gradient colors, lowest first (default white red)")
+    render.add_argument('--log', default=None,
+                        help="walk log (.npy, CSV, or 'walk --format log') for "
+                             "--heatmap frequency; without it walks are simulated")
+    render.add_argument('--log-flower', default=None,
+                        help="flower column value to read from a CSV log of several flowers")
+    render.add_argument('--start', type=int, default=1)
+    render.add_argument('--length', type=int, default=365)
+    render.add_argument('--walks', type=int, default=1000)
+    render.add_argument('--seed', type=int, default=None)
+    render.set_defaults(func=render_command)
+
+    catalog = commands.add_parser('catalog',
+        help="render thumbnails of every flower in a directory, skipping unchanged ones")
+    catalog.add_argument('xml_dir', help="directory of Hex Flower XML files")
+    catalog.add_argument('--out-dir', default='./output/catalog')
+    catalog.add_argument('--sizes', type=int, nargs='+', default=[64, 128, 256],
+                         help="thumbnail widths in pixels (default 64 128 256)")
+    catalog.add_argument('--processes', type=int, default=None,
+                         help="worker processes (default every core)")
+    catalog.add_argument('--force', action='store_true',
+                         help="render every flower, even if unchanged")
+    catalog.add_argument('--side', type=float, default=40)
+    catalog.add_argument('--canvas-width', type=int, default=400)
+    catalog.add_argument('--canvas-height', type=int, default=400)
+    catalog.set_defaults(func=catalog_command)
+
+    gif = commands.add_parser('gif', parents=[layout],
+        help="animate a logged walk on its flower as a GIF or PNG frames")
+    gif.add_argument('--log', required=True,
+                     help="walk log: from 'walk --format log', 'csv' or 'npy', "
+                          "or a showMove output file")
+    gif.add_argument('--walk', type=int, default=0,
+                     help="walk number in the log (default 0)")
+    gif.add_argument('--log-flower', default=None,
+                     help="flower column value to read from a CSV log of several flowers")
+    gif.add_argument('--step', type=int, default=0,
+                     help="first step to show (default 0, the start)")
+    gif.add_argument('--count', type=int, default=None,
+                     help="number of moves to show (default to the end)")
+    gif.add_argument('--duration', type=int, default=500,
+                     help="milliseconds per frame (default 500)")
+    gif.add_argument('--scale', type=float, default=1.0)
+    gif.add_argument('--highlight', default='yellow',
+                     help="outline color of the current hex")
+    gif.add_argument('--output', '-o', default='./output/walk.gif')
+    gif.add_argument('--frames', default=None, metavar='DIR',
+                     help="write numbered PNG frames to DIR instead of a GIF")
+    gif.set_defaults(func=gif_command)
+
+    optimize = commands.add_parser('optimize', parents=[layout],
+        help="edit each flower to meet zone frequency and dwell targets")
+    optimize.add_argument('--frequency', action='append', metavar='ZONE=SHARE',
+                          help="target share of time in a zone type, e.g. severe=0.05")
+    optimize.add_argument('--dwell', action='append', metavar='ZONE=STEPS',
+                          help="target average run length in a zone type, e.g. severe=2")
+    optimize.add_argument('--moves', nargs='+', default=['adjacency', 'block', 'outcomes'],
+                          choices=('adjacency', 'block', 'outcomes'),
+                          help="kinds of edits allowed (default all)")
+    optimize.add_argument('--iterations', type=int, default=2000,
+                          help="candidates tried by each search run (default 2000)")
+    optimize.add_argument('--restarts', type=int, default=None,
+                          help="independent search runs (default one per core)")
+    optimize.add_argument('--processes', type=int, default=None,
+                          help="worker processes (default every core)")
+    optimize.add_argument('--seed', type=int, default=None)
+    optimize.add_argument('--out-dir', default='./output')
+    optimize.set_defaults(func=optimize_command)
+
+    compare = commands.add_parser('compare', parents=[layout],
+        help="compare flowers exactly against the first, with edge sensitivity")
+    compare.add_argument('--format', choices=('text', 'json'), default='text')
+    compare.add_argument('--top', type=int, default=5,
+                         help="hexes and edges listed per flower (default 5)")
+    compare.add_argument('--eps', type=float, default=0.25,
+                         help="total variation distance for the mixing time")
+    compare.add_argument('--no-sensitivity', action='store_true',
+                         help="skip the effect of blocking each edge")
+    compare.add_argument('--output', '-o', default=None,
+                         help="output file (default stdout)")
+    compare.set_defaults(func=compare_command)
+
+    runs = commands.add_parser('runs', parents=[layout],
+        help="run lengths and transitions of zones in walk logs or simulated walks")
+    runs.add_argument('--log', default=None,
+                      help="walk log to read (.npy, CSV, or 'walk --format log'); "
+                           "without it walks are simulated")
+    runs.add_argument('--log-flower', default=None,
+                      help="flower column value to read from a CSV log of several flowers")
+    runs.add_argument('--by', choices=('zone', 'effect', 'hex'), default='zone')
+    runs.add_argument('--complete-only', action='store_true',
+                      help="leave out runs cut short by the start or end of a walk")
+    runs.add_argument('--start', type=int, default=1)
+    runs.add_argument('--length', type=int, default=365)
+    runs.add_argument('--walks', type=int, default=1000)
+    runs.add_argument('--seed', type=int, default=None)
+    runs.set_defaults(func=runs_command)
+
+    estimate = commands.add_parser('estimate', parents=[layout],
+        help="simulate walks until statistics reach a target precision")
+    estimate.add_argument('--stat', action='append', required=True,
+                          metavar='KIND:TARGET',
+                          help="frequency, hitting, or dwell of a zone type or "
+                               "hex id, e.g. dwell:severe or hitting:19")
+    estimate.add_argument('--precision', type=float, default=0.005,
+                          help="largest confidence interval half width (default 0.005)")
+    estimate.add_argument('--relative', action='store_true',
+                          help="precision is a fraction of each estimate")
+    estimate.add_argument('--confidence', type=float, default=0.95)
+    estimate.add_argument('--batch', type=int, default=1000,
+                          help="walks in the first batch, which then doubles")
+    estimate.add_argument('--max-walks', type=int, default=1000000)
+    estimate.add_argument('--start', type=start_value, default=1,
+                          help="start hex id, or 'stationary' (default 1)")
+    estimate.add_argument('--length', type=int, default=365)
+    estimate.add_argument('--seed', type=int, default=None)
+    estimate.add_argument('--antithetic', action='store_true',
+                          help="simulate walks in antithetic pairs")
+    estimate.add_argument('--stratify', action='store_true',
+                          help="spread starts evenly over a 'stationary' start")
+    estimate.add_argument('--versus', default=None, metavar='FLOWER',
+                          help="estimate the difference from this flower variant, "
+                               "with common random numbers")
+    estimate.add_argument('--independent', action='store_true',
+                          help="with --versus, use independent random numbers")
+    estimate.set_defaults(func=estimate_command)
+
+    mixing = commands.add_parser('mixing', parents=[layout],
+        help="spectral gap, warm-up steps per start hex, and chain checks")
+    mixing.add_argument('--eps', type=float, default=0.25,
+                        help="total variation distance counted as mixed (default 0.25)")
+    mixing.add_argument('--format', choices=('text', 'json'), default='text')
+    mixing.add_argument('--check', action='store_true',
+                        help="exit with status 1 if a flower is reducible or periodic")
+    mixing.set_defaults(func=mixing_command)
+
+    day = commands.add_parser('day',
+        help="where every stored walk of a run or campaign was on one day")
+    day.add_argument('database', help="SQLite file from 'walk --format sqlite'")
+    day.add_argument('day', type=int, help="step number, 0 is the start")
+    day.add_argument('--run', type=int, default=None)
+    day.add_argument('--campaign', default=None)
+    day.set_defaults(func=day_command)
+
+    replay = commands.add_parser('replay',
+        help="read a walk from a seekable walk log, starting at any step")
+    replay.add_argument('log', help="log file from 'walk --format log'")
+    replay.add_argument('walk', type=int, help="walk number, from 0")
+    replay.add_argument('step', type=int, nargs='?', default=0,
+                        help="first step to show (default 0, the start)")
+    replay.add_argument('--count', type=int, default=None,
+                        help="number of moves to show (default to the end)")
+    replay.set_defaults(func=replay_command)
+
+    campaign = commands.add_parser('campaign',
+        help="simulate many regions across a calendar in one pass")
+    campaign.add_argument('regions', help="CSV file with columns name, flowers "
+                          "(';' separated, one per season or one), start, steps_per_day")
+    campaign.add_argument('--days', type=int, default=365)
+    campaign.add_argument('--start-date', default=None,
+                          help="first day, YYYY-MM-DD; picks seasonal flowers by month, "
+                               "and is needed by regions with several flowers")
+    campaign.add_argument('--seed', type=int, default=None)
+    campaign.add_argument('--output', '-o', required=True,
+                          help="output file, .npz for columnar arrays or CSV")
+    campaign.set_defaults(func=campaign_command, side=40, canvas_width=400,
+                          canvas_height=400)
+    return parser
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+    try:
+        return args.func(args)
+    except (OSError, ValueError) as e:
+        print(f"{args.command}: {e}", file=sys.stderr)
+        return 1
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,180 @@
+import csv
+import numpy as np
+from lib.markov import transition_table
+
+# Multi-region calendar simulation. Every region walks its own Hex Flower,
+# or one flower per season, a set number of steps per day. All the distinct
+# flowers of a campaign are stacked into one transition table, so one array
+# operation moves every region at once, and the days of the calendar are the
+# only Python loop.
+
+# Meteorological seasons by month: December to February is 0 (winter),
+# March to May 1 (spring), June to August 2 (summer), September to
+# November 3 (autumn).
+SEASON_NAMES = ('winter', 'spring', 'summer', 'autumn')
+
+class Region():
+    """
+    This class describes one region of a campaign.
+
+    Arguments:
+        name: str, the name of the region
+        flowers: HexFlower or list of HexFlower, one flower for the whole
+            year or one per season, in the order of the calendar's seasons
+        start: int, optional, the start hex id, default 1
+        steps_per_day: int, optional, moves made each day, default 1
+    """
+    def __init__(self, name, flowers, start=1, steps_per_day=1):
+        self.name = str(name)
+        self.flowers = list(flowers) if isinstance(flowers, (list, tuple)) else [flowers]
+        if not self.flowers:
+            raise ValueError(f"Region {name} needs at least one Hex Flower.")
+        if not 1 <= start <= len(self.flowers[0].hexes):
+            raise ValueError(f"Region {name} start must be a hex id of its flower.")
+        if not isinstance(steps_per_day, int) or steps_per_day < 1:
+            raise ValueError(f"Region {name} needs a positive integer steps_per_day.")
+        self.start = start
+        self.steps_per_day = steps_per_day
+
+    def __repr__(self) -> str:
+        return (f"Region(name={self.name!r}, flowers={len(self.flowers)}, "
+                f"start={self.start}, steps_per_day={self.steps_per_day})")
+
+def month_seasons(start_date, days) -> np.ndarray:
+    """
+    Returns the meteorological season index (see SEASON_NAMES) of each day
+    of a calendar of days days beginning on start_date.
+    """
+    dates = np.datetime64(start_date, 'D') + np.arange(days)
+    months = (dates.astype('datetime64[M]').astype(int) % 12) + 1
+    return (months % 12) // 3
+
+def simulate_campaign(regions, days, start_date=None, seasons=None,
+                      seed=None, diagnostic=False) -> dict:
+    """
+    This function runs every region of a campaign across a calendar and
+    returns the weather of each region on each day, as columns.
+
+    Arguments:
+        regions: list of Region
+        days: int, number of days in the calendar
+        start_date: date, str, or None, optional, the first day, such as
+            '2026-01-01'. With a date, seasons default to month_seasons.
+        seasons: array or None, optional, the season index of each day,
+            which picks the flower of regions with one flower per season.
+            Regions with one flower per season need seasons or start_date.
+        seed: int or None, optional, random seed for repeatable runs
+        diagnostic: bool, optional, print the size of the run to stdio
+
+    Returns a dictionary of equal length arrays, one row per region per
+    day, ordered by day and then region: 'day' (from 0), 'date' (if
+    start_date is given), 'region' (index into regions), 'flower' (index
+    into that region's flowers), 'hex', 'zone', and 'effect'. The hex is
+    where the region is at the end of the day. The dictionary also holds
+    'regions', the region names.
+    """
+    if not regions:
+        raise ValueError("A campaign needs at least one region.")
+    if not isinstance(days, int) or days < 1:
+        raise ValueError("days must be a positive integer.")
+    if seasons is None and start_date is None:
+        seasonal = [region.name for region in regions if len(region.flowers) > 1]
+        if seasonal:
+            raise ValueError(f"Regions {', '.join(seasonal)} have one flower per season; "
+                             "give a start_date or seasons to pick them.")
+    if seasons is None:
+        seasons = month_seasons(start_date, days) if start_date is not None \
+            else np.zeros(days, dtype=np.intp)
+    seasons = np.asarray(seasons, dtype=np.intp)
+    if seasons.shape != (days,) or np.any(seasons < 0):
+        raise ValueError("seasons needs one non-negative season index per day.")
+    count = int(seasons.max()) + 1
+    hexes = len(regions[0].flowers[0].hexes)
+
+    # Stack the distinct flowers. Tables are padded to the most rolls, with
+    # padded rolls never drawn since their cumulative probability is 1.
+    flowers, slot = [], {}
+    for region in regions:
+        if len(region.flowers) != 1 and len(region.flowers) < count:
+            raise ValueError(f"Region {region.name} has {len(region.flowers)} flowers "
+                             f"but the calendar has {count} seasons.")
+        for hf in region.flowers:
+            if len(hf.hexes) != hexes:
+                raise ValueError("Every flower of a campaign needs the same number of hexes.")
+            if id(hf) not in slot:
+                slot[id(hf)] = len(flowers)
+                flowers.append(hf)
+    tables = [transition_table(hf) for hf in flowers]
+    rolls = max(len(probs) for _, probs in tables)
+    table = np.zeros((len(flowers), hexes, rolls), dtype=np.intp)
+    cum = np.ones((len(flowers), rolls))
+    for f, (t, probs) in enumerate(tables):
+        table[f, :, :t.shape[1]] = t
+        table[f, :, t.shape[1]:] = t[:, -1:]
+        cum[f, :len(probs)] = np.cumsum(probs)
+        cum[f, len(probs) - 1:] = 1.0
+    # which[s, r]: the stacked flower region r walks in season s, and
+    # local[s, r] its index among the region's own flowers.
+    local = np.array([[s if len(region.flowers) > 1 else 0 for region in regions]
+                      for s in range(count)], dtype=np.intp)
+    which = np.array([[slot[id(region.flowers[local[s, r]])]
+                       for r, region in enumerate(regions)] for s in range(count)],
+                     dtype=np.intp)
+    steps = np.array([region.steps_per_day for region in regions])
+    most = int(steps.max())
+    if diagnostic:
+        print(f"simulate_campaign: {len(regions)} regions, {days} days, "
+              f"{len(flowers)} flowers, up to {most} steps a day")
+
+    rng = np.random.default_rng(seed)
+    current = np.array([region.start - 1 for region in regions], dtype=np.intp)
+    index = np.arange(len(regions))
+    path = np.empty((days, len(regions)), dtype=np.int8 if hexes < 128 else np.intp)
+    for day in range(days):
+        f = which[seasons[day]]
+        uniforms = rng.random((most, len(regions)))
+        for step in range(most):
+            roll = (cum[f] <= uniforms[step][:, None]).sum(axis=1)
+            moved = table[f, current, np.minimum(roll, rolls - 1)]
+            current = np.where(step < steps, moved, current)
+        path[day] = current
+    path = path.astype(np.intp) + 1
+
+    # Zone and effect labels by stacked flower and hex, looked up at once.
+    zones = np.array([[hex.zone.type for hex in hf.hexes] for hf in flowers], dtype=object)
+    effects = np.array([[hex.zone.effect for hex in hf.hexes] for hf in flowers], dtype=object)
+    flower_of_day = which[seasons]
+    columns = {'day': np.repeat(np.arange(days), len(regions)),
+               'region': np.tile(index, days),
+               'flower': local[seasons].ravel(),
+               'hex': path.ravel(),
+               'zone': zones[flower_of_day, path - 1].ravel(),
+               'effect': effects[flower_of_day, path - 1].ravel(),
+               'regions': [region.name for region in regions]}
+    if start_date is not None:
+        columns['date'] = np.datetime64(start_date, 'D') + columns['day']
+    return columns
+
+def write_campaign(columns, path):
+    """
+    Writes the columns from simulate_campaign to path. A '.npz' file keeps
+    the columnar layout, compressed, with zone and effect as strings; any
+    other name is written as CSV with one row per region per day.
+    """
+    names = [k for k in ('day', 'date', 'region', 'flower', 'hex', 'zone', 'effect')
+             if k in columns]
+    if str(path).lower().endswith('.npz'):
+        data = {k: columns[k] for k in names}
+        for k in ('zone', 'effect'):
+            data[k] = np.array(['' if v is None else str(v) for v in columns[k]])
+        if 'date' in data:
+            data['date'] = data['date'].astype(str)
+        np.savez_compressed(path, regions=np.array(columns['regions']), **data)
+        return
+    at = names.index('region')
+    cols = [columns[k].astype(str) if k == 'date' else columns[k] for k in names]
+    cols.insert(at, np.array(columns['regions'], dtype=object)[columns['region']])
+    with open(path, 'w', newline='') as myfile:
+        writer = csv.writer(myfile)
+        writer.writerow(names[:at] + ['region_name'] + names[at:])
+        writer.writerows(zip(*(c.tolist() for c in cols)))
@@ -0,0 +1,160 @@
+import glob, hashlib, json, os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from xml.etree import ElementTree
+from lib.xml_functions import process_xml_hex_flower
+from lib.export import export_png
+
+# The manifest in the output directory remembers the render key of every
+# flower, so unchanged flowers are skipped on the next run.
+MANIFEST = '.catalog_manifest.json'
+
+def _file_hash(path) -> str:
+    h = hashlib.sha256()
+    with open(path, 'rb') as myfile:
+        for block in iter(lambda: myfile.read(1 << 16), b''):
+            h.update(block)
+    return h.hexdigest()
+
+def render_key(xmlfile, settings: dict, icon_hashes=None) -> str:
+    """
+    Returns a hash of everything a flower's thumbnails depend on: the XML
+    file, every icon file it uses, and the render settings. icon_hashes is an
+    optional dictionary used to hash each icon file only once per run.
+    """
+    if icon_hashes is None:
+        icon_hashes = {}
+    h = hashlib.sha256()
+    h.update(_file_hash(xmlfile).encode())
+    icons = set()
+    for zone in ElementTree.parse(xmlfile).getroot().iter('zone'):
+        icon = zone.get('icon')
+        if icon and icon != 'null':
+            icons.add(icon)
+    for icon in sorted(icons):
+        path = os.path.abspath(icon)
+        if path not in icon_hashes:
+            icon_hashes[path] = _file_hash(path) if os.path.exists(path) else 'missing'
+        h.update(f"{icon}={icon_hashes[path]}".encode())
+    h.update(json.dumps(settings, sort_keys=True).encode())
+    return h.hexdigest()
+
+def thumbnail_name(xmlfile, size: int) -> str:
+    """
+    Returns the file name of the thumbnail of xmlfile at size pixels wide.
+    """
+    stem = os.path.splitext(os.path.basename(xmlfile))[0]
+    return f"{stem}_{size}.png"
+
+def render_thumbnails(xmlfile, out_dir, sizes, side=40, canvas_width=400,
+                      canvas_height=400, width=3, background='white') -> list:
+    """
+    This function loads one flower and writes a PNG thumbnail for each size
+    (width in pixels) into out_dir. It returns the paths written. It runs in
+    the worker processes of export_catalog, where the decoded icon cache of
+    lib.icons is shared by every flower the worker renders.
+    """
+    hf = process_xml_hex_flower(xmlfile=xmlfile, side=side,
+                                canvas_width=canvas_width,
+                                canvas_height=canvas_height)
+    paths = []
+    for size in sizes:
+        path = os.path.join(out_dir, thumbnail_name(xmlfile, size))
+        export_png(hf, path, width=width, scale=size / hf.canvas_width,
+                   background=background)
+        paths.append(path)
+    return paths
+
+def export_catalog(xml_dir, out_dir, sizes=(64, 128, 256), processes=None,
+                   side=40, canvas_width=400, canvas_height=400, width=3,
+                   background='white', force=False, diagnostic=False) -> dict:
+    """
+    This function renders thumbnails of every flower XML file in xml_dir into
+    out_dir, using a pool of worker processes. A flower is skipped when its
+    XML, its icons, and the render settings are unchanged since the last run
+    and its thumbnails still exist.
+
+    Arguments:
+        xml_dir: str, directory holding the flower XML files
+        out_dir: str, directory for the thumbnails, created if needed
+        sizes: tuple of int, optional, thumbnail widths in pixels
+        processes: int or None, optional, worker processes, None uses every
+            core and 1 renders in this process
+        side, canvas_width, canvas_height: optional, the flower layout, as
+            for process_xml_hex_flower
+        width: int, optional, outline width before scaling
+        background: str or None, optional, background color
+        force: bool, optional, render every flower even if unchanged
+        diagnostic: bool, optional, print progress to stdio
+
+    Returns a dictionary with the lists 'rendered' and 'skipped' of XML
+    files, and 'failed', a dictionary of XML file -> error message.
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    sizes = tuple(int(s) for s in sizes)
+    settings = {'sizes': sizes, 'side': side, 'canvas_width': canvas_width,
+                'canvas_height': canvas_height, 'width': width,
+                'background': background}
+    manifest_path = os.path.join(out_dir, MANIFEST)
+    try:
+        with open(manifest_path) as myfile:
+            manifest = json.load(myfile)
+    except (OSError, ValueError):
+        manifest = {}
+
+    summary = {'rendered': [], 'skipped': [], 'failed': {}}
+    icon_hashes = {}
+    todo = {}
+    for xmlfile in sorted(glob.glob(os.path.join(xml_dir, '*.xml'))):
+        name = os.path.basename(xmlfile)
+        try:
+            key = render_key(xmlfile, settings, icon_hashes)
+        except (OSError, ElementTree.ParseError) as e:
+            summary['failed'][xmlfile] = str(e)
+            continue
+        outputs = [os.path.join(out_dir, thumbnail_name(xmlfile, s)) for s in sizes]
+        if not force and manifest.get(name) == key and all(map(os.path.exists, outputs)):
+            summary['skipped'].append(xmlfile)
+        else:
+            todo[xmlfile] = key
+    if diagnostic:
+        print(f"export_catalog: {len(todo)} to render, {len(summary['skipped'])} unchanged.")
+
+    options = dict(side=side, canvas_width=canvas_width,
+                   canvas_height=canvas_height, width=width,
+                   background=background)
+
+    def done(xmlfile, error=None):
+        name = os.path.basename(xmlfile)
+        if error is None:
+            manifest[name] = todo[xmlfile]
+            summary['rendered'].append(xmlfile)
+        else:
+            manifest.pop(name, None)
+            summary['failed'][xmlfile] = f"{type(error).__name__}: {error}"
+        if diagnostic:
+            print(f"export_catalog: {xmlfile} {'failed' if error else 'rendered'}")
+
+    if processes == 1 or len(todo) <= 1:
+        for xmlfile in todo:
+            try:
+                render_thumbnails(xmlfile, out_dir, sizes, **options)
+                done(xmlfile)
+            except Exception as e:
+                done(xmlfile, e)
+    else:
+        with ProcessPoolExecutor(max_workers=processes) as pool:
+            futures = {pool.submit(render_thumbnails, xmlfile, out_dir, sizes,
+                                   **options): xmlfile for xmlfile in todo}
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                    done(futures[future])
+                except Exception as e:
+                    done(futures[future], e)
+
+    summary['rendered'].sort()
+    tmp = manifest_path + '.tmp'
+    with open(tmp, 'w') as myfile:
+        json.dump(manifest, myfile, indent=1, sort_keys=True)
+    os.replace(tmp, manifest_path)
+    return summary
@@ -1,9 +1,11 @@
-import tkinter as tk
-from tkinter import ttk
-from PIL import ImageTk, Image
-from lib.colors import Colors
-from lib.color_functions import darken_outline
-import os, math, random, csv, copy
+from lib.colors import color_table
+from lib.geometry import flower_geometry, COS60, SIN60
+from lib.dice import Dice, check_outcomes
+import os, csv, copy
+
+# tkinter, PIL, and the canvas renderer are only imported by the methods that
+# draw or display something, so loading and walking Hex Flowers works without
+# them (see cli.py).
 
 class HexFlower():
     """
@@ -19,12 +21,24 @@ class HexFlower():
     Instance Attributes:
         hexes: list, required, a list of 19 Hex objects
         type: str, required, indicates the type of Hex Flower
-        dice: tuple of str, optional, default is ('d6', 'd6')
+        dice: tuple of str or str, optional, default is ('d6', 'd6'), any
+            dice expression such as '2d6+1' or ('d8', 'd8') is accepted
+        dice_set: Dice, the parsed dice with the exact distribution of totals
+        outcomes: dict or None, optional, roll -> edge ('a'-'f' or None) for
+            this Hex Flower, required unless the dice are built-in dice
         side: integer, optional, the length of a side, default 20
         canvas_height: integer, optional, the tk.Canvas height, default=300
         canvas_width: integer, optional, the tk.Canvas width, default=300
+        geometry: FlowerGeometry, the shared unit geometry of the layout
      
+    A HexFlower is pure data. Icons are stored as file paths and only loaded
+    when the flower is drawn, so it can be pickled and sent to worker
+    processes.
+
     Methods:
+        pack: returns the Hex Flower as a compact tuple of plain data
+        unpack: classmethod, builds a HexFlower from the tuple made by pack
+        polygons: returns the corner coordinates of every Hex
         proximity: finds the hex.id for the Hex containing the coordinates
             supplies as a argument, returns hex.id or None if outside the
             HF.
@@ -49,7 +63,7 @@ class HexFlower():
     def __init__(self, hexes, type: str, 
                  dice=('d6', 'd6'), side=20.0, 
                  height=300, width=300,                  
-                 diagnostic=False):
+                 outcomes=None, diagnostic=False):
         self.hexes = []
         for i in range(1, 20):
             for hex in hexes:
@@ -60,17 +74,20 @@ class HexFlower():
                 else:
                     continue
         self.type = type
-        if len(dice) > 3 or len(dice) <= 1 or dice is None:
-            raise ValueError("Improper number of dice specified. Must 1, 2 or 3")
+        if dice is None:
+            raise ValueError("Dice must be specified, for example ('d6', 'd6') or '2d6+1'.")
+        # Any combination of dice and modifiers is allowed. Dice works out the
+        # exact distribution of the totals once, here. The built-in dice
+        # (d6, d8, 2d6, 3d4, and d6 + d8) have built-in outcome tables; any
+        # other dice need an outcome table of their own.
+        self.dice = dice
+        self.dice_set = Dice(dice)
+        if outcomes is None:
+            if BasicWalk.builtin_outcomes(self.dice_set) is None:
+                raise ValueError(f"{dice} are not built-in dice, so an outcome table is required.")
+            self.outcomes = None
         else:
-            # Checking to make sure the dice are specified correctly, They need
-            # span 1-6 (d6), 1-8 (d8), 2-12 (2d6), 3-12 (3d4), or 2-14 (d6 + d8).
-            dice_options = [('d6', None), (None, 'd8'), ('d6','d6'),
-                            ('d4', 'd4', 'd4'), ('d6', 'd8')]
-            if dice not in dice_options:
-                raise ValueError(f"{dice} is not a valid option. Dice must be {dice_options}.")
-            else:
-                self.dice = dice
+            self.outcomes = check_outcomes(self.dice_set, outcomes)
         if isinstance(side, int) or isinstance(side, float):
             self.side = side
         else:
@@ -83,20 +100,13 @@ class HexFlower():
             self.canvas_width = width
         else:
             raise TypeError("Height must be an integer for tk.Canvas objects.")
-        # Building the correct vertices.
-        h = round(self.side * math.sin(math.pi / 3), 2)
-        b = round(self.side * math.cos(math.pi / 3), 2)
-        for i in range(self.hfcols):
-            x = round(((i + 1) * b) + (i * self.side), 2)
-            h_adj = h * (i % 2)
-            stack_height = len(self.hfcolumns[i])
-            for n in range(stack_height):
-                hex_id = self.hfcolumns[i][n] 
-                y = round((h_adj + (n * 2 * h)), 2)          
-                if hex_id is not None:
-                    self.hexes[hex_id - 1].vertex = (x, y)
-                    if diagnostic:
-                        print(f"New Hex is {self.hexes[hex_id - 1]}")
+        # Building the correct vertices. The layout geometry is computed once
+        # and shared by every Hex Flower; only the side length is applied here.
+        self.geometry = flower_geometry(self.hfcolumns)
+        for hex in self.hexes:
+            hex.vertex = self.geometry.vertex(hex.id, self.side)
+            if diagnostic:
+                print(f"New Hex is {hex}")
         if diagnostic:
             print("HexFlower initialized")
             print(self)
@@ -113,43 +123,64 @@ class HexFlower():
         s = s + "canvas_height={}, ".format(self.canvas_height)
         s = s + "canvas_width={})".format(self.canvas_width)
         return s
+
+    def __reduce__(self):
+        # Pickle the Hex Flower as its compact pure-data spec. The vertices
+        # are rebuilt from side when it is unpacked.
+        return (HexFlower.unpack, (self.pack(),))
+
+    def pack(self) -> tuple:
+        """
+        Returns the Hex Flower as a tuple of plain data: its type, dice, side,
+        canvas size, one (type, label, color, icon, effect) tuple per Hex,
+        the adjacency of every Hex packed into bytes (0 is a blocked edge),
+        and the outcome table. Repeated strings are shared so the spec pickles small.
+        """
+        strings = {}
+        def share(v):
+            return v if v is None else strings.setdefault(v, v)
+        zones = tuple(tuple(share(v) for v in (hex.zone.type, hex.zone.label,
+                      hex.zone.color, hex.zone.icon, hex.zone.effect))
+                      for hex in self.hexes)
+        adjacency = bytes(hex.adjacency[k] or 0 for hex in self.hexes
+                          for k in 'abcdef')
+        return (self.type, self.dice, self.side, self.canvas_height,
+                self.canvas_width, zones, adjacency, self.outcomes)
+
+    @classmethod
+    def unpack(cls, spec: tuple):
+        """
+        Builds a HexFlower from the tuple returned by HexFlower.pack.
+        """
+        hftype, dice, side, height, width, zones, adjacency = spec[:7]
+        outcomes = spec[7] if len(spec) > 7 else None
+        hexes = []
+        for i, (type, label, color, icon, effect) in enumerate(zones):
+            edges = adjacency[6 * i: 6 * i + 6]
+            hexes.append(Hex(id=i + 1, vertex=(0, 0), label=label,
+                             adjacency={k: v or None for k, v in zip('abcdef', edges)},
+                             type=type, color=color, icon=icon, effect=effect))
+        return cls(hexes=hexes, type=hftype, dice=dice, side=side,
+                   height=height, width=width, outcomes=outcomes)
     
+    def polygons(self, zoom=1.0, pan=(0.0, 0.0)) -> dict:
+        """
+        This method returns the corner coordinates of every Hex as a
+        dictionary of the form {hex.id: [x1, y1, ..., x6, y6]}, starting at
+        Hex.vertex and going clockwise. zoom and pan are applied on top of
+        the side length. The renderers all draw from this.
+        """
+        return self.geometry.polygons(self.side, zoom, pan)
+
     def proximity(self, point: tuple, diagnostic=False):
         """
         This method determines if a point is contained in any Hex object
         contained in this HexFlower. Returns either None or Hex.id.
         """
-        def prox(point, center):
-            x1, x2 = point
-            y1, y2 = center
-            return math.sqrt( (x2 - x1) ** 2 + (y2 - y1) ** 2 )
-
-        # First we eliminate hexes further out than HF.side since they
-        # cannot contain the point.
-        close_hexes = []
-        for hex in self.hexes:
-            if prox(point, hex.center(self.side)) < self.side:
-                close_hexes.extend(hex)
-                if diagnostic:
-                    print(f"close_hexes: {close_hexes}")
-        if len(close_hexes ) == 0:
-            return None
-        elif len(close_hexes) == 1:
-            return close_hexes[0].id
-        else: # More than one are very close. Point is inside the HF.
-            closest = close_hexes[0]
-            counter = 0
-            for hex in close_hexes:
-                if diagnostic:
-                    print(f"Begin loop: Closest: {closest}, counter: {counter}")
-                if counter == 0: # first cycle
-                    prox_closest = prox(point, hex.center())
-                elif prox(point, hex.center()) < prox_closest:
-                    closest = hex
-                counter += 1
-                if diagnostic:
-                    print(f"End loop: Closest: {closest}, counter: {counter}")
-            return closest.id
+        hex_id = int(self.geometry.hex_at(point, self.side)[0])
+        if diagnostic:
+            print(f"Point {point} is in hex {hex_id or None}")
+        return hex_id or None
 
     def drawHexFlower(self, board, width=3, diagnostic=False):
         """
@@ -159,48 +190,20 @@ class HexFlower():
         and length of a side of each hex are supplied by Hex attributes. width
         has a default, but is optional. diagnostic determines how much text gets
         sent to stdio while it is running.
+
+        Labels and icons are drawn as canvas items rather than widgets. The
+        FlowerRenderer doing the drawing is stored as board.renderer and
+        returned, so a walk can highlight the current Hex without a redraw.
         """
         if diagnostic:
             print(f"drawHexFlower: Arguments received: {locals()}")
             print(f"Hex Flower status: {self}")
-        # Initializing the variables we need.
-        s = self.side
-        b = s * math.cos(math.pi / 3)
-        h = s * math.sin(math.pi / 3)
-        ctr = 0
-        for hex in self.hexes:
-            points = []
-            x_c, y_c = hex.center(side=self.side, diagnostic=diagnostic)
-            x, y = hex.vertex
-            # Add the starting point.
-            points.extend((x,         y))
-            points.extend((x + s,     y))
-            points.extend((x + b + s, y + h))
-            points.extend((x + s,     y + 2 * h))
-            points.extend((x,         y + 2 * h))
-            points.extend((x - b,     y + h))
-            if diagnostic:
-                print(points)
-            if hex.zone.color:
-                outline = darken_outline(hex.zone.color)
-                fill = hex.zone.color
-            else:
-                outline = "black"
-                fill = None
-            board.canvas.create_polygon(points,
-                outline=outline,fill=fill, width=width)
-            if diagnostic:
-                print(f"Determining if icon {hex.zone.icon} exists.")
-            if hex.zone.icon:
-                board.canvas.labels.append(tk.Label(board.canvas,
-                                           image=hex.zone.icon))
-            else:
-                board.canvas.labels.append(tk.Label(board.canvas,
-                                                    text=hex.zone.label))
-            board.canvas.labels[ctr].place(x=x_c, y=y_c, anchor=tk.CENTER)
-            if diagnostic:
-                print(f"Counter {ctr}. Processing label {board.canvas.labels[ctr]}")
-            ctr += 1
+        from lib.renderer import FlowerRenderer
+        renderer = FlowerRenderer(board.canvas, self, width=width,
+                                  diagnostic=diagnostic)
+        renderer.draw(diagnostic=diagnostic)
+        board.renderer = renderer
+        return renderer
 
 class Zone():
     """
@@ -210,7 +213,7 @@ class Zone():
         label: str, required, no default, but it is often str(Hex.id)
         icon: str, optional, str is the relative path and filename of the icon
                to be displayed in this Hex when the Hex Flower is drawn,
-               default is None
+               default is None. The image is loaded when it is drawn.
         effect: str, optional, description of the severity of the zone in 
                 this Hex will appear, default is None
     If the icon is None, the label will be displayed instead of an icon.
@@ -225,20 +228,23 @@ class Zone():
             self.color='black'
         else:
             if isinstance(color, str):
-                # Create the Colors conversion object. Colors automatically
+                # Use the shared Colors conversion table. Colors automatically
                 # checks colors to see if it should have a '1' at the end of the
                 # string and to see if it exists in the database. It will
                 # raist a ValueError if it isn't. We won't trap that error.
                 # However, making the forward and reverse conversion will take
                 # care of instances of a color having only 'name1', ..., 'nameN'
                 # without a 'name' in the listings.
-                x = Colors()
+                x = color_table()
                 ck_color = x.text_to_color(color)
                 self.color = x.color_to_text(ck_color)
             else:
                 raise ValueError("color must be a string for a valid color for Python or tkinter")
+        # Only the path of the icon is kept. The image itself belongs to the
+        # presentation and is loaded from the shared icon cache when the Hex
+        # Flower is drawn, so a Zone never needs a Tk root and can be pickled.
         if icon:
-            self.icon = ImageTk.PhotoImage(Image.open(icon).resize((30,30)))
+            self.icon = str(icon)
         else:
             self.icon = None
         self.effect = effect
@@ -332,8 +338,8 @@ class Hex():
         This method returns a tuple (x,y) coordinates of the center of this
         Hex object. It requires a value of side, but allows for a default of 20.
         """
-        c_x = round(side * math.cos(math.pi / 3) + self.vertex[0])
-        c_y = round(side * math.sin(math.pi / 3) + self.vertex[1])
+        c_x = round(side * COS60 + self.vertex[0])
+        c_y = round(side * SIN60 + self.vertex[1])
         if diagnostic:
             print(f"Center of hex is: ({c_x},{c_y})")
         return (c_x, c_y)
@@ -347,7 +353,8 @@ class BasicWalk():
 
     It will make a move every 3 seconds until the walk ends. This is not a the
     class for walks that have to find an ending hex. Hitting the stop walk button
-    will also stop the walk.
+    will also stop the walk. The timing is handled by lib.scheduler.WalkScheduler,
+    which calls step and showMove.
 
     Note: Self-terminating walks are not basic walks. Technically, Basic Walks
     are infinite walks that we stop after several iterations.
@@ -359,7 +366,9 @@ class BasicWalk():
         standardbias: dict, specific moves for 2d6 bias (most moves are b-e).
         southbias: dict, specific moves for 3d4 bias (most move are c, d, or e).
         special: dict, specific moves for d6+d8 (most moves are stay or c, d, e).
-        correct_dice: list, tuples of dice combinations usable for this Walk
+        correct_dice: list, tuples of dice combinations with built-in tables
+        builtin_tables: dict, dice expression -> name of its built-in table.
+            Hex Flowers with other dice bring their own outcome table.
         correct_types: list, the types of Hex Flowers that this walk will accept
     
     Instance Attributes:
@@ -371,6 +380,11 @@ class BasicWalk():
         outcomes: dict, picked from the Class Attributes based on hf.dice
     
     Methods:
+        builtin_outcomes: classmethod, returns the built-in table or None
+        outcomes_for: classmethod, returns the outcome dict for a dice tuple
+        flower_outcomes: classmethod, returns the outcome dict of a Hex Flower
+        step: executes a move without displaying it, returns the move
+        showMove: writes one move to the TopLevel window and the output file
         completeMove: executes a move and updates the TopLevel window supplied
             as an argument.
     """
@@ -385,10 +399,14 @@ class BasicWalk():
         3: 'b', 4: 'b',  5: 'c',  6: 'c', 7: 'd',
         8: 'e', 9: 'e', 10: 'f', 11: 'f', 12: 'a'}
     special = {
-        2: 'a',   3: 'b',  4: 'b',  5: 'c',  6: 'c', 7: 'd', 8: '8',
+        2: 'a',   3: 'b',  4: 'b',  5: 'c',  6: 'c', 7: 'd', 8: 'd',
         9: None, 10: 'e', 11: 'e', 12: 'f', 13: 'f', 14: 'a'}
     correct_dice = [('d6', None), (None, 'd8'), ('d6','d6'),
                     ('d4', 'd4', 'd4'), ('d6', 'd8')]
+    # The built-in tables by normalized dice expression (see lib.dice.Dice).
+    builtin_tables = {'d6': 'uniformbias', 'd8': 'nuniformbias',
+                      '2d6': 'standardbias', '3d4': 'southbias',
+                      'd6+d8': 'special'}
     correct_types = ['normal', 'basic']
     
     def __init__(self, hf, start: int, moves: int, diagnostic=False):
@@ -407,10 +425,7 @@ class BasicWalk():
             raise ValueError("Start must a valid hex id (integer [1, 19])")
         if not isinstance(moves, int):
             raise ValueError("The nubmer of moves must be an integer")
-        if hf.dice in self.correct_dice:
-            self.outcomes = self._init_dice(hf)
-        else:
-            raise ValueError(f"Dice of type {hf.dice} are not valid for Basic Walks")
+        self.outcomes = self._init_dice(hf)
         if hf.type not in self.correct_types:
             raise ValueError(f"Basic walks are not valid for {hf.type} of hex flower")
         # Setting attributes for this basic walk.
@@ -428,20 +443,41 @@ class BasicWalk():
     def _init_dice(self, hf) -> dict:
         """
         This internal method returns the dictionary corresponding to the dice
-        specified by the HF.dice attribute.
+        specified by the HF.dice attribute, or the Hex Flower's own outcome
+        table if it has one.
         """
-        if hf.dice == ('d6', None):
-            return self.uniformbias
-        elif hf.dice == (None, 'd8'):
-            return self.nuniformbias
-        elif hf.dice == ('d6','d6'):
-            return self.standardbias
-        elif hf.dice == ('d4', 'd4', 'd4'):
-            return self.southbias
-        elif hf.dice == ('d6', 'd8'):
-            return self.special
-        else:
-            raise ValueError(f"{hf.dice} is not a valid type for Basic Walks.")
+        return self.flower_outcomes(hf)
+
+    @classmethod
+    def builtin_outcomes(cls, dice):
+        """
+        This method returns the built-in outcome dictionary for the dice, or
+        None if there is no built-in table for them.
+        """
+        name = cls.builtin_tables.get(Dice(dice).expression)
+        return None if name is None else getattr(cls, name)
+
+    @classmethod
+    def outcomes_for(cls, dice) -> dict:
+        """
+        This method returns the built-in outcome dictionary (roll -> edge)
+        used for a dice combination. Raises a ValueError for dice without one.
+        """
+        outcomes = cls.builtin_outcomes(dice)
+        if outcomes is None:
+            raise ValueError(f"{dice} is not a valid type for Basic Walks.")
+        return outcomes
+
+    @classmethod
+    def flower_outcomes(cls, hf) -> dict:
+        """
+        This method returns the outcome dictionary a Hex Flower is walked
+        with: its own table if it declares one, otherwise the built-in table
+        for its dice. The analysis modules use it too.
+        """
+        if getattr(hf, 'outcomes', None):
+            return hf.outcomes
+        return cls.outcomes_for(hf.dice)
          
     def __repr__(self) -> str:
         return f"BasicWalk(hf={self.hf}, start={self.moves[0]}, moves={self.last_move})"
@@ -453,38 +489,24 @@ class BasicWalk():
         s = s + "Moves thus far: {}".format(self.moves)
         return s
 
-    def completeMove(self, window: tk.Tk, 
-                     diagnostic=False,
-                     output_file="./output/basic_walk_output.csv") -> int:
+    def step(self, diagnostic=False):
         """
-        This method performs a move and updates that WalkOutputWindow with the
-        outcome. It requires a tkinter.Toplevel to write the data to.
+        This method rolls the dice and makes the next move of the walk without
+        displaying or writing it anywhere. It returns the new move as a tuple
+        (hex_id, zone.type, zone.effect), or None if the walk is already
+        complete. It does not touch tkinter, so it can run in a background
+        thread.
         """
+        if self.current_move >= self.last_move:
+            if diagnostic:
+                print("Moves are already complete")
+            return None
         self.current_move += 1
         if diagnostic:
             print(f"Current move is #{self.current_move} from hex {self.current_hex}.")
-        if self.current_move > self.last_move:
-            print("Moves are already complete")
-            return
-        if len(self.moves) == 1:
-            msg = "Start: Hex: {}, Zone: {}, Effect: {}".format(
-                self.moves[0][0], self.moves[0][1], self.moves[0][2])
-            with open(output_file, 'a+', newline='') as myfile:
-                writer = csv.writer(myfile, delimiter=",")
-                writer.writerow(self.moves[-1])
-                if diagnostic:
-                    print(f"Start written to {output_file}")
-            label = tk.Label(window.frame, text=msg)
-            label.grid(row=0, column=0, sticky=tk.W)
-        
-        roll = 0
-        for i in range(len(self.hf.dice)):
-            if self.hf.dice[i] == 'd4':
-                roll += random.randint(1,4)
-            elif self.hf.dice[i] == 'd6':
-                roll += random.randint(1,6)
-            elif self.hf.dice[i] == 'd8':
-                roll += random.randint(1,8)
+        # The distribution of the dice totals was worked out when the Hex
+        # Flower was made, so any dice roll with one random number.
+        roll = self.hf.dice_set.roll()
         if diagnostic:
             print(f"Rolled {roll} using {self.hf.dice}.")
             
@@ -510,19 +532,27 @@ class BasicWalk():
             if self.outcomes[roll] is not None:
                 print(f"Roll produced {self.outcomes[roll]} result")
             print(f"Move is to ({new_hex}, {zone}, {effect})")
-            
-        # Now, we write the move to the TopLevel window.
-        i = self.current_move
-        msg = "Move #{}: Hex: {}, Zone: {}, Effect: {}".format(
-            i, self.moves[i][0], self.moves[i][1], self.moves[i][2])
-        # The index has to the start of an empty line in the text widget.
-        label = tk.Label(window.frame, text=msg)
-        if self.current_move > 50:
-            label.grid(row=i - 50, column=2, sticky=tk.W)
-        elif 50 >= self.current_move > 25:
-            label.grid(row=i - 25, column=1, sticky=tk.W)
-        else:
-            label.grid(row=i, column=0, sticky=tk.W)
+        return self.moves[-1]
+
+    def showMove(self, window: 'tk.Tk', i: int,
+                 diagnostic=False,
+                 output_file="./output/basic_walk_output.csv"):
+        """
+        This method writes move number i of the walk to the window and to the
+        CSV output file. The start of the walk is written along with move 1.
+        The window needs a results attribute, a WalkResultList, like
+        ControlPanel has. It must be called from the thread running tkinter.
+        """
+        if i == 1:
+            with open(output_file, 'a+', newline='') as myfile:
+                writer = csv.writer(myfile, delimiter=",")
+                writer.writerow(self.moves[0])
+                if diagnostic:
+                    print(f"Start written to {output_file}")
+            window.results.append(0, self.moves[0])
+
+        # Now, we add the move to the result list of the window.
+        window.results.append(i, self.moves[i])
         if diagnostic:
             print(f"Move in moves is {self.moves[i]}")
         
@@ -530,7 +560,21 @@ class BasicWalk():
         # spreadsheet program, like Excel.
         with open(output_file, 'a+', newline='') as myfile:
             writer = csv.writer(myfile, delimiter=",")
-            writer.writerow(self.moves[-1])
+            writer.writerow(self.moves[i])
             if diagnostic:
                 print(f"Move written to {output_file}")
-        return self.moves[-1][0]
+
+    def completeMove(self, window: 'tk.Tk', 
+                     diagnostic=False,
+                     output_file="./output/basic_walk_output.csv") -> int:
+        """
+        This method performs a move and updates that WalkOutputWindow with the
+        outcome. It requires a tkinter.Toplevel to write the data to.
+        """
+        move = self.step(diagnostic=diagnostic)
+        if move is None:
+            print("Moves are already complete")
+            return
+        self.showMove(window, self.current_move, diagnostic=diagnostic,
+                      output_file=output_file)
+        return move[0]
@@ -1,4 +1,60 @@
-from lib.colors import Color, Colors
+from collections import OrderedDict
+from threading import Lock
+from lib.colors import Color, color_table
+
+# darken_outline and lib.palette share this memo of finished results. It is
+# keyed by (fill, darken, fill_type, result) and holds at most
+# OUTLINE_MEMO_SIZE entries, dropping the least recently used one first.
+OUTLINE_MEMO_SIZE = 1024
+_outline_memo = OrderedDict()
+_outline_memo_lock = Lock()
+
+def memo_get(key):
+    """
+    Returns the memoized darken_outline result for key, or None if it has not
+    been computed yet.
+    """
+    with _outline_memo_lock:
+        try:
+            _outline_memo.move_to_end(key)
+        except KeyError:
+            return None
+        return _outline_memo[key]
+
+def memo_put(key, value):
+    """
+    Stores a darken_outline result under key, evicting the oldest entry when
+    the memo is full.
+    """
+    with _outline_memo_lock:
+        _outline_memo[key] = value
+        _outline_memo.move_to_end(key)
+        if len(_outline_memo) > OUTLINE_MEMO_SIZE:
+            _outline_memo.popitem(last=False)
+
+def memo_clear():
+    """
+    Empties the darken_outline memo.
+    """
+    with _outline_memo_lock:
+        _outline_memo.clear()
+
+def check_outline_args(darken, fill_type, result) -> int:
+    """
+    Validates the darken_outline arguments other than fill and returns darken
+    as an integer. Raises a ValueError for any invalid argument.
+    """
+    if not isinstance(fill_type, str):
+        raise ValueError(f"fill_type must be type str")
+    elif fill_type not in ('hex', 'rgb', 'str'):
+        raise ValueError(f"fill_type must be 'hex', 'rgb', or 'str'")
+    try:
+        darken = int(darken)
+    except ValueError:
+        raise ValueError(f"darken must be an integer. {darken} cannot be converted to integer.")
+    if result not in ('hex', 'rgb', 'str'):
+        raise ValueError(f"result must be type str matching 'hex', 'rgb',or'str'")
+    return darken
 
 def darken_outline(fill, darken = 40, fill_type='str', result='hex'):
     """
@@ -7,11 +63,15 @@ def darken_outline(fill, darken = 40, fill_type='str', result='hex'):
     reduces all of the RGB indicators by the amount of integer darken. It uses
     The str result to determine what type value to return: 'hex' for hex color
     representation, 'rgb' for namedtuple, and 'str' for string represenation.
-    
+
     Warning: Only a very small number of colors in the RGB framework have actual
     names. This may result is a ValueError. Also, color must be a valid str
     color value or a ValueError will be raised. This check is performed against
-    CSS3 names.
+    CSS3 names. Use lib.palette.nearest_color_name with result='rgb' to get
+    the closest named color instead.
+
+    Results are memoized, so repeated calls with the same arguments do no
+    color work.
 
     Arguments:
         fill: Color hex or str, determined by fill_type
@@ -20,19 +80,17 @@ def darken_outline(fill, darken = 40, fill_type='str', result='hex'):
             'str'
         result: str, valid options: 'hex', 'rgb', 'str', optional, default 'hex'
     """
+    if isinstance(fill, list):
+        fill = tuple(fill)
+    key = (fill, darken, fill_type, result)
+    memoized = memo_get(key)
+    if memoized is not None:
+        return memoized
+
     # Check arguments
-    x = Colors()
-    if not isinstance(fill_type, str):
-        raise ValueError(f"fill_type must be type str")
-    elif fill_type not in ('hex', 'rgb', 'str'):
-        raise ValueError(f"fill_type must be 'hex', 'rgb', or 'str'")
-    try:
-        darken = int(darken)
-    except ValueError:
-        raise ValueError(f"darken must be an integer. {darken} cannot be converted to integer.")
-    if result not in ('hex', 'rgb', 'str'):
-        raise ValueError(f"result must be type str matching 'hex', 'rgb',or'str'")
-    
+    x = color_table()
+    darken = check_outline_args(darken, fill_type, result)
+
     # Colors.text_to_hex checks to make sure the text in color matches a value
     # for an actual HTML or Tkinter named color.
     if fill_type == 'str':
@@ -52,22 +110,16 @@ def darken_outline(fill, darken = 40, fill_type='str', result='hex'):
         new_vals.append(new_val)
     # Now, to convert the result into an rbg namedtuple
     result_rgb = Color(red=new_vals[0], green=new_vals[1], blue=new_vals[2])
-    # We need a flag for a color with no string name assigned to it.
-    bad_string = False
-    try:
-        result_str = x.color_to_text(result_rgb)
-    except ValueError:
-        bad_string = True
-    result_hex = x.color_to_hex(result_rgb)
-    # The bad_string flag is only acted on if the function has result='str'
-    # as an argument. That is why this error is trapped her.
     if result == 'hex':
-        return result_hex
+        value = x.color_to_hex(result_rgb)
     elif result == 'rgb':
-        return result_rgb
+        value = result_rgb
     else:
-        # Result is a string
-        if bad_string:
+        # Result is a string. Only a few colors have one, so the reverse lookup
+        # is only done when it is asked for.
+        try:
+            value = x.color_to_text(result_rgb)
+        except ValueError:
             raise ValueError(f"{result_rgb} does not have a string representation.")
-        else:
-            return result_str
\ No newline at end of file
+    memo_put(key, value)
+    return value
@@ -1,1124 +1,196 @@
 from collections import namedtuple, OrderedDict
+from functools import lru_cache
 
 Color = namedtuple('RGB', ['red', 'green', 'blue'])        
-        
-class Colors(OrderedDict):
+
+# Every named color as name:rrggbb in the order Colors lists them. The table is
+# only decoded the first time a color is needed, so importing this module stays
+# cheap.
+_COLOR_TABLE = """
+aliceblue:f0f8ff antiquewhite:faebd7 antiquewhite1:ffefdb
+antiquewhite2:eedfcc antiquewhite3:cdc0b0 antiquewhite4:8b8378 aqua:00ffff
+aquamarine1:7fffd4 aquamarine2:76eec6 aquamarine3:66cdaa aquamarine4:458b74
+azure1:f0ffff azure2:e0eeee azure3:c1cdcd azure4:838b8b banana:e3cf57
+beige:f5f5dc bisque1:ffe4c4 bisque2:eed5b7 bisque3:cdb79e bisque4:8b7d6b
+black:000000 blanchedalmond:ffebcd blue:0000ff blue2:0000ee blue3:0000cd
+blue4:00008b blueviolet:8a2be2 brick:9c661f brown:a52a2a brown1:ff4040
+brown2:ee3b3b brown3:cd3333 brown4:8b2323 burlywood:deb887 burlywood1:ffd39b
+burlywood2:eec591 burlywood3:cdaa7d burlywood4:8b7355 burntsienna:8a360f
+burntumber:8a3324 cadetblue:5f9ea0 cadetblue1:98f5ff cadetblue2:8ee5ee
+cadetblue3:7ac5cd cadetblue4:53868b cadmiumorange:ff6103
+cadmiumyellow:ff9912 carrot:ed9121 chartreuse1:7fff00 chartreuse2:76ee00
+chartreuse3:66cd00 chartreuse4:458b00 chocolate:d2691e chocolate1:ff7f24
+chocolate2:ee7621 chocolate3:cd661d chocolate4:8b4513 cobalt:3d59ab
+cobaltgreen:3d9140 coldgrey:808a87 coral:ff7f50 coral1:ff7256 coral2:ee6a50
+coral3:cd5b45 coral4:8b3e2f cornflowerblue:6495ed cornsilk1:fff8dc
+cornsilk2:eee8cd cornsilk3:cdc8b1 cornsilk4:8b8878 crimson:dc143c
+cyan2:00eeee cyan3:00cdcd cyan4:008b8b darkgoldenrod:b8860b
+darkgoldenrod1:ffb90f darkgoldenrod2:eead0e darkgoldenrod3:cd950c
+darkgoldenrod4:8b6508 darkgray:a9a9a9 darkgreen:006400 darkkhaki:bdb76b
+darkolivegreen:556b2f darkolivegreen1:caff70 darkolivegreen2:bcee68
+darkolivegreen3:a2cd5a darkolivegreen4:6e8b3d darkorange:ff8c00
+darkorange1:ff7f00 darkorange2:ee7600 darkorange3:cd6600 darkorange4:8b4500
+darkorchid:9932cc darkorchid1:bf3eff darkorchid2:b23aee darkorchid3:9a32cd
+darkorchid4:68228b darksalmon:e9967a darkseagreen:8fbc8f
+darkseagreen1:c1ffc1 darkseagreen2:b4eeb4 darkseagreen3:9bcd9b
+darkseagreen4:698b69 darkslateblue:483d8b darkslategray:2f4f4f
+darkslategray1:97ffff darkslategray2:8deeee darkslategray3:79cdcd
+darkslategray4:528b8b darkturquoise:00ced1 darkviolet:9400d3
+deeppink1:ff1493 deeppink2:ee1289 deeppink3:cd1076 deeppink4:8b0a50
+deepskyblue1:00bfff deepskyblue2:00b2ee deepskyblue3:009acd
+deepskyblue4:00688b dimgray:696969 dodgerblue1:1e90ff dodgerblue2:1c86ee
+dodgerblue3:1874cd dodgerblue4:104e8b eggshell:fce6c9 emeraldgreen:00c957
+firebrick:b22222 firebrick1:ff3030 firebrick2:ee2c2c firebrick3:cd2626
+firebrick4:8b1a1a flesh:ff7d40 floralwhite:fffaf0 forestgreen:228b22
+gainsboro:dcdcdc ghostwhite:f8f8ff gold1:ffd700 gold2:eec900 gold3:cdad00
+gold4:8b7500 goldenrod:daa520 goldenrod1:ffc125 goldenrod2:eeb422
+goldenrod3:cd9b1d goldenrod4:8b6914 gray:808080 gray1:030303 gray10:1a1a1a
+gray11:1c1c1c gray12:1f1f1f gray13:212121 gray14:242424 gray15:262626
+gray16:292929 gray17:2b2b2b gray18:2e2e2e gray19:303030 gray2:050505
+gray20:333333 gray21:363636 gray22:383838 gray23:3b3b3b gray24:3d3d3d
+gray25:404040 gray26:424242 gray27:454545 gray28:474747 gray29:4a4a4a
+gray3:080808 gray30:4d4d4d gray31:4f4f4f gray32:525252 gray33:545454
+gray34:575757 gray35:595959 gray36:5c5c5c gray37:5e5e5e gray38:616161
+gray39:636363 gray4:0a0a0a gray40:666666 gray42:6b6b6b gray43:6e6e6e
+gray44:707070 gray45:737373 gray46:757575 gray47:787878 gray48:7a7a7a
+gray49:7d7d7d gray5:0d0d0d gray50:7f7f7f gray51:828282 gray52:858585
+gray53:878787 gray54:8a8a8a gray55:8c8c8c gray56:8f8f8f gray57:919191
+gray58:949494 gray59:969696 gray6:0f0f0f gray60:999999 gray61:9c9c9c
+gray62:9e9e9e gray63:a1a1a1 gray64:a3a3a3 gray65:a6a6a6 gray66:a8a8a8
+gray67:ababab gray68:adadad gray69:b0b0b0 gray7:121212 gray70:b3b3b3
+gray71:b5b5b5 gray72:b8b8b8 gray73:bababa gray74:bdbdbd gray75:bfbfbf
+gray76:c2c2c2 gray77:c4c4c4 gray78:c7c7c7 gray79:c9c9c9 gray8:141414
+gray80:cccccc gray81:cfcfcf gray82:d1d1d1 gray83:d4d4d4 gray84:d6d6d6
+gray85:d9d9d9 gray86:dbdbdb gray87:dedede gray88:e0e0e0 gray89:e3e3e3
+gray9:171717 gray90:e5e5e5 gray91:e8e8e8 gray92:ebebeb gray93:ededed
+gray94:f0f0f0 gray95:f2f2f2 gray97:f7f7f7 gray98:fafafa gray99:fcfcfc
+green:008000 green1:00ff00 green2:00ee00 green3:00cd00 green4:008b00
+greenyellow:adff2f honeydew1:f0fff0 honeydew2:e0eee0 honeydew3:c1cdc1
+honeydew4:838b83 hotpink:ff69b4 hotpink1:ff6eb4 hotpink2:ee6aa7
+hotpink3:cd6090 hotpink4:8b3a62 indianred:cd5c5c indianred1:ff6a6a
+indianred2:ee6363 indianred3:cd5555 indianred4:8b3a3a indigo:4b0082
+ivory1:fffff0 ivory2:eeeee0 ivory3:cdcdc1 ivory4:8b8b83 ivoryblack:292421
+khaki:f0e68c khaki1:fff68f khaki2:eee685 khaki3:cdc673 khaki4:8b864e
+lavender:e6e6fa lavenderblush1:fff0f5 lavenderblush2:eee0e5
+lavenderblush3:cdc1c5 lavenderblush4:8b8386 lawngreen:7cfc00
+lemonchiffon1:fffacd lemonchiffon2:eee9bf lemonchiffon3:cdc9a5
+lemonchiffon4:8b8970 lightblue:add8e6 lightblue1:bfefff lightblue2:b2dfee
+lightblue3:9ac0cd lightblue4:68838b lightcoral:f08080 lightcyan1:e0ffff
+lightcyan2:d1eeee lightcyan3:b4cdcd lightcyan4:7a8b8b lightgoldenrod1:ffec8b
+lightgoldenrod2:eedc82 lightgoldenrod3:cdbe70 lightgoldenrod4:8b814c
+lightgoldenrodyellow:fafad2 lightgrey:d3d3d3 lightpink:ffb6c1
+lightpink1:ffaeb9 lightpink2:eea2ad lightpink3:cd8c95 lightpink4:8b5f65
+lightsalmon1:ffa07a lightsalmon2:ee9572 lightsalmon3:cd8162
+lightsalmon4:8b5742 lightseagreen:20b2aa lightskyblue:87cefa
+lightskyblue1:b0e2ff lightskyblue2:a4d3ee lightskyblue3:8db6cd
+lightskyblue4:607b8b lightslateblue:8470ff lightslategray:778899
+lightsteelblue:b0c4de lightsteelblue1:cae1ff lightsteelblue2:bcd2ee
+lightsteelblue3:a2b5cd lightsteelblue4:6e7b8b lightyellow1:ffffe0
+lightyellow2:eeeed1 lightyellow3:cdcdb4 lightyellow4:8b8b7a limegreen:32cd32
+linen:faf0e6 magenta:ff00ff magenta2:ee00ee magenta3:cd00cd magenta4:8b008b
+manganeseblue:03a89e maroon:800000 maroon1:ff34b3 maroon2:ee30a7
+maroon3:cd2990 maroon4:8b1c62 mediumorchid:ba55d3 mediumorchid1:e066ff
+mediumorchid2:d15fee mediumorchid3:b452cd mediumorchid4:7a378b
+mediumpurple:9370db mediumpurple1:ab82ff mediumpurple2:9f79ee
+mediumpurple3:8968cd mediumpurple4:5d478b mediumseagreen:3cb371
+mediumslateblue:7b68ee mediumspringgreen:00fa9a mediumturquoise:48d1cc
+mediumvioletred:c71585 melon:e3a869 midnightblue:191970 mint:bdfcc9
+mintcream:f5fffa mistyrose1:ffe4e1 mistyrose2:eed5d2 mistyrose3:cdb7b5
+mistyrose4:8b7d7b moccasin:ffe4b5 navajowhite1:ffdead navajowhite2:eecfa1
+navajowhite3:cdb38b navajowhite4:8b795e navy:000080 oldlace:fdf5e6
+olive:808000 olivedrab:6b8e23 olivedrab1:c0ff3e olivedrab2:b3ee3a
+olivedrab3:9acd32 olivedrab4:698b22 orange:ff8000 orange1:ffa500
+orange2:ee9a00 orange3:cd8500 orange4:8b5a00 orangered1:ff4500
+orangered2:ee4000 orangered3:cd3700 orangered4:8b2500 orchid:da70d6
+orchid1:ff83fa orchid2:ee7ae9 orchid3:cd69c9 orchid4:8b4789
+palegoldenrod:eee8aa palegreen:98fb98 palegreen1:9aff9a palegreen2:90ee90
+palegreen3:7ccd7c palegreen4:548b54 paleturquoise1:bbffff
+paleturquoise2:aeeeee paleturquoise3:96cdcd paleturquoise4:668b8b
+palevioletred:db7093 palevioletred1:ff82ab palevioletred2:ee799f
+palevioletred3:cd6889 palevioletred4:8b475d papayawhip:ffefd5
+peachpuff1:ffdab9 peachpuff2:eecbad peachpuff3:cdaf95 peachpuff4:8b7765
+peacock:33a1c9 pink:ffc0cb pink1:ffb5c5 pink2:eea9b8 pink3:cd919e
+pink4:8b636c plum:dda0dd plum1:ffbbff plum2:eeaeee plum3:cd96cd plum4:8b668b
+powderblue:b0e0e6 purple:800080 purple1:9b30ff purple2:912cee purple3:7d26cd
+purple4:551a8b raspberry:872657 rawsienna:c76114 red1:ff0000 red2:ee0000
+red3:cd0000 red4:8b0000 rosybrown:bc8f8f rosybrown1:ffc1c1 rosybrown2:eeb4b4
+rosybrown3:cd9b9b rosybrown4:8b6969 royalblue:4169e1 royalblue1:4876ff
+royalblue2:436eee royalblue3:3a5fcd royalblue4:27408b salmon:fa8072
+salmon1:ff8c69 salmon2:ee8262 salmon3:cd7054 salmon4:8b4c39
+sandybrown:f4a460 sapgreen:308014 seagreen1:54ff9f seagreen2:4eee94
+seagreen3:43cd80 seagreen4:2e8b57 seashell1:fff5ee seashell2:eee5de
+seashell3:cdc5bf seashell4:8b8682 sepia:5e2612 sgibeet:8e388e
+sgibrightgray:c5c1aa sgichartreuse:71c671 sgidarkgray:555555
+sgigray12:1e1e1e sgigray16:282828 sgigray32:515151 sgigray36:5b5b5b
+sgigray52:848484 sgigray56:8e8e8e sgigray72:b7b7b7 sgigray76:c1c1c1
+sgigray92:eaeaea sgigray96:f4f4f4 sgilightblue:7d9ec0 sgilightgray:aaaaaa
+sgiolivedrab:8e8e38 sgisalmon:c67171 sgislateblue:7171c6 sgiteal:388e8e
+sienna:a0522d sienna1:ff8247 sienna2:ee7942 sienna3:cd6839 sienna4:8b4726
+silver:c0c0c0 skyblue:87ceeb skyblue1:87ceff skyblue2:7ec0ee skyblue3:6ca6cd
+skyblue4:4a708b slateblue:6a5acd slateblue1:836fff slateblue2:7a67ee
+slateblue3:6959cd slateblue4:473c8b slategray:708090 slategray1:c6e2ff
+slategray2:b9d3ee slategray3:9fb6cd slategray4:6c7b8b snow1:fffafa
+snow2:eee9e9 snow3:cdc9c9 snow4:8b8989 springgreen:00ff7f
+springgreen1:00ee76 springgreen2:00cd66 springgreen3:008b45 steelblue:4682b4
+steelblue1:63b8ff steelblue2:5cacee steelblue3:4f94cd steelblue4:36648b
+tan:d2b48c tan1:ffa54f tan2:ee9a49 tan3:cd853f tan4:8b5a2b teal:008080
+thistle:d8bfd8 thistle1:ffe1ff thistle2:eed2ee thistle3:cdb5cd
+thistle4:8b7b8b tomato1:ff6347 tomato2:ee5c42 tomato3:cd4f39 tomato4:8b3626
+turquoise:40e0d0 turquoise1:00f5ff turquoise2:00e5ee turquoise3:00c5cd
+turquoise4:00868b turquoiseblue:00c78c violet:ee82ee violetred:d02090
+violetred1:ff3e96 violetred2:ee3a8c violetred3:cd3278 violetred4:8b2252
+warmgrey:808069 wheat:f5deb3 wheat1:ffe7ba wheat2:eed8ae wheat3:cdba96
+wheat4:8b7e66 white:ffffff whitesmoke:f5f5f5 yellow1:ffff00 yellow2:eeee00
+yellow3:cdcd00 yellow4:8b8b00
+"""
+
+@lru_cache(maxsize=None)
+def _named_colors() -> tuple:
+    """
+    Decodes _COLOR_TABLE into a tuple of (name, Color) pairs. This only runs
+    once per process.
+    """
+    pairs = []
+    for entry in _COLOR_TABLE.split():
+        name, value = entry.split(':')
+        pairs.append((name, Color._make(bytes.fromhex(value))))
+    return tuple(pairs)
+
+@lru_cache(maxsize=None)
+def _constants() -> dict:
+    """
+    Returns the class constants of Colors (ALICEBLUE, etc.) as a dictionary.
+    """
+    return {name.upper(): color for name, color in _named_colors()}
+
+class _ColorsType(type):
+    """
+    Metaclass that serves the upper case class constants of Colors, such as
+    Colors.ALICEBLUE, from the decoded color table.
+    """
+    def __getattr__(cls, name):
+        try:
+            return _constants()[name]
+        except KeyError:
+            raise AttributeError(f"type object '{cls.__name__}' has no attribute '{name}'")
+
+class Colors(OrderedDict, metaclass=_ColorsType):
     """
     Builds a dictionary of every color available, using class Color. Includes 
-    methods for converting colors to hex, str, or RBG format.
+    methods for converting colors to hex, str, or RBG format. The upper case
+    class constants (Colors.ALICEBLUE, etc.) are still available.
 
     Thanks to Nat Dunn of Webucator for collection all of these names and
     color values.
     """
-    # Class contants
-    ALICEBLUE = Color(240, 248, 255)
-    ANTIQUEWHITE = Color(250, 235, 215)
-    ANTIQUEWHITE1 = Color(255, 239, 219)
-    ANTIQUEWHITE2 = Color(238, 223, 204)
-    ANTIQUEWHITE3 = Color(205, 192, 176)
-    ANTIQUEWHITE4 = Color(139, 131, 120)
-    AQUA = Color(0, 255, 255)
-    AQUAMARINE1 = Color(127, 255, 212)
-    AQUAMARINE2 = Color(118, 238, 198)
-    AQUAMARINE3 = Color(102, 205, 170)
-    AQUAMARINE4 = Color(69, 139, 116)
-    AZURE1 = Color(240, 255, 255)
-    AZURE2 = Color(224, 238, 238)
-    AZURE3 = Color(193, 205, 205)
-    AZURE4 = Color(131, 139, 139)
-    BANANA = Color(227, 207, 87)
-    BEIGE = Color(245, 245, 220)
-    BISQUE1 = Color(255, 228, 196)
-    BISQUE2 = Color(238, 213, 183)
-    BISQUE3 = Color(205, 183, 158)
-    BISQUE4 = Color(139, 125, 107)
-    BLACK = Color(0, 0, 0)
-    BLANCHEDALMOND = Color(255, 235, 205)
-    BLUE = Color(0, 0, 255)
-    BLUE2 = Color(0, 0, 238)
-    BLUE3 = Color(0, 0, 205)
-    BLUE4 = Color(0, 0, 139)
-    BLUEVIOLET = Color(138, 43, 226)
-    BRICK = Color(156, 102, 31)
-    BROWN = Color(165, 42, 42)
-    BROWN1 = Color(255, 64, 64)
-    BROWN2 = Color(238, 59, 59)
-    BROWN3 = Color(205, 51, 51)
-    BROWN4 = Color(139, 35, 35)
-    BURLYWOOD = Color(222, 184, 135)
-    BURLYWOOD1 = Color(255, 211, 155)
-    BURLYWOOD2 = Color(238, 197, 145)
-    BURLYWOOD3 = Color(205, 170, 125)
-    BURLYWOOD4 = Color(139, 115, 85)
-    BURNTSIENNA = Color(138, 54, 15)
-    BURNTUMBER = Color(138, 51, 36)
-    CADETBLUE = Color(95, 158, 160)
-    CADETBLUE1 = Color(152, 245, 255)
-    CADETBLUE2 = Color(142, 229, 238)
-    CADETBLUE3 = Color(122, 197, 205)
-    CADETBLUE4 = Color(83, 134, 139)
-    CADMIUMORANGE = Color(255, 97, 3)
-    CADMIUMYELLOW = Color(255, 153, 18)
-    CARROT = Color(237, 145, 33)
-    CHARTREUSE1 = Color(127, 255, 0)
-    CHARTREUSE2 = Color(118, 238, 0)
-    CHARTREUSE3 = Color(102, 205, 0)
-    CHARTREUSE4 = Color(69, 139, 0)
-    CHOCOLATE = Color(210, 105, 30)
-    CHOCOLATE1 = Color(255, 127, 36)
-    CHOCOLATE2 = Color(238, 118, 33)
-    CHOCOLATE3 = Color(205, 102, 29)
-    CHOCOLATE4 = Color(139, 69, 19)
-    COBALT = Color(61, 89, 171)
-    COBALTGREEN = Color(61, 145, 64)
-    COLDGREY = Color(128, 138, 135)
-    CORAL = Color(255, 127, 80)
-    CORAL1 = Color(255, 114, 86)
-    CORAL2 = Color(238, 106, 80)
-    CORAL3 = Color(205, 91, 69)
-    CORAL4 = Color(139, 62, 47)
-    CORNFLOWERBLUE = Color(100, 149, 237)
-    CORNSILK1 = Color(255, 248, 220)
-    CORNSILK2 = Color(238, 232, 205)
-    CORNSILK3 = Color(205, 200, 177)
-    CORNSILK4 = Color(139, 136, 120)
-    CRIMSON = Color(220, 20, 60)
-    CYAN2 = Color(0, 238, 238)
-    CYAN3 = Color(0, 205, 205)
-    CYAN4 = Color(0, 139, 139)
-    DARKGOLDENROD = Color(184, 134, 11)
-    DARKGOLDENROD1 = Color(255, 185, 15)
-    DARKGOLDENROD2 = Color(238, 173, 14)
-    DARKGOLDENROD3 = Color(205, 149, 12)
-    DARKGOLDENROD4 = Color(139, 101, 8)
-    DARKGRAY = Color(169, 169, 169)
-    DARKGREEN = Color(0, 100, 0)
-    DARKKHAKI = Color(189, 183, 107)
-    DARKOLIVEGREEN = Color(85, 107, 47)
-    DARKOLIVEGREEN1 = Color(202, 255, 112)
-    DARKOLIVEGREEN2 = Color(188, 238, 104)
-    DARKOLIVEGREEN3 = Color(162, 205, 90)
-    DARKOLIVEGREEN4 = Color(110, 139, 61)
-    DARKORANGE = Color(255, 140, 0)
-    DARKORANGE1 = Color(255, 127, 0)
-    DARKORANGE2 = Color(238, 118, 0)
-    DARKORANGE3 = Color(205, 102, 0)
-    DARKORANGE4 = Color(139, 69, 0)
-    DARKORCHID = Color(153, 50, 204)
-    DARKORCHID1 = Color(191, 62, 255)
-    DARKORCHID2 = Color(178, 58, 238)
-    DARKORCHID3 = Color(154, 50, 205)
-    DARKORCHID4 = Color(104, 34, 139)
-    DARKSALMON = Color(233, 150, 122)
-    DARKSEAGREEN = Color(143, 188, 143)
-    DARKSEAGREEN1 = Color(193, 255, 193)
-    DARKSEAGREEN2 = Color(180, 238, 180)
-    DARKSEAGREEN3 = Color(155, 205, 155)
-    DARKSEAGREEN4 = Color(105, 139, 105)
-    DARKSLATEBLUE = Color(72, 61, 139)
-    DARKSLATEGRAY = Color(47, 79, 79)
-    DARKSLATEGRAY1 = Color(151, 255, 255)
-    DARKSLATEGRAY2 = Color(141, 238, 238)
-    DARKSLATEGRAY3 = Color(121, 205, 205)
-    DARKSLATEGRAY4 = Color(82, 139, 139)
-    DARKTURQUOISE = Color(0, 206, 209)
-    DARKVIOLET = Color(148, 0, 211)
-    DEEPPINK1 = Color(255, 20, 147)
-    DEEPPINK2 = Color(238, 18, 137)
-    DEEPPINK3 = Color(205, 16, 118)
-    DEEPPINK4 = Color(139, 10, 80)
-    DEEPSKYBLUE1 = Color(0, 191, 255)
-    DEEPSKYBLUE2 = Color(0, 178, 238)
-    DEEPSKYBLUE3 = Color(0, 154, 205)
-    DEEPSKYBLUE4 = Color(0, 104, 139)
-    DIMGRAY = Color(105, 105, 105)
-    DIMGRAY = Color(105, 105, 105)
-    DODGERBLUE1 = Color(30, 144, 255)
-    DODGERBLUE2 = Color(28, 134, 238)
-    DODGERBLUE3 = Color(24, 116, 205)
-    DODGERBLUE4 = Color(16, 78, 139)
-    EGGSHELL = Color(252, 230, 201)
-    EMERALDGREEN = Color(0, 201, 87)
-    FIREBRICK = Color(178, 34, 34)
-    FIREBRICK1 = Color(255, 48, 48)
-    FIREBRICK2 = Color(238, 44, 44)
-    FIREBRICK3 = Color(205, 38, 38)
-    FIREBRICK4 = Color(139, 26, 26)
-    FLESH = Color(255, 125, 64)
-    FLORALWHITE = Color(255, 250, 240)
-    FORESTGREEN = Color(34, 139, 34)
-    GAINSBORO = Color(220, 220, 220)
-    GHOSTWHITE = Color(248, 248, 255)
-    GOLD1 = Color(255, 215, 0)
-    GOLD2 = Color(238, 201, 0)
-    GOLD3 = Color(205, 173, 0)
-    GOLD4 = Color(139, 117, 0)
-    GOLDENROD = Color(218, 165, 32)
-    GOLDENROD1 = Color(255, 193, 37)
-    GOLDENROD2 = Color(238, 180, 34)
-    GOLDENROD3 = Color(205, 155, 29)
-    GOLDENROD4 = Color(139, 105, 20)
-    GRAY = Color(128, 128, 128)
-    GRAY1 = Color(3, 3, 3)
-    GRAY10 = Color(26, 26, 26)
-    GRAY11 = Color(28, 28, 28)
-    GRAY12 = Color(31, 31, 31)
-    GRAY13 = Color(33, 33, 33)
-    GRAY14 = Color(36, 36, 36)
-    GRAY15 = Color(38, 38, 38)
-    GRAY16 = Color(41, 41, 41)
-    GRAY17 = Color(43, 43, 43)
-    GRAY18 = Color(46, 46, 46)
-    GRAY19 = Color(48, 48, 48)
-    GRAY2 = Color(5, 5, 5)
-    GRAY20 = Color(51, 51, 51)
-    GRAY21 = Color(54, 54, 54)
-    GRAY22 = Color(56, 56, 56)
-    GRAY23 = Color(59, 59, 59)
-    GRAY24 = Color(61, 61, 61)
-    GRAY25 = Color(64, 64, 64)
-    GRAY26 = Color(66, 66, 66)
-    GRAY27 = Color(69, 69, 69)
-    GRAY28 = Color(71, 71, 71)
-    GRAY29 = Color(74, 74, 74)
-    GRAY3 = Color(8, 8, 8)
-    GRAY30 = Color(77, 77, 77)
-    GRAY31 = Color(79, 79, 79)
-    GRAY32 = Color(82, 82, 82)
-    GRAY33 = Color(84, 84, 84)
-    GRAY34 = Color(87, 87, 87)
-    GRAY35 = Color(89, 89, 89)
-    GRAY36 = Color(92, 92, 92)
-    GRAY37 = Color(94, 94, 94)
-    GRAY38 = Color(97, 97, 97)
-    GRAY39 = Color(99, 99, 99)
-    GRAY4 = Color(10, 10, 10)
-    GRAY40 = Color(102, 102, 102)
-    GRAY42 = Color(107, 107, 107)
-    GRAY43 = Color(110, 110, 110)
-    GRAY44 = Color(112, 112, 112)
-    GRAY45 = Color(115, 115, 115)
-    GRAY46 = Color(117, 117, 117)
-    GRAY47 = Color(120, 120, 120)
-    GRAY48 = Color(122, 122, 122)
-    GRAY49 = Color(125, 125, 125)
-    GRAY5 = Color(13, 13, 13)
-    GRAY50 = Color(127, 127, 127)
-    GRAY51 = Color(130, 130, 130)
-    GRAY52 = Color(133, 133, 133)
-    GRAY53 = Color(135, 135, 135)
-    GRAY54 = Color(138, 138, 138)
-    GRAY55 = Color(140, 140, 140)
-    GRAY56 = Color(143, 143, 143)
-    GRAY57 = Color(145, 145, 145)
-    GRAY58 = Color(148, 148, 148)
-    GRAY59 = Color(150, 150, 150)
-    GRAY6 = Color(15, 15, 15)
-    GRAY60 = Color(153, 153, 153)
-    GRAY61 = Color(156, 156, 156)
-    GRAY62 = Color(158, 158, 158)
-    GRAY63 = Color(161, 161, 161)
-    GRAY64 = Color(163, 163, 163)
-    GRAY65 = Color(166, 166, 166)
-    GRAY66 = Color(168, 168, 168)
-    GRAY67 = Color(171, 171, 171)
-    GRAY68 = Color(173, 173, 173)
-    GRAY69 = Color(176, 176, 176)
-    GRAY7 = Color(18, 18, 18)
-    GRAY70 = Color(179, 179, 179)
-    GRAY71 = Color(181, 181, 181)
-    GRAY72 = Color(184, 184, 184)
-    GRAY73 = Color(186, 186, 186)
-    GRAY74 = Color(189, 189, 189)
-    GRAY75 = Color(191, 191, 191)
-    GRAY76 = Color(194, 194, 194)
-    GRAY77 = Color(196, 196, 196)
-    GRAY78 = Color(199, 199, 199)
-    GRAY79 = Color(201, 201, 201)
-    GRAY8 = Color(20, 20, 20)
-    GRAY80 = Color(204, 204, 204)
-    GRAY81 = Color(207, 207, 207)
-    GRAY82 = Color(209, 209, 209)
-    GRAY83 = Color(212, 212, 212)
-    GRAY84 = Color(214, 214, 214)
-    GRAY85 = Color(217, 217, 217)
-    GRAY86 = Color(219, 219, 219)
-    GRAY87 = Color(222, 222, 222)
-    GRAY88 = Color(224, 224, 224)
-    GRAY89 = Color(227, 227, 227)
-    GRAY9 = Color(23, 23, 23)
-    GRAY90 = Color(229, 229, 229)
-    GRAY91 = Color(232, 232, 232)
-    GRAY92 = Color(235, 235, 235)
-    GRAY93 = Color(237, 237, 237)
-    GRAY94 = Color(240, 240, 240)
-    GRAY95 = Color(242, 242, 242)
-    GRAY97 = Color(247, 247, 247)
-    GRAY98 = Color(250, 250, 250)
-    GRAY99 = Color(252, 252, 252)
-    GREEN = Color(0, 128, 0)
-    GREEN1 = Color(0, 255, 0)
-    GREEN2 = Color(0, 238, 0)
-    GREEN3 = Color(0, 205, 0)
-    GREEN4 = Color(0, 139, 0)
-    GREENYELLOW = Color(173, 255, 47)
-    HONEYDEW1 = Color(240, 255, 240)
-    HONEYDEW2 = Color(224, 238, 224)
-    HONEYDEW3 = Color(193, 205, 193)
-    HONEYDEW4 = Color(131, 139, 131)
-    HOTPINK = Color(255, 105, 180)
-    HOTPINK1 = Color(255, 110, 180)
-    HOTPINK2 = Color(238, 106, 167)
-    HOTPINK3 = Color(205, 96, 144)
-    HOTPINK4 = Color(139, 58, 98)
-    INDIANRED = Color(176, 23, 31)
-    INDIANRED = Color(205, 92, 92)
-    INDIANRED1 = Color(255, 106, 106)
-    INDIANRED2 = Color(238, 99, 99)
-    INDIANRED3 = Color(205, 85, 85)
-    INDIANRED4 = Color(139, 58, 58)
-    INDIGO = Color(75, 0, 130)
-    IVORY1 = Color(255, 255, 240)
-    IVORY2 = Color(238, 238, 224)
-    IVORY3 = Color(205, 205, 193)
-    IVORY4 = Color(139, 139, 131)
-    IVORYBLACK = Color(41, 36, 33)
-    KHAKI = Color(240, 230, 140)
-    KHAKI1 = Color(255, 246, 143)
-    KHAKI2 = Color(238, 230, 133)
-    KHAKI3 = Color(205, 198, 115)
-    KHAKI4 = Color(139, 134, 78)
-    LAVENDER = Color(230, 230, 250)
-    LAVENDERBLUSH1 = Color(255, 240, 245)
-    LAVENDERBLUSH2 = Color(238, 224, 229)
-    LAVENDERBLUSH3 = Color(205, 193, 197)
-    LAVENDERBLUSH4 = Color(139, 131, 134)
-    LAWNGREEN = Color(124, 252, 0)
-    LEMONCHIFFON1 = Color(255, 250, 205)
-    LEMONCHIFFON2 = Color(238, 233, 191)
-    LEMONCHIFFON3 = Color(205, 201, 165)
-    LEMONCHIFFON4 = Color(139, 137, 112)
-    LIGHTBLUE = Color(173, 216, 230)
-    LIGHTBLUE1 = Color(191, 239, 255)
-    LIGHTBLUE2 = Color(178, 223, 238)
-    LIGHTBLUE3 = Color(154, 192, 205)
-    LIGHTBLUE4 = Color(104, 131, 139)
-    LIGHTCORAL = Color(240, 128, 128)
-    LIGHTCYAN1 = Color(224, 255, 255)
-    LIGHTCYAN2 = Color(209, 238, 238)
-    LIGHTCYAN3 = Color(180, 205, 205)
-    LIGHTCYAN4 = Color(122, 139, 139)
-    LIGHTGOLDENROD1 = Color(255, 236, 139)
-    LIGHTGOLDENROD2 = Color(238, 220, 130)
-    LIGHTGOLDENROD3 = Color(205, 190, 112)
-    LIGHTGOLDENROD4 = Color(139, 129, 76)
-    LIGHTGOLDENRODYELLOW = Color(250, 250, 210)
-    LIGHTGREY = Color(211, 211, 211)
-    LIGHTPINK = Color(255, 182, 193)
-    LIGHTPINK1 = Color(255, 174, 185)
-    LIGHTPINK2 = Color(238, 162, 173)
-    LIGHTPINK3 = Color(205, 140, 149)
-    LIGHTPINK4 = Color(139, 95, 101)
-    LIGHTSALMON1 = Color(255, 160, 122)
-    LIGHTSALMON2 = Color(238, 149, 114)
-    LIGHTSALMON3 = Color(205, 129, 98)
-    LIGHTSALMON4 = Color(139, 87, 66)
-    LIGHTSEAGREEN = Color(32, 178, 170)
-    LIGHTSKYBLUE = Color(135, 206, 250)
-    LIGHTSKYBLUE1 = Color(176, 226, 255)
-    LIGHTSKYBLUE2 = Color(164, 211, 238)
-    LIGHTSKYBLUE3 = Color(141, 182, 205)
-    LIGHTSKYBLUE4 = Color(96, 123, 139)
-    LIGHTSLATEBLUE = Color(132, 112, 255)
-    LIGHTSLATEGRAY = Color(119, 136, 153)
-    LIGHTSTEELBLUE = Color(176, 196, 222)
-    LIGHTSTEELBLUE1 = Color(202, 225, 255)
-    LIGHTSTEELBLUE2 = Color(188, 210, 238)
-    LIGHTSTEELBLUE3 = Color(162, 181, 205)
-    LIGHTSTEELBLUE4 = Color(110, 123, 139)
-    LIGHTYELLOW1 = Color(255, 255, 224)
-    LIGHTYELLOW2 = Color(238, 238, 209)
-    LIGHTYELLOW3 = Color(205, 205, 180)
-    LIGHTYELLOW4 = Color(139, 139, 122)
-    LIMEGREEN = Color(50, 205, 50)
-    LINEN = Color(250, 240, 230)
-    MAGENTA = Color(255, 0, 255)
-    MAGENTA2 = Color(238, 0, 238)
-    MAGENTA3 = Color(205, 0, 205)
-    MAGENTA4 = Color(139, 0, 139)
-    MANGANESEBLUE = Color(3, 168, 158)
-    MAROON = Color(128, 0, 0)
-    MAROON1 = Color(255, 52, 179)
-    MAROON2 = Color(238, 48, 167)
-    MAROON3 = Color(205, 41, 144)
-    MAROON4 = Color(139, 28, 98)
-    MEDIUMORCHID = Color(186, 85, 211)
-    MEDIUMORCHID1 = Color(224, 102, 255)
-    MEDIUMORCHID2 = Color(209, 95, 238)
-    MEDIUMORCHID3 = Color(180, 82, 205)
-    MEDIUMORCHID4 = Color(122, 55, 139)
-    MEDIUMPURPLE = Color(147, 112, 219)
-    MEDIUMPURPLE1 = Color(171, 130, 255)
-    MEDIUMPURPLE2 = Color(159, 121, 238)
-    MEDIUMPURPLE3 = Color(137, 104, 205)
-    MEDIUMPURPLE4 = Color(93, 71, 139)
-    MEDIUMSEAGREEN = Color(60, 179, 113)
-    MEDIUMSLATEBLUE = Color(123, 104, 238)
-    MEDIUMSPRINGGREEN = Color(0, 250, 154)
-    MEDIUMTURQUOISE = Color(72, 209, 204)
-    MEDIUMVIOLETRED = Color(199, 21, 133)
-    MELON = Color(227, 168, 105)
-    MIDNIGHTBLUE = Color(25, 25, 112)
-    MINT = Color(189, 252, 201)
-    MINTCREAM = Color(245, 255, 250)
-    MISTYROSE1 = Color(255, 228, 225)
-    MISTYROSE2 = Color(238, 213, 210)
-    MISTYROSE3 = Color(205, 183, 181)
-    MISTYROSE4 = Color(139, 125, 123)
-    MOCCASIN = Color(255, 228, 181)
-    NAVAJOWHITE1 = Color(255, 222, 173)
-    NAVAJOWHITE2 = Color(238, 207, 161)
-    NAVAJOWHITE3 = Color(205, 179, 139)
-    NAVAJOWHITE4 = Color(139, 121, 94)
-    NAVY = Color(0, 0, 128)
-    OLDLACE = Color(253, 245, 230)
-    OLIVE = Color(128, 128, 0)
-    OLIVEDRAB = Color(107, 142, 35)
-    OLIVEDRAB1 = Color(192, 255, 62)
-    OLIVEDRAB2 = Color(179, 238, 58)
-    OLIVEDRAB3 = Color(154, 205, 50)
-    OLIVEDRAB4 = Color(105, 139, 34)
-    ORANGE = Color(255, 128, 0)
-    ORANGE1 = Color(255, 165, 0)
-    ORANGE2 = Color(238, 154, 0)
-    ORANGE3 = Color(205, 133, 0)
-    ORANGE4 = Color(139, 90, 0)
-    ORANGERED1 = Color(255, 69, 0)
-    ORANGERED2 = Color(238, 64, 0)
-    ORANGERED3 = Color(205, 55, 0)
-    ORANGERED4 = Color(139, 37, 0)
-    ORCHID = Color(218, 112, 214)
-    ORCHID1 = Color(255, 131, 250)
-    ORCHID2 = Color(238, 122, 233)
-    ORCHID3 = Color(205, 105, 201)
-    ORCHID4 = Color(139, 71, 137)
-    PALEGOLDENROD = Color(238, 232, 170)
-    PALEGREEN = Color(152, 251, 152)
-    PALEGREEN1 = Color(154, 255, 154)
-    PALEGREEN2 = Color(144, 238, 144)
-    PALEGREEN3 = Color(124, 205, 124)
-    PALEGREEN4 = Color(84, 139, 84)
-    PALETURQUOISE1 = Color(187, 255, 255)
-    PALETURQUOISE2 = Color(174, 238, 238)
-    PALETURQUOISE3 = Color(150, 205, 205)
-    PALETURQUOISE4 = Color(102, 139, 139)
-    PALEVIOLETRED = Color(219, 112, 147)
-    PALEVIOLETRED1 = Color(255, 130, 171)
-    PALEVIOLETRED2 = Color(238, 121, 159)
-    PALEVIOLETRED3 = Color(205, 104, 137)
-    PALEVIOLETRED4 = Color(139, 71, 93)
-    PAPAYAWHIP = Color(255, 239, 213)
-    PEACHPUFF1 = Color(255, 218, 185)
-    PEACHPUFF2 = Color(238, 203, 173)
-    PEACHPUFF3 = Color(205, 175, 149)
-    PEACHPUFF4 = Color(139, 119, 101)
-    PEACOCK = Color(51, 161, 201)
-    PINK = Color(255, 192, 203)
-    PINK1 = Color(255, 181, 197)
-    PINK2 = Color(238, 169, 184)
-    PINK3 = Color(205, 145, 158)
-    PINK4 = Color(139, 99, 108)
-    PLUM = Color(221, 160, 221)
-    PLUM1 = Color(255, 187, 255)
-    PLUM2 = Color(238, 174, 238)
-    PLUM3 = Color(205, 150, 205)
-    PLUM4 = Color(139, 102, 139)
-    POWDERBLUE = Color(176, 224, 230)
-    PURPLE = Color(128, 0, 128)
-    PURPLE1 = Color(155, 48, 255)
-    PURPLE2 = Color(145, 44, 238)
-    PURPLE3 = Color(125, 38, 205)
-    PURPLE4 = Color(85, 26, 139)
-    RASPBERRY = Color(135, 38, 87)
-    RAWSIENNA = Color(199, 97, 20)
-    RED1 = Color(255, 0, 0)
-    RED2 = Color(238, 0, 0)
-    RED3 = Color(205, 0, 0)
-    RED4 = Color(139, 0, 0)
-    ROSYBROWN = Color(188, 143, 143)
-    ROSYBROWN1 = Color(255, 193, 193)
-    ROSYBROWN2 = Color(238, 180, 180)
-    ROSYBROWN3 = Color(205, 155, 155)
-    ROSYBROWN4 = Color(139, 105, 105)
-    ROYALBLUE = Color(65, 105, 225)
-    ROYALBLUE1 = Color(72, 118, 255)
-    ROYALBLUE2 = Color(67, 110, 238)
-    ROYALBLUE3 = Color(58, 95, 205)
-    ROYALBLUE4 = Color(39, 64, 139)
-    SALMON = Color(250, 128, 114)
-    SALMON1 = Color(255, 140, 105)
-    SALMON2 = Color(238, 130, 98)
-    SALMON3 = Color(205, 112, 84)
-    SALMON4 = Color(139, 76, 57)
-    SANDYBROWN = Color(244, 164, 96)
-    SAPGREEN = Color(48, 128, 20)
-    SEAGREEN1 = Color(84, 255, 159)
-    SEAGREEN2 = Color(78, 238, 148)
-    SEAGREEN3 = Color(67, 205, 128)
-    SEAGREEN4 = Color(46, 139, 87)
-    SEASHELL1 = Color(255, 245, 238)
-    SEASHELL2 = Color(238, 229, 222)
-    SEASHELL3 = Color(205, 197, 191)
-    SEASHELL4 = Color(139, 134, 130)
-    SEPIA = Color(94, 38, 18)
-    SGIBEET = Color(142, 56, 142)
-    SGIBRIGHTGRAY = Color(197, 193, 170)
-    SGICHARTREUSE = Color(113, 198, 113)
-    SGIDARKGRAY = Color(85, 85, 85)
-    SGIGRAY12 = Color(30, 30, 30)
-    SGIGRAY16 = Color(40, 40, 40)
-    SGIGRAY32 = Color(81, 81, 81)
-    SGIGRAY36 = Color(91, 91, 91)
-    SGIGRAY52 = Color(132, 132, 132)
-    SGIGRAY56 = Color(142, 142, 142)
-    SGIGRAY72 = Color(183, 183, 183)
-    SGIGRAY76 = Color(193, 193, 193)
-    SGIGRAY92 = Color(234, 234, 234)
-    SGIGRAY96 = Color(244, 244, 244)
-    SGILIGHTBLUE = Color(125, 158, 192)
-    SGILIGHTGRAY = Color(170, 170, 170)
-    SGIOLIVEDRAB = Color(142, 142, 56)
-    SGISALMON = Color(198, 113, 113)
-    SGISLATEBLUE = Color(113, 113, 198)
-    SGITEAL = Color(56, 142, 142)
-    SIENNA = Color(160, 82, 45)
-    SIENNA1 = Color(255, 130, 71)
-    SIENNA2 = Color(238, 121, 66)
-    SIENNA3 = Color(205, 104, 57)
-    SIENNA4 = Color(139, 71, 38)
-    SILVER = Color(192, 192, 192)
-    SKYBLUE = Color(135, 206, 235)
-    SKYBLUE1 = Color(135, 206, 255)
-    SKYBLUE2 = Color(126, 192, 238)
-    SKYBLUE3 = Color(108, 166, 205)
-    SKYBLUE4 = Color(74, 112, 139)
-    SLATEBLUE = Color(106, 90, 205)
-    SLATEBLUE1 = Color(131, 111, 255)
-    SLATEBLUE2 = Color(122, 103, 238)
-    SLATEBLUE3 = Color(105, 89, 205)
-    SLATEBLUE4 = Color(71, 60, 139)
-    SLATEGRAY = Color(112, 128, 144)
-    SLATEGRAY1 = Color(198, 226, 255)
-    SLATEGRAY2 = Color(185, 211, 238)
-    SLATEGRAY3 = Color(159, 182, 205)
-    SLATEGRAY4 = Color(108, 123, 139)
-    SNOW1 = Color(255, 250, 250)
-    SNOW2 = Color(238, 233, 233)
-    SNOW3 = Color(205, 201, 201)
-    SNOW4 = Color(139, 137, 137)
-    SPRINGGREEN = Color(0, 255, 127)
-    SPRINGGREEN1 = Color(0, 238, 118)
-    SPRINGGREEN2 = Color(0, 205, 102)
-    SPRINGGREEN3 = Color(0, 139, 69)
-    STEELBLUE = Color(70, 130, 180)
-    STEELBLUE1 = Color(99, 184, 255)
-    STEELBLUE2 = Color(92, 172, 238)
-    STEELBLUE3 = Color(79, 148, 205)
-    STEELBLUE4 = Color(54, 100, 139)
-    TAN = Color(210, 180, 140)
-    TAN1 = Color(255, 165, 79)
-    TAN2 = Color(238, 154, 73)
-    TAN3 = Color(205, 133, 63)
-    TAN4 = Color(139, 90, 43)
-    TEAL = Color(0, 128, 128)
-    THISTLE = Color(216, 191, 216)
-    THISTLE1 = Color(255, 225, 255)
-    THISTLE2 = Color(238, 210, 238)
-    THISTLE3 = Color(205, 181, 205)
-    THISTLE4 = Color(139, 123, 139)
-    TOMATO1 = Color(255, 99, 71)
-    TOMATO2 = Color(238, 92, 66)
-    TOMATO3 = Color(205, 79, 57)
-    TOMATO4 = Color(139, 54, 38)
-    TURQUOISE = Color(64, 224, 208)
-    TURQUOISE1 = Color(0, 245, 255)
-    TURQUOISE2 = Color(0, 229, 238)
-    TURQUOISE3 = Color(0, 197, 205)
-    TURQUOISE4 = Color(0, 134, 139)
-    TURQUOISEBLUE = Color(0, 199, 140)
-    VIOLET = Color(238, 130, 238)
-    VIOLETRED = Color(208, 32, 144)
-    VIOLETRED1 = Color(255, 62, 150)
-    VIOLETRED2 = Color(238, 58, 140)
-    VIOLETRED3 = Color(205, 50, 120)
-    VIOLETRED4 = Color(139, 34, 82)
-    WARMGREY = Color(128, 128, 105)
-    WHEAT = Color(245, 222, 179)
-    WHEAT1 = Color(255, 231, 186)
-    WHEAT2 = Color(238, 216, 174)
-    WHEAT3 = Color(205, 186, 150)
-    WHEAT4 = Color(139, 126, 102)
-    WHITE = Color(255, 255, 255)
-    WHITESMOKE = Color(245, 245, 245)
-    WHITESMOKE = Color(245, 245, 245)
-    YELLOW1 = Color(255, 255, 0)
-    YELLOW2 = Color(238, 238, 0)
-    YELLOW3 = Color(205, 205, 0)
-    YELLOW4 = Color(139, 139, 0)
-
     def __init__(self):
-        self['aliceblue'] = self.ALICEBLUE
-        self['antiquewhite'] = self.ANTIQUEWHITE
-        self['antiquewhite1'] = self.ANTIQUEWHITE1
-        self['antiquewhite2'] = self.ANTIQUEWHITE2
-        self['antiquewhite3'] = self.ANTIQUEWHITE3
-        self['antiquewhite4'] = self.ANTIQUEWHITE4
-        self['aqua'] = self.AQUA
-        self['aquamarine1'] = self.AQUAMARINE1
-        self['aquamarine2'] = self.AQUAMARINE2
-        self['aquamarine3'] = self.AQUAMARINE3
-        self['aquamarine4'] = self.AQUAMARINE4
-        self['azure1'] = self.AZURE1
-        self['azure2'] = self.AZURE2
-        self['azure3'] = self.AZURE3
-        self['azure4'] = self.AZURE4
-        self['banana'] = self.BANANA
-        self['beige'] = self.BEIGE
-        self['bisque1'] = self.BISQUE1
-        self['bisque2'] = self.BISQUE2
-        self['bisque3'] = self.BISQUE3
-        self['bisque4'] = self.BISQUE4
-        self['black'] = self.BLACK
-        self['blanchedalmond'] = self.BLANCHEDALMOND
-        self['blue'] = self.BLUE
-        self['blue2'] = self.BLUE2
-        self['blue3'] = self.BLUE3
-        self['blue4'] = self.BLUE4
-        self['blueviolet'] = self.BLUEVIOLET
-        self['brick'] = self.BRICK
-        self['brown'] = self.BROWN
-        self['brown1'] = self.BROWN1
-        self['brown2'] = self.BROWN2
-        self['brown3'] = self.BROWN3
-        self['brown4'] = self.BROWN4
-        self['burlywood'] = self.BURLYWOOD
-        self['burlywood1'] = self.BURLYWOOD1
-        self['burlywood2'] = self.BURLYWOOD2
-        self['burlywood3'] = self.BURLYWOOD3
-        self['burlywood4'] = self.BURLYWOOD4
-        self['burntsienna'] = self.BURNTSIENNA
-        self['burntumber'] = self.BURNTUMBER
-        self['cadetblue'] = self.CADETBLUE
-        self['cadetblue1'] = self.CADETBLUE1
-        self['cadetblue2'] = self.CADETBLUE2
-        self['cadetblue3'] = self.CADETBLUE3
-        self['cadetblue4'] = self.CADETBLUE4
-        self['cadmiumorange'] = self.CADMIUMORANGE
-        self['cadmiumyellow'] = self.CADMIUMYELLOW
-        self['carrot'] = self.CARROT
-        self['chartreuse1'] = self.CHARTREUSE1
-        self['chartreuse2'] = self.CHARTREUSE2
-        self['chartreuse3'] = self.CHARTREUSE3
-        self['chartreuse4'] = self.CHARTREUSE4
-        self['chocolate'] = self.CHOCOLATE
-        self['chocolate1'] = self.CHOCOLATE1
-        self['chocolate2'] = self.CHOCOLATE2
-        self['chocolate3'] = self.CHOCOLATE3
-        self['chocolate4'] = self.CHOCOLATE4
-        self['cobalt'] = self.COBALT
-        self['cobaltgreen'] = self.COBALTGREEN
-        self['coldgrey'] = self.COLDGREY
-        self['coral'] = self.CORAL
-        self['coral1'] = self.CORAL1
-        self['coral2'] = self.CORAL2
-        self['coral3'] = self.CORAL3
-        self['coral4'] = self.CORAL4
-        self['cornflowerblue'] = self.CORNFLOWERBLUE
-        self['cornsilk1'] = self.CORNSILK1
-        self['cornsilk2'] = self.CORNSILK2
-        self['cornsilk3'] = self.CORNSILK3
-        self['cornsilk4'] = self.CORNSILK4
-        self['crimson'] = self.CRIMSON
-        self['cyan2'] = self.CYAN2
-        self['cyan3'] = self.CYAN3
-        self['cyan4'] = self.CYAN4
-        self['darkgoldenrod'] = self.DARKGOLDENROD
-        self['darkgoldenrod1'] = self.DARKGOLDENROD1
-        self['darkgoldenrod2'] = self.DARKGOLDENROD2
-        self['darkgoldenrod3'] = self.DARKGOLDENROD3
-        self['darkgoldenrod4'] = self.DARKGOLDENROD4
-        self['darkgray'] = self.DARKGRAY
-        self['darkgreen'] = self.DARKGREEN
-        self['darkkhaki'] = self.DARKKHAKI
-        self['darkolivegreen'] = self.DARKOLIVEGREEN
-        self['darkolivegreen1'] = self.DARKOLIVEGREEN1
-        self['darkolivegreen2'] = self.DARKOLIVEGREEN2
-        self['darkolivegreen3'] = self.DARKOLIVEGREEN3
-        self['darkolivegreen4'] = self.DARKOLIVEGREEN4
-        self['darkorange'] = self.DARKORANGE
-        self['darkorange1'] = self.DARKORANGE1
-        self['darkorange2'] = self.DARKORANGE2
-        self['darkorange3'] = self.DARKORANGE3
-        self['darkorange4'] = self.DARKORANGE4
-        self['darkorchid'] = self.DARKORCHID
-        self['darkorchid1'] = self.DARKORCHID1
-        self['darkorchid2'] = self.DARKORCHID2
-        self['darkorchid3'] = self.DARKORCHID3
-        self['darkorchid4'] = self.DARKORCHID4
-        self['darksalmon'] = self.DARKSALMON
-        self['darkseagreen'] = self.DARKSEAGREEN
-        self['darkseagreen1'] = self.DARKSEAGREEN1
-        self['darkseagreen2'] = self.DARKSEAGREEN2
-        self['darkseagreen3'] = self.DARKSEAGREEN3
-        self['darkseagreen4'] = self.DARKSEAGREEN4
-        self['darkslateblue'] = self.DARKSLATEBLUE
-        self['darkslategray'] = self.DARKSLATEGRAY
-        self['darkslategray1'] = self.DARKSLATEGRAY1
-        self['darkslategray2'] = self.DARKSLATEGRAY2
-        self['darkslategray3'] = self.DARKSLATEGRAY3
-        self['darkslategray4'] = self.DARKSLATEGRAY4
-        self['darkturquoise'] = self.DARKTURQUOISE
-        self['darkviolet'] = self.DARKVIOLET
-        self['deeppink1'] = self.DEEPPINK1
-        self['deeppink2'] = self.DEEPPINK2
-        self['deeppink3'] = self.DEEPPINK3
-        self['deeppink4'] = self.DEEPPINK4
-        self['deepskyblue1'] = self.DEEPSKYBLUE1
-        self['deepskyblue2'] = self.DEEPSKYBLUE2
-        self['deepskyblue3'] = self.DEEPSKYBLUE3
-        self['deepskyblue4'] = self.DEEPSKYBLUE4
-        self['dimgray'] = self.DIMGRAY
-        self['dodgerblue1'] = self.DODGERBLUE1
-        self['dodgerblue2'] = self.DODGERBLUE2
-        self['dodgerblue3'] = self.DODGERBLUE3
-        self['dodgerblue4'] = self.DODGERBLUE4
-        self['eggshell'] = self.EGGSHELL
-        self['emeraldgreen'] = self.EMERALDGREEN
-        self['firebrick'] = self.FIREBRICK
-        self['firebrick1'] = self.FIREBRICK1
-        self['firebrick2'] = self.FIREBRICK2
-        self['firebrick3'] = self.FIREBRICK3
-        self['firebrick4'] = self.FIREBRICK4
-        self['flesh'] = self.FLESH
-        self['floralwhite'] = self.FLORALWHITE
-        self['forestgreen'] = self.FORESTGREEN
-        self['gainsboro'] = self.GAINSBORO
-        self['ghostwhite'] = self.GHOSTWHITE
-        self['gold1'] = self.GOLD1
-        self['gold2'] = self.GOLD2
-        self['gold3'] = self.GOLD3
-        self['gold4'] = self.GOLD4
-        self['goldenrod'] = self.GOLDENROD
-        self['goldenrod1'] = self.GOLDENROD1
-        self['goldenrod2'] = self.GOLDENROD2
-        self['goldenrod3'] = self.GOLDENROD3
-        self['goldenrod4'] = self.GOLDENROD4
-        self['gray'] = self.GRAY
-        self['gray1'] = self.GRAY1
-        self['gray10'] = self.GRAY10
-        self['gray11'] = self.GRAY11
-        self['gray12'] = self.GRAY12
-        self['gray13'] = self.GRAY13
-        self['gray14'] = self.GRAY14
-        self['gray15'] = self.GRAY15
-        self['gray16'] = self.GRAY16
-        self['gray17'] = self.GRAY17
-        self['gray18'] = self.GRAY18
-        self['gray19'] = self.GRAY19
-        self['gray2'] = self.GRAY2
-        self['gray20'] = self.GRAY20
-        self['gray21'] = self.GRAY21
-        self['gray22'] = self.GRAY22
-        self['gray23'] = self.GRAY23
-        self['gray24'] = self.GRAY24
-        self['gray25'] = self.GRAY25
-        self['gray26'] = self.GRAY26
-        self['gray27'] = self.GRAY27
-        self['gray28'] = self.GRAY28
-        self['gray29'] = self.GRAY29
-        self['gray3'] = self.GRAY3
-        self['gray30'] = self.GRAY30
-        self['gray31'] = self.GRAY31
-        self['gray32'] = self.GRAY32
-        self['gray33'] = self.GRAY33
-        self['gray34'] = self.GRAY34
-        self['gray35'] = self.GRAY35
-        self['gray36'] = self.GRAY36
-        self['gray37'] = self.GRAY37
-        self['gray38'] = self.GRAY38
-        self['gray39'] = self.GRAY39
-        self['gray4'] = self.GRAY4
-        self['gray40'] = self.GRAY40
-        self['gray42'] = self.GRAY42
-        self['gray43'] = self.GRAY43
-        self['gray44'] = self.GRAY44
-        self['gray45'] = self.GRAY45
-        self['gray46'] = self.GRAY46
-        self['gray47'] = self.GRAY47
-        self['gray48'] = self.GRAY48
-        self['gray49'] = self.GRAY49
-        self['gray5'] = self.GRAY5
-        self['gray50'] = self.GRAY50
-        self['gray51'] = self.GRAY51
-        self['gray52'] = self.GRAY52
-        self['gray53'] = self.GRAY53
-        self['gray54'] = self.GRAY54
-        self['gray55'] = self.GRAY55
-        self['gray56'] = self.GRAY56
-        self['gray57'] = self.GRAY57
-        self['gray58'] = self.GRAY58
-        self['gray59'] = self.GRAY59
-        self['gray6'] = self.GRAY6
-        self['gray60'] = self.GRAY60
-        self['gray61'] = self.GRAY61
-        self['gray62'] = self.GRAY62
-        self['gray63'] = self.GRAY63
-        self['gray64'] = self.GRAY64
-        self['gray65'] = self.GRAY65
-        self['gray66'] = self.GRAY66
-        self['gray67'] = self.GRAY67
-        self['gray68'] = self.GRAY68
-        self['gray69'] = self.GRAY69
-        self['gray7'] = self.GRAY7
-        self['gray70'] = self.GRAY70
-        self['gray71'] = self.GRAY71
-        self['gray72'] = self.GRAY72
-        self['gray73'] = self.GRAY73
-        self['gray74'] = self.GRAY74
-        self['gray75'] = self.GRAY75
-        self['gray76'] = self.GRAY76
-        self['gray77'] = self.GRAY77
-        self['gray78'] = self.GRAY78
-        self['gray79'] = self.GRAY79
-        self['gray8'] = self.GRAY8
-        self['gray80'] = self.GRAY80
-        self['gray81'] = self.GRAY81
-        self['gray82'] = self.GRAY82
-        self['gray83'] = self.GRAY83
-        self['gray84'] = self.GRAY84
-        self['gray85'] = self.GRAY85
-        self['gray86'] = self.GRAY86
-        self['gray87'] = self.GRAY87
-        self['gray88'] = self.GRAY88
-        self['gray89'] = self.GRAY89
-        self['gray9'] = self.GRAY9
-        self['gray90'] = self.GRAY90
-        self['gray91'] = self.GRAY91
-        self['gray92'] = self.GRAY92
-        self['gray93'] = self.GRAY93
-        self['gray94'] = self.GRAY94
-        self['gray95'] = self.GRAY95
-        self['gray97'] = self.GRAY97
-        self['gray98'] = self.GRAY98
-        self['gray99'] = self.GRAY99
-        self['green'] = self.GREEN
-        self['green1'] = self.GREEN1
-        self['green2'] = self.GREEN2
-        self['green3'] = self.GREEN3
-        self['green4'] = self.GREEN4
-        self['greenyellow'] = self.GREENYELLOW
-        self['honeydew1'] = self.HONEYDEW1
-        self['honeydew2'] = self.HONEYDEW2
-        self['honeydew3'] = self.HONEYDEW3
-        self['honeydew4'] = self.HONEYDEW4
-        self['hotpink'] = self.HOTPINK
-        self['hotpink1'] = self.HOTPINK1
-        self['hotpink2'] = self.HOTPINK2
-        self['hotpink3'] = self.HOTPINK3
-        self['hotpink4'] = self.HOTPINK4
-        self['indianred'] = self.INDIANRED
-        self['indianred'] = self.INDIANRED
-        self['indianred1'] = self.INDIANRED1
-        self['indianred2'] = self.INDIANRED2
-        self['indianred3'] = self.INDIANRED3
-        self['indianred4'] = self.INDIANRED4
-        self['indigo'] = self.INDIGO
-        self['ivory1'] = self.IVORY1
-        self['ivory2'] = self.IVORY2
-        self['ivory3'] = self.IVORY3
-        self['ivory4'] = self.IVORY4
-        self['ivoryblack'] = self.IVORYBLACK
-        self['khaki'] = self.KHAKI
-        self['khaki1'] = self.KHAKI1
-        self['khaki2'] = self.KHAKI2
-        self['khaki3'] = self.KHAKI3
-        self['khaki4'] = self.KHAKI4
-        self['lavender'] = self.LAVENDER
-        self['lavenderblush1'] = self.LAVENDERBLUSH1
-        self['lavenderblush2'] = self.LAVENDERBLUSH2
-        self['lavenderblush3'] = self.LAVENDERBLUSH3
-        self['lavenderblush4'] = self.LAVENDERBLUSH4
-        self['lawngreen'] = self.LAWNGREEN
-        self['lemonchiffon1'] = self.LEMONCHIFFON1
-        self['lemonchiffon2'] = self.LEMONCHIFFON2
-        self['lemonchiffon3'] = self.LEMONCHIFFON3
-        self['lemonchiffon4'] = self.LEMONCHIFFON4
-        self['lightblue'] = self.LIGHTBLUE
-        self['lightblue1'] = self.LIGHTBLUE1
-        self['lightblue2'] = self.LIGHTBLUE2
-        self['lightblue3'] = self.LIGHTBLUE3
-        self['lightblue4'] = self.LIGHTBLUE4
-        self['lightcoral'] = self.LIGHTCORAL
-        self['lightcyan1'] = self.LIGHTCYAN1
-        self['lightcyan2'] = self.LIGHTCYAN2
-        self['lightcyan3'] = self.LIGHTCYAN3
-        self['lightcyan4'] = self.LIGHTCYAN4
-        self['lightgoldenrod1'] = self.LIGHTGOLDENROD1
-        self['lightgoldenrod2'] = self.LIGHTGOLDENROD2
-        self['lightgoldenrod3'] = self.LIGHTGOLDENROD3
-        self['lightgoldenrod4'] = self.LIGHTGOLDENROD4
-        self['lightgoldenrodyellow'] = self.LIGHTGOLDENRODYELLOW
-        self['lightgrey'] = self.LIGHTGREY
-        self['lightpink'] = self.LIGHTPINK
-        self['lightpink1'] = self.LIGHTPINK1
-        self['lightpink2'] = self.LIGHTPINK2
-        self['lightpink3'] = self.LIGHTPINK3
-        self['lightpink4'] = self.LIGHTPINK4
-        self['lightsalmon1'] = self.LIGHTSALMON1
-        self['lightsalmon2'] = self.LIGHTSALMON2
-        self['lightsalmon3'] = self.LIGHTSALMON3
-        self['lightsalmon4'] = self.LIGHTSALMON4
-        self['lightseagreen'] = self.LIGHTSEAGREEN
-        self['lightskyblue'] = self.LIGHTSKYBLUE
-        self['lightskyblue1'] = self.LIGHTSKYBLUE1
-        self['lightskyblue2'] = self.LIGHTSKYBLUE2
-        self['lightskyblue3'] = self.LIGHTSKYBLUE3
-        self['lightskyblue4'] = self.LIGHTSKYBLUE4
-        self['lightslateblue'] = self.LIGHTSLATEBLUE
-        self['lightslategray'] = self.LIGHTSLATEGRAY
-        self['lightsteelblue'] = self.LIGHTSTEELBLUE
-        self['lightsteelblue1'] = self.LIGHTSTEELBLUE1
-        self['lightsteelblue2'] = self.LIGHTSTEELBLUE2
-        self['lightsteelblue3'] = self.LIGHTSTEELBLUE3
-        self['lightsteelblue4'] = self.LIGHTSTEELBLUE4
-        self['lightyellow1'] = self.LIGHTYELLOW1
-        self['lightyellow2'] = self.LIGHTYELLOW2
-        self['lightyellow3'] = self.LIGHTYELLOW3
-        self['lightyellow4'] = self.LIGHTYELLOW4
-        self['limegreen'] = self.LIMEGREEN
-        self['linen'] = self.LINEN
-        self['magenta'] = self.MAGENTA
-        self['magenta2'] = self.MAGENTA2
-        self['magenta3'] = self.MAGENTA3
-        self['magenta4'] = self.MAGENTA4
-        self['manganeseblue'] = self.MANGANESEBLUE
-        self['maroon'] = self.MAROON
-        self['maroon1'] = self.MAROON1
-        self['maroon2'] = self.MAROON2
-        self['maroon3'] = self.MAROON3
-        self['maroon4'] = self.MAROON4
-        self['mediumorchid'] = self.MEDIUMORCHID
-        self['mediumorchid1'] = self.MEDIUMORCHID1
-        self['mediumorchid2'] = self.MEDIUMORCHID2
-        self['mediumorchid3'] = self.MEDIUMORCHID3
-        self['mediumorchid4'] = self.MEDIUMORCHID4
-        self['mediumpurple'] = self.MEDIUMPURPLE
-        self['mediumpurple1'] = self.MEDIUMPURPLE1
-        self['mediumpurple2'] = self.MEDIUMPURPLE2
-        self['mediumpurple3'] = self.MEDIUMPURPLE3
-        self['mediumpurple4'] = self.MEDIUMPURPLE4
-        self['mediumseagreen'] = self.MEDIUMSEAGREEN
-        self['mediumslateblue'] = self.MEDIUMSLATEBLUE
-        self['mediumspringgreen'] = self.MEDIUMSPRINGGREEN
-        self['mediumturquoise'] = self.MEDIUMTURQUOISE
-        self['mediumvioletred'] = self.MEDIUMVIOLETRED
-        self['melon'] = self.MELON
-        self['midnightblue'] = self.MIDNIGHTBLUE
-        self['mint'] = self.MINT
-        self['mintcream'] = self.MINTCREAM
-        self['mistyrose1'] = self.MISTYROSE1
-        self['mistyrose2'] = self.MISTYROSE2
-        self['mistyrose3'] = self.MISTYROSE3
-        self['mistyrose4'] = self.MISTYROSE4
-        self['moccasin'] = self.MOCCASIN
-        self['navajowhite1'] = self.NAVAJOWHITE1
-        self['navajowhite2'] = self.NAVAJOWHITE2
-        self['navajowhite3'] = self.NAVAJOWHITE3
-        self['navajowhite4'] = self.NAVAJOWHITE4
-        self['navy'] = self.NAVY
-        self['oldlace'] = self.OLDLACE
-        self['olive'] = self.OLIVE
-        self['olivedrab'] = self.OLIVEDRAB
-        self['olivedrab1'] = self.OLIVEDRAB1
-        self['olivedrab2'] = self.OLIVEDRAB2
-        self['olivedrab3'] = self.OLIVEDRAB3
-        self['olivedrab4'] = self.OLIVEDRAB4
-        self['orange'] = self.ORANGE
-        self['orange1'] = self.ORANGE1
-        self['orange2'] = self.ORANGE2
-        self['orange3'] = self.ORANGE3
-        self['orange4'] = self.ORANGE4
-        self['orangered1'] = self.ORANGERED1
-        self['orangered2'] = self.ORANGERED2
-        self['orangered3'] = self.ORANGERED3
-        self['orangered4'] = self.ORANGERED4
-        self['orchid'] = self.ORCHID
-        self['orchid1'] = self.ORCHID1
-        self['orchid2'] = self.ORCHID2
-        self['orchid3'] = self.ORCHID3
-        self['orchid4'] = self.ORCHID4
-        self['palegoldenrod'] = self.PALEGOLDENROD
-        self['palegreen'] = self.PALEGREEN
-        self['palegreen1'] = self.PALEGREEN1
-        self['palegreen2'] = self.PALEGREEN2
-        self['palegreen3'] = self.PALEGREEN3
-        self['palegreen4'] = self.PALEGREEN4
-        self['paleturquoise1'] = self.PALETURQUOISE1
-        self['paleturquoise2'] = self.PALETURQUOISE2
-        self['paleturquoise3'] = self.PALETURQUOISE3
-        self['paleturquoise4'] = self.PALETURQUOISE4
-        self['palevioletred'] = self.PALEVIOLETRED
-        self['palevioletred1'] = self.PALEVIOLETRED1
-        self['palevioletred2'] = self.PALEVIOLETRED2
-        self['palevioletred3'] = self.PALEVIOLETRED3
-        self['palevioletred4'] = self.PALEVIOLETRED4
-        self['papayawhip'] = self.PAPAYAWHIP
-        self['peachpuff1'] = self.PEACHPUFF1
-        self['peachpuff2'] = self.PEACHPUFF2
-        self['peachpuff3'] = self.PEACHPUFF3
-        self['peachpuff4'] = self.PEACHPUFF4
-        self['peacock'] = self.PEACOCK
-        self['pink'] = self.PINK
-        self['pink1'] = self.PINK1
-        self['pink2'] = self.PINK2
-        self['pink3'] = self.PINK3
-        self['pink4'] = self.PINK4
-        self['plum'] = self.PLUM
-        self['plum1'] = self.PLUM1
-        self['plum2'] = self.PLUM2
-        self['plum3'] = self.PLUM3
-        self['plum4'] = self.PLUM4
-        self['powderblue'] = self.POWDERBLUE
-        self['purple'] = self.PURPLE
-        self['purple1'] = self.PURPLE1
-        self['purple2'] = self.PURPLE2
-        self['purple3'] = self.PURPLE3
-        self['purple4'] = self.PURPLE4
-        self['raspberry'] = self.RASPBERRY
-        self['rawsienna'] = self.RAWSIENNA
-        self['red1'] = self.RED1
-        self['red2'] = self.RED2
-        self['red3'] = self.RED3
-        self['red4'] = self.RED4
-        self['rosybrown'] = self.ROSYBROWN
-        self['rosybrown1'] = self.ROSYBROWN1
-        self['rosybrown2'] = self.ROSYBROWN2
-        self['rosybrown3'] = self.ROSYBROWN3
-        self['rosybrown4'] = self.ROSYBROWN4
-        self['royalblue'] = self.ROYALBLUE
-        self['royalblue1'] = self.ROYALBLUE1
-        self['royalblue2'] = self.ROYALBLUE2
-        self['royalblue3'] = self.ROYALBLUE3
-        self['royalblue4'] = self.ROYALBLUE4
-        self['salmon'] = self.SALMON
-        self['salmon1'] = self.SALMON1
-        self['salmon2'] = self.SALMON2
-        self['salmon3'] = self.SALMON3
-        self['salmon4'] = self.SALMON4
-        self['sandybrown'] = self.SANDYBROWN
-        self['sapgreen'] = self.SAPGREEN
-        self['seagreen1'] = self.SEAGREEN1
-        self['seagreen2'] = self.SEAGREEN2
-        self['seagreen3'] = self.SEAGREEN3
-        self['seagreen4'] = self.SEAGREEN4
-        self['seashell1'] = self.SEASHELL1
-        self['seashell2'] = self.SEASHELL2
-        self['seashell3'] = self.SEASHELL3
-        self['seashell4'] = self.SEASHELL4
-        self['sepia'] = self.SEPIA
-        self['sgibeet'] = self.SGIBEET
-        self['sgibrightgray'] = self.SGIBRIGHTGRAY
-        self['sgichartreuse'] = self.SGICHARTREUSE
-        self['sgidarkgray'] = self.SGIDARKGRAY
-        self['sgigray12'] = self.SGIGRAY12
-        self['sgigray16'] = self.SGIGRAY16
-        self['sgigray32'] = self.SGIGRAY32
-        self['sgigray36'] = self.SGIGRAY36
-        self['sgigray52'] = self.SGIGRAY52
-        self['sgigray56'] = self.SGIGRAY56
-        self['sgigray72'] = self.SGIGRAY72
-        self['sgigray76'] = self.SGIGRAY76
-        self['sgigray92'] = self.SGIGRAY92
-        self['sgigray96'] = self.SGIGRAY96
-        self['sgilightblue'] = self.SGILIGHTBLUE
-        self['sgilightgray'] = self.SGILIGHTGRAY
-        self['sgiolivedrab'] = self.SGIOLIVEDRAB
-        self['sgisalmon'] = self.SGISALMON
-        self['sgislateblue'] = self.SGISLATEBLUE
-        self['sgiteal'] = self.SGITEAL
-        self['sienna'] = self.SIENNA
-        self['sienna1'] = self.SIENNA1
-        self['sienna2'] = self.SIENNA2
-        self['sienna3'] = self.SIENNA3
-        self['sienna4'] = self.SIENNA4
-        self['silver'] = self.SILVER
-        self['skyblue'] = self.SKYBLUE
-        self['skyblue1'] = self.SKYBLUE1
-        self['skyblue2'] = self.SKYBLUE2
-        self['skyblue3'] = self.SKYBLUE3
-        self['skyblue4'] = self.SKYBLUE4
-        self['slateblue'] = self.SLATEBLUE
-        self['slateblue1'] = self.SLATEBLUE1
-        self['slateblue2'] = self.SLATEBLUE2
-        self['slateblue3'] = self.SLATEBLUE3
-        self['slateblue4'] = self.SLATEBLUE4
-        self['slategray'] = self.SLATEGRAY
-        self['slategray1'] = self.SLATEGRAY1
-        self['slategray2'] = self.SLATEGRAY2
-        self['slategray3'] = self.SLATEGRAY3
-        self['slategray4'] = self.SLATEGRAY4
-        self['snow1'] = self.SNOW1
-        self['snow2'] = self.SNOW2
-        self['snow3'] = self.SNOW3
-        self['snow4'] = self.SNOW4
-        self['springgreen'] = self.SPRINGGREEN
-        self['springgreen1'] = self.SPRINGGREEN1
-        self['springgreen2'] = self.SPRINGGREEN2
-        self['springgreen3'] = self.SPRINGGREEN3
-        self['steelblue'] = self.STEELBLUE
-        self['steelblue1'] = self.STEELBLUE1
-        self['steelblue2'] = self.STEELBLUE2
-        self['steelblue3'] = self.STEELBLUE3
-        self['steelblue4'] = self.STEELBLUE4
-        self['tan'] = self.TAN
-        self['tan1'] = self.TAN1
-        self['tan2'] = self.TAN2
-        self['tan3'] = self.TAN3
-        self['tan4'] = self.TAN4
-        self['teal'] = self.TEAL
-        self['thistle'] = self.THISTLE
-        self['thistle1'] = self.THISTLE1
-        self['thistle2'] = self.THISTLE2
-        self['thistle3'] = self.THISTLE3
-        self['thistle4'] = self.THISTLE4
-        self['tomato1'] = self.TOMATO1
-        self['tomato2'] = self.TOMATO2
-        self['tomato3'] = self.TOMATO3
-        self['tomato4'] = self.TOMATO4
-        self['turquoise'] = self.TURQUOISE
-        self['turquoise1'] = self.TURQUOISE1
-        self['turquoise2'] = self.TURQUOISE2
-        self['turquoise3'] = self.TURQUOISE3
-        self['turquoise4'] = self.TURQUOISE4
-        self['turquoiseblue'] = self.TURQUOISEBLUE
-        self['violet'] = self.VIOLET
-        self['violetred'] = self.VIOLETRED
-        self['violetred1'] = self.VIOLETRED1
-        self['violetred2'] = self.VIOLETRED2
-        self['violetred3'] = self.VIOLETRED3
-        self['violetred4'] = self.VIOLETRED4
-        self['warmgrey'] = self.WARMGREY
-        self['wheat'] = self.WHEAT
-        self['wheat1'] = self.WHEAT1
-        self['wheat2'] = self.WHEAT2
-        self['wheat3'] = self.WHEAT3
-        self['wheat4'] = self.WHEAT4
-        self['white'] = self.WHITE
-        self['whitesmoke'] = self.WHITESMOKE
-        self['yellow1'] = self.YELLOW1
-        self['yellow2'] = self.YELLOW2
-        self['yellow3'] = self.YELLOW3
-        self['yellow4'] = self.YELLOW4
+        super().__init__(_named_colors())
+
+    def __getattr__(self, name):
+        try:
+            return _constants()[name]
+        except KeyError:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
         
     def __str__(self) -> str:
         return super().__str__()
@@ -1184,4 +256,75 @@ class Colors(OrderedDict):
         raise a ValueError.
         """
         c = self.hex_to_color(h)
-        return self.color_to_text(c)
\ No newline at end of file
+        return self.color_to_text(c)
+
+class ColorTable(Colors):
+    """
+    A read-only Colors dictionary with precomputed lookup indexes. Building
+    Colors assigns every named color one at a time, so code that only reads
+    colors should use the shared table returned by color_table() instead of
+    creating a new Colors object each time.
+
+    Instance Attributes:
+        by_color: dict, Color -> name, the first name listed for each Color
+        by_hex: dict, hex str (upper case) -> Color for every named color
+    """
+    def __init__(self):
+        self._frozen = False
+        super().__init__()
+        self.by_color = {}
+        for name, color in self.items():
+            # color_to_text returns the first name listed for an RGB combo.
+            self.by_color.setdefault(color, name)
+        self.by_hex = {self.color_to_hex(c): c for c in self.by_color}
+        self._frozen = True
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError("ColorTable is read-only. Use Colors() for a mutable copy.")
+
+    def __setitem__(self, key, value):
+        if self._frozen:
+            self._read_only()
+        super().__setitem__(key, value)
+
+    __delitem__ = _read_only
+    clear = _read_only
+    pop = _read_only
+    popitem = _read_only
+    setdefault = _read_only
+    update = _read_only
+    move_to_end = _read_only
+
+    def copy(self):
+        """
+        Returns a mutable Colors object with the same contents.
+        """
+        return Colors()
+
+    def color_to_text(self, c : Color):
+        """
+        Returns the color name (str) associated with the rgb combo provided
+        in the argument. Will raise a ValueError if the rgb combo is not found.
+        """
+        try:
+            return self.by_color[c]
+        except KeyError:
+            raise ValueError(f"{c} has no string name assigned to it.")
+
+    def hex_to_color(self, h):
+        """
+        Returns a Color object from the hex representation. If the hex
+        representation is invalid, it will raise a ValueError.
+        """
+        try:
+            return self.by_hex[h.upper()]
+        except (KeyError, AttributeError):
+            return super().hex_to_color(h)
+
+@lru_cache(maxsize=None)
+def color_table() -> ColorTable:
+    """
+    Returns the ColorTable shared by the whole process. It is built the first
+    time it is requested.
+    """
+    return ColorTable()
@@ -0,0 +1,177 @@
+import numpy as np
+from lib.classes import BasicWalk
+from lib.markov import (transition_matrix, stationary_distribution,
+                        mixing_time, zone_masks, set_dwell)
+
+# Exact comparison of Hex Flower variants. Each flower, and each flower with
+# one edge blocked, is a transition matrix; all of them are stacked and
+# solved together, so a report over dozens of variants costs a few batched
+# linear algebra calls and no simulation.
+
+EDGES = 'abcdef'
+
+def edge_variants(hf, P=None) -> tuple:
+    """
+    Returns (edges, Ps) for a HexFlower: edges is a list of (hex id, edge,
+    target hex id) for every open edge that leads to another hex, and Ps is
+    a stack of transition matrices, one per edge, each the walk with that
+    edge blocked. Blocking an edge turns the rolls along it into stays.
+    """
+    if P is None:
+        P = transition_matrix(hf)
+    outcomes = BasicWalk.flower_outcomes(hf)
+    weight = dict.fromkeys(EDGES, 0.0)
+    for roll, prob in zip(hf.dice_set.rolls.tolist(), hf.dice_set.probs.tolist()):
+        if outcomes.get(roll):
+            weight[outcomes[roll]] += prob
+    edges = [(hex.id, k, hex.adjacency[k]) for hex in hf.hexes for k in EDGES
+             if hex.adjacency[k] not in (None, hex.id) and weight[k] > 0.0]
+    Ps = np.repeat(P[None], len(edges), axis=0)
+    for v, (i, k, j) in enumerate(edges):
+        Ps[v, i - 1, j - 1] -= weight[k]
+        Ps[v, i - 1, i - 1] += weight[k]
+    return edges, Ps
+
+def _metrics(hf, Ps, pis, mixing) -> list:
+    # One metrics dictionary per matrix of the stack, all for hf's zones.
+    zones = {t: (pis[:, mask].sum(axis=-1), np.atleast_1d(set_dwell(Ps, pis, mask)))
+             for t, mask in zone_masks(hf).items()}
+    return [{'stationary': pis[v],
+             'zones': {t: {'frequency': float(f[v]), 'dwell': float(d[v])}
+                       for t, (f, d) in zones.items()},
+             'mixing_time': float(mixing[v])}
+            for v in range(len(Ps))]
+
+def _difference(new, old) -> dict:
+    # new - old for two metrics dictionaries. Zone types missing from one
+    # side count as never visited there.
+    empty = {'frequency': 0.0, 'dwell': 0.0}
+    zones = {}
+    for t in list(old['zones']) + [t for t in new['zones'] if t not in old['zones']]:
+        a, b = new['zones'].get(t, empty), old['zones'].get(t, empty)
+        zones[t] = {key: a[key] - b[key] for key in ('frequency', 'dwell')}
+    return {'stationary': new['stationary'] - old['stationary'],
+            'zones': zones,
+            'mixing_time': new['mixing_time'] - old['mixing_time']}
+
+def compare_flowers(flowers: dict, sensitivity=True, eps=0.25,
+                    max_steps=1000) -> dict:
+    """
+    This function compares Hex Flowers exactly. The first flower is the
+    baseline the others are compared with.
+
+    Arguments:
+        flowers: dict, name -> HexFlower, all with the same number of hexes
+        sensitivity: bool, optional, also work out the effect of blocking
+            each open edge of every flower
+        eps, max_steps: optional, the mixing time settings, see
+            lib.markov.mixing_time
+
+    Returns a dictionary with:
+        'flowers': name -> metrics, where metrics holds the 'stationary'
+            array (in hex id order), 'zones' (zone type -> 'frequency' and
+            'dwell'), and the 'mixing_time'
+        'differences': name -> metrics of that flower minus the baseline's,
+            for every flower after the first
+        'sensitivity': name -> list of (hex id, edge, target, change), where
+            change is the metrics with that edge blocked minus the flower's
+    """
+    names = list(flowers)
+    if not names:
+        raise ValueError("At least one Hex Flower is needed.")
+    sizes = {len(hf.hexes) for hf in flowers.values()}
+    if len(sizes) > 1:
+        raise ValueError("Hex Flowers with different numbers of hexes cannot be compared.")
+    stacks, edges = [], {}
+    for name in names:
+        hf = flowers[name]
+        P = transition_matrix(hf)
+        stacks.append(P[None])
+        if sensitivity:
+            edges[name], Ps = edge_variants(hf, P)
+            stacks.append(Ps)
+    Ps = np.concatenate(stacks)
+    pis = stationary_distribution(Ps)
+    mixing = np.atleast_1d(mixing_time(Ps, eps, max_steps, pis))
+
+    report = {'flowers': {}, 'differences': {}, 'sensitivity': {}}
+    at = 0
+    for name in names:
+        count = 1 + (len(edges[name]) if sensitivity else 0)
+        part = slice(at, at + count)
+        metrics = _metrics(flowers[name], Ps[part], pis[part], mixing[part])
+        at += count
+        report['flowers'][name] = metrics[0]
+        if sensitivity:
+            report['sensitivity'][name] = [
+                (i, k, j, _difference(m, metrics[0]))
+                for (i, k, j), m in zip(edges[name], metrics[1:])]
+    base = report['flowers'][names[0]]
+    for name in names[1:]:
+        report['differences'][name] = _difference(report['flowers'][name], base)
+    return report
+
+def _plain(value):
+    # Arrays to lists and infinities to None, for JSON.
+    if isinstance(value, dict):
+        return {k: _plain(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple, np.ndarray)):
+        return [_plain(v) for v in value]
+    if isinstance(value, (float, np.floating)):
+        return None if not np.isfinite(value) else float(value)
+    if isinstance(value, np.integer):
+        return int(value)
+    return value
+
+def comparison_json(report) -> dict:
+    """
+    Returns the report of compare_flowers as plain JSON data. Infinite
+    values, such as the mixing time of a walk that never mixes, are None.
+    """
+    return _plain(report)
+
+def format_comparison(report, top=5) -> str:
+    """
+    Returns the report of compare_flowers as text: the zone frequencies and
+    dwell times of every flower with their change from the baseline, the
+    mixing times, the hexes whose share of time changed most, and the top
+    edges of each flower by their effect on the zone frequencies.
+    """
+    names = list(report['flowers'])
+    base = names[0]
+    lines = [f"Baseline: {base}"]
+    zones = []
+    for name in names:
+        zones += [t for t in report['flowers'][name]['zones'] if t not in zones]
+    for key, title in (('frequency', 'Zone frequency'), ('dwell', 'Zone dwell (steps)')):
+        lines.append(f"{title}:")
+        lines.append("  " + f"{'zone':<14}" + "".join(f"{n[:18]:>20}" for n in names))
+        for t in zones:
+            row = f"  {t!s:<14}"
+            for name in names:
+                value = report['flowers'][name]['zones'].get(t, {}).get(key)
+                cell = '-' if value is None else f"{value:.4f}"
+                if name != base and value is not None:
+                    cell += f" ({report['differences'][name]['zones'][t][key]:+.4f})"
+                row += f"{cell:>20}"
+            lines.append(row)
+    lines.append("Mixing time (steps):")
+    for name in names:
+        lines.append(f"  {name}: {report['flowers'][name]['mixing_time']:g}")
+    for name in names[1:]:
+        change = report['differences'][name]['stationary']
+        order = np.argsort(-np.abs(change))[:top]
+        lines.append(f"Largest changes in share of time, {name} vs {base}:")
+        for i in order:
+            lines.append(f"  hex {i + 1:<3} {change[i]:+.4f}")
+    for name, edges in report['sensitivity'].items():
+        def size(edge):
+            return max((abs(z['frequency']) for z in edge[3]['zones'].values()), default=0.0)
+        lines.append(f"Most sensitive edges of {name} (blocked):")
+        for i, k, j, change in sorted(edges, key=size, reverse=True)[:top]:
+            effects = ", ".join(f"{t} {z['frequency']:+.4f}"
+                                for t, z in change['zones'].items()
+                                if abs(z['frequency']) >= 5e-5)
+            lines.append(f"  hex {i} edge {k} -> {j}: {effects or 'no change'}; "
+                         f"mixing {change['mixing_time']:+g}")
+    return "\n".join(lines)
@@ -0,0 +1,162 @@
+import bisect, random, re
+import numpy as np
+
+# One term of a dice expression: an optional sign, then either NdM dice or a
+# plain number modifier.
+_TERM = re.compile(r'\s*([+-]?)\s*(?:(\d*)\s*[dD]\s*(\d+)|(\d+))\s*')
+
+class Dice():
+    """
+    This class parses any combination of dice and modifiers and precomputes
+    the exact distribution of their total by convolution, so a roll is one
+    random number and a binary search no matter how many dice there are.
+
+    Dice can be given as a string such as '2d6', 'd6+d8', '3d4+1', or
+    '2d6-d4', or in the tuple form Hex Flowers have always used, such as
+    ('d6', 'd6') or (None, 'd8'), where None entries are ignored and each
+    entry may itself be an expression.
+
+    Instance Attributes:
+        expression: str, the normalized dice expression, such as '2d6+1',
+            with dice added before dice subtracted and fewest faces first
+        terms: list of tuples (sign, count, faces), faces is 0 for a modifier
+        rolls: np.ndarray, every possible total, smallest first
+        probs: np.ndarray, the probability of each total in rolls
+
+    Methods:
+        roll: rolls the dice and returns the total
+        distribution: returns {total: probability}
+    """
+    def __init__(self, dice):
+        if isinstance(dice, Dice):
+            dice = dice.expression
+        if isinstance(dice, (tuple, list)):
+            parts = [str(d) for d in dice if d is not None and d != 'null']
+            text = '+'.join(parts)
+        elif isinstance(dice, str):
+            text = dice
+        else:
+            raise ValueError(f"{dice} is not a valid dice expression.")
+        text = text.replace('(', '').replace(')', '').replace(',', '+')
+        text = re.sub(r'\+\s*([+-])', r'\1', text)
+        self.terms = []
+        pos = 0
+        while pos < len(text):
+            m = _TERM.match(text, pos)
+            if m is None or m.end() == pos:
+                raise ValueError(f"{dice} is not a valid dice expression.")
+            sign = -1 if m.group(1) == '-' else 1
+            if m.group(3) is not None:
+                count = int(m.group(2) or 1)
+                faces = int(m.group(3))
+                if count < 1 or faces < 1:
+                    raise ValueError(f"{dice} has a die with no faces or no dice.")
+                self.terms.append((sign, count, faces))
+            else:
+                self.terms.append((sign, int(m.group(4)), 0))
+            pos = m.end()
+        if not any(faces for _, _, faces in self.terms):
+            raise ValueError(f"{dice} does not contain any dice.")
+        # Merge like dice, so ('d6', 'd6') and '2d6' are the same Dice, and
+        # add up the modifiers. Dice are kept in one order, added before
+        # subtracted and fewest faces first, so 'd8+d6' and 'd6+d8' are the
+        # same Dice too.
+        merged = {}
+        modifier = 0
+        for sign, count, faces in self.terms:
+            if faces:
+                merged[(sign, faces)] = merged.get((sign, faces), 0) + count
+            else:
+                modifier += sign * count
+        self.terms = [(sign, merged[(sign, faces)], faces)
+                      for sign, faces in sorted(merged, key=lambda k: (-k[0], k[1]))]
+        if modifier:
+            self.terms.append((1 if modifier > 0 else -1, abs(modifier), 0))
+        self.expression = self._normalize()
+        self._convolve()
+
+    def _normalize(self) -> str:
+        s = ''
+        for sign, count, faces in self.terms:
+            term = f"{count if count > 1 else ''}d{faces}" if faces else str(count)
+            s += ('-' if sign < 0 else '+') + term
+        return s.lstrip('+')
+
+    def _convolve(self):
+        # The distribution of the total is the convolution of the
+        # distributions of every die. low tracks the smallest total.
+        probs = np.ones(1)
+        low = 0
+        for sign, count, faces in self.terms:
+            if not faces:
+                low += sign * count
+                continue
+            die = np.full(faces, 1.0 / faces)
+            for _ in range(count):
+                probs = np.convolve(probs, die)
+                low += 1 if sign > 0 else -faces
+        self.rolls = np.arange(low, low + len(probs))
+        self.probs = probs
+        self._totals = self.rolls.tolist()
+        self._cum = np.cumsum(probs).tolist()
+        self._cum[-1] = 1.0
+
+    def __repr__(self) -> str:
+        return f"Dice('{self.expression}')"
+
+    def __str__(self) -> str:
+        return self.expression
+
+    def __eq__(self, other) -> bool:
+        try:
+            return self.expression == Dice(other).expression
+        except ValueError:
+            return False
+
+    def __hash__(self) -> int:
+        return hash(self.expression)
+
+    def distribution(self) -> dict:
+        """
+        Returns the exact probability of every total as {total: probability}.
+        """
+        return dict(zip(self._totals, self.probs.tolist()))
+
+    def roll(self, rng=random) -> int:
+        """
+        Rolls the dice and returns the total. rng is anything with a random()
+        method, the random module by default.
+        """
+        return self._totals[bisect.bisect_right(self._cum, rng.random())]
+
+def parse_roll_range(value: str) -> list:
+    """
+    Returns the totals named by a roll value in an outcome table, either a
+    single total such as '7' or an inclusive range such as '3-5' or '-2--1'.
+    """
+    m = re.fullmatch(r'\s*(-?\d+)\s*(?:-\s*(-?\d+)\s*)?', str(value))
+    if m is None:
+        raise ValueError(f"{value} is not a roll or a range of rolls.")
+    low = int(m.group(1))
+    high = int(m.group(2)) if m.group(2) is not None else low
+    if high < low:
+        raise ValueError(f"{value} is an empty range of rolls.")
+    return list(range(low, high + 1))
+
+def check_outcomes(dice: Dice, outcomes: dict) -> dict:
+    """
+    Checks that an outcome table (roll -> edge 'a' through 'f', or None for a
+    blocked move) covers every total the dice can roll, and returns it with
+    integer keys. Raises a ValueError otherwise.
+    """
+    table = {}
+    for roll, edge in outcomes.items():
+        if edge == 'null':
+            edge = None
+        if edge is not None and edge not in ('a', 'b', 'c', 'd', 'e', 'f'):
+            raise ValueError(f"Outcome {edge} for roll {roll} must be a, b, c, d, e, f, or null.")
+        table[int(roll)] = edge
+    missing = [r for r in dice.rolls.tolist() if r not in table]
+    if missing:
+        raise ValueError(f"The outcome table has no entry for rolls {missing} of {dice}.")
+    return table
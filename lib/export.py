@@ -0,0 +1,225 @@
+import base64, csv, io, os
+from xml.sax.saxutils import escape
+from lib.colors import color_table
+from lib.palette import flower_palette
+from lib.icons import ICON_SIZE, load_icon
+
+# Headless rendering of a HexFlower. Nothing here imports tkinter, and PIL is
+# only imported when an image is actually made, so these functions work on a
+# server with no display. The drawing follows drawHexFlower: the same polygons
+# (HexFlower.polygons), fill colors, darken_outline outlines, and icons.
+
+def _css(color):
+    # tkinter color names such as 'gray50' are not all known to PIL or SVG,
+    # so every named color is passed on as hex.
+    if color is None or color.startswith('#'):
+        return color
+    return color_table().text_to_hex(color)
+
+def _scaled(hf, scale):
+    # Returns the polygons and centers of the flower zoomed by scale.
+    corners, centers = hf.geometry.transform(hf.side, zoom=scale)
+    ids = hf.geometry.ids.tolist()
+    return (dict(zip(ids, corners.reshape(len(ids), 12).tolist())),
+            dict(zip(ids, map(tuple, centers.tolist()))))
+
+def _fill_palette(hf, fills):
+    # The flower palette with any fills given in its place.
+    palette = flower_palette(hf)
+    for hex_id, fill in (fills or {}).items():
+        palette[hex_id] = (fill, palette[hex_id][1])
+    return palette
+
+def render_image(hf, width=3, scale=1.0, background='white', fills=None,
+                 diagnostic=False):
+    """
+    This function draws the Hex Flower into a PIL Image without a Tk display.
+    The image is hf.canvas_width by hf.canvas_height pixels times scale.
+
+    Arguments:
+        hf: HexFlower, the Hex Flower to draw
+        width: int, optional, width of the hex outlines before scaling,
+            default 3
+        scale: float, optional, zoom factor for the whole image, default 1.0
+        background: str or None, optional, color name or hex for the
+            background, None for a transparent one, default 'white'
+        fills: dict or None, optional, {hex.id: color} fills to use instead
+            of the zone colors, for example from lib.heatmap.heat_fills
+        diagnostic: bool, optional, print progress to stdio
+    """
+    from PIL import Image, ImageDraw, ImageFont
+    size = (max(1, round(hf.canvas_width * scale)),
+            max(1, round(hf.canvas_height * scale)))
+    image = Image.new('RGBA', size, _css(background) or (0, 0, 0, 0))
+    draw = ImageDraw.Draw(image)
+    polygons, centers = _scaled(hf, scale)
+    palette = _fill_palette(hf, fills)
+    line = max(1, round(width * scale))
+    icon_size = tuple(max(1, round(v * scale)) for v in ICON_SIZE)
+    try:
+        font = ImageFont.load_default(size=max(6, round(12 * scale)))
+    except TypeError:
+        # Pillow before 10.1 only has the one fixed size default font.
+        font = ImageFont.load_default()
+    for hex in hf.hexes:
+        fill, outline = palette[hex.id]
+        draw.polygon(polygons[hex.id], fill=_css(fill), outline=_css(outline),
+                     width=line)
+        x_c, y_c = centers[hex.id]
+        if hex.zone.icon:
+            icon = load_icon(hex.zone.icon, icon_size)
+            corner = (round(x_c - icon.width / 2), round(y_c - icon.height / 2))
+            mask = icon if icon.mode in ('RGBA', 'LA') else None
+            image.paste(icon, corner, mask)
+        else:
+            draw.text((x_c, y_c), hex.zone.label, fill='black', font=font,
+                      anchor='mm')
+        if diagnostic:
+            print(f"Rendered hex {hex.id} with fill {fill} and outline {outline}")
+    return image
+
+def export_png(hf, path, width=3, scale=1.0, background='white', fills=None,
+               diagnostic=False):
+    """
+    This function renders the Hex Flower with render_image and saves it to
+    path as a PNG. It returns path.
+    """
+    image = render_image(hf, width=width, scale=scale, background=background,
+                         fills=fills, diagnostic=diagnostic)
+    image.save(path, format='PNG')
+    return path
+
+def _icon_uri(icon, size):
+    # Returns the resized icon as a base64 PNG data URI for SVG <image>.
+    buffer = io.BytesIO()
+    load_icon(icon, size).save(buffer, format='PNG')
+    return "data:image/png;base64," + base64.b64encode(buffer.getvalue()).decode('ascii')
+
+def render_svg(hf, width=3, scale=1.0, background='white', fills=None):
+    """
+    This function returns the Hex Flower as an SVG document (str). Icons are
+    embedded as PNG data, so the SVG does not depend on the icon files. PIL is
+    only needed if the flower has icons. fills works as for render_image.
+    """
+    size = (hf.canvas_width * scale, hf.canvas_height * scale)
+    polygons, centers = _scaled(hf, scale)
+    palette = _fill_palette(hf, fills)
+    icon_size = tuple(max(1, round(v * scale)) for v in ICON_SIZE)
+    icons = {}
+    lines = ['<svg xmlns="http://www.w3.org/2000/svg" '
+             'width="{:g}" height="{:g}" viewBox="0 0 {:g} {:g}">'.format(
+                size[0], size[1], size[0], size[1])]
+    if background is not None:
+        lines.append('<rect width="100%" height="100%" fill="{}"/>'.format(
+            _css(background)))
+    for hex in hf.hexes:
+        fill, outline = palette[hex.id]
+        points = polygons[hex.id]
+        lines.append('<polygon id="hex{}" points="{}" fill="{}" stroke="{}" '
+                     'stroke-width="{:g}"/>'.format(
+            hex.id,
+            ' '.join('{:g},{:g}'.format(x, y) for x, y in zip(points[0::2], points[1::2])),
+            _css(fill) or 'none', _css(outline), width * scale))
+        x_c, y_c = centers[hex.id]
+        if hex.zone.icon:
+            if hex.zone.icon not in icons:
+                icons[hex.zone.icon] = _icon_uri(hex.zone.icon, icon_size)
+            lines.append('<image x="{:g}" y="{:g}" width="{}" height="{}" '
+                         'href="{}"/>'.format(x_c - icon_size[0] / 2,
+                         y_c - icon_size[1] / 2, icon_size[0], icon_size[1],
+                         icons[hex.zone.icon]))
+        else:
+            lines.append('<text x="{:g}" y="{:g}" font-size="{:g}" '
+                         'text-anchor="middle" dominant-baseline="central">'
+                         '{}</text>'.format(x_c, y_c, 12 * scale,
+                                            escape(hex.zone.label)))
+    lines.append('</svg>')
+    return '\n'.join(lines) + '\n'
+
+def export_svg(hf, path, width=3, scale=1.0, background='white', fills=None):
+    """
+    This function writes the Hex Flower to path as an SVG file. It returns
+    path.
+    """
+    with open(path, 'w', encoding='utf-8') as myfile:
+        myfile.write(render_svg(hf, width=width, scale=scale,
+                                background=background, fills=fills))
+    return path
+
+def read_walk_log(path) -> list:
+    """
+    This function reads a CSV walk log written by BasicWalk.showMove, rows of
+    hex_id, zone, effect, and returns the hex ids in order.
+    """
+    with open(path, newline='') as myfile:
+        return [int(row[0]) for row in csv.reader(myfile) if row]
+
+def walk_frames(hf, moves, width=3, scale=1.0, highlight='yellow',
+                background='white'):
+    """
+    This generator yields one PIL Image for each move of a walk, with the
+    Hex of that move outlined in the highlight color. The flower itself is
+    rendered once as a palette image and every frame is a copy of it with
+    only the highlight drawn on top, so long walks are cheap to animate.
+
+    Arguments:
+        hf: HexFlower, the Hex Flower walked on
+        moves: list, the moves, either BasicWalk.moves style tuples
+            (hex_id, zone, effect) or plain hex ids
+        width, scale, background: optional, as for render_image
+        highlight: str, optional, color of the current Hex outline
+    """
+    from PIL import ImageDraw
+    base = render_image(hf, width=width, scale=scale,
+                        background=background or 'white').convert('RGB')
+    # Quantizing once here means the frames never have to be. Index 255 is
+    # kept free for the highlight color.
+    base = base.quantize(colors=255)
+    palette = (base.getpalette() + [0] * 768)[:768]
+    palette[765:768] = list(color_table().hex_to_color(_css(highlight)))
+    base.putpalette(palette)
+    polygons, centers = _scaled(hf, scale)
+    line = max(1, round((width + 2) * scale))
+    for move in moves:
+        hex_id = move[0] if isinstance(move, (tuple, list)) else int(move)
+        frame = base.copy()
+        ImageDraw.Draw(frame).polygon(polygons[hex_id], outline=255, width=line)
+        yield frame
+
+def export_walk_gif(hf, moves, path, duration=500, loop=0, width=3,
+                    scale=1.0, highlight='yellow', background='white'):
+    """
+    This function saves a walk as an animated GIF with one frame per move,
+    each shown for duration milliseconds. loop=0 repeats forever. The frames
+    are made by walk_frames. It returns path.
+    """
+    frames = walk_frames(hf, moves, width=width, scale=scale,
+                         highlight=highlight, background=background)
+    first = next(frames, None)
+    if first is None:
+        raise ValueError("A walk animation needs at least one move.")
+    # The frames already share one palette, so Pillow's palette optimization
+    # would only slow the encoding down.
+    first.save(path, format='GIF', save_all=True, append_images=frames,
+               duration=duration, loop=loop, optimize=False)
+    return path
+
+def export_walk_frames(hf, moves, directory, prefix='move', width=3,
+                       scale=1.0, highlight='yellow', background='white') -> list:
+    """
+    This function writes a walk as a numbered PNG image sequence into
+    directory, for example to feed a video encoder. Frames are written as
+    they are made, so memory use does not grow with the walk length. It
+    returns the paths written.
+    """
+    os.makedirs(directory, exist_ok=True)
+    moves = list(moves)
+    digits = len(str(max(len(moves) - 1, 0)))
+    paths = []
+    for n, frame in enumerate(walk_frames(hf, moves, width=width, scale=scale,
+                                          highlight=highlight,
+                                          background=background)):
+        path = os.path.join(directory, f"{prefix}_{n:0{digits}d}.png")
+        frame.save(path, format='PNG')
+        paths.append(path)
+    return paths
@@ -0,0 +1,108 @@
+import math
+from functools import lru_cache
+import numpy as np
+
+COS60 = math.cos(math.pi / 3)
+SIN60 = math.sin(math.pi / 3)
+
+# Corners of a hex with a side of 1, relative to Hex.vertex, in the same
+# clockwise order drawHexFlower has always used.
+UNIT_CORNERS = np.array([[0.0, 0.0],
+                         [1.0, 0.0],
+                         [1.0 + COS60, SIN60],
+                         [1.0, 2 * SIN60],
+                         [0.0, 2 * SIN60],
+                         [-COS60, SIN60]])
+
+class FlowerGeometry():
+    """
+    This class holds the geometry of a Hex Flower layout for a side of 1: the
+    vertex, center, and six corners of every hex. It is computed once per
+    layout. Any side length, zoom, and pan are then applied to the whole
+    flower at once as an affine transform of these arrays.
+
+    Instance Attributes:
+        ids: np.ndarray, hex ids in the order of the arrays below
+        vertices: np.ndarray, (n, 2) unit vertex of each hex
+        centers: np.ndarray, (n, 2) unit center of each hex
+        corners: np.ndarray, (n, 6, 2) unit corners of each hex
+
+    Methods:
+        transform: returns the corners and centers for a side, zoom, and pan
+        vertex: returns the vertex of one hex for a side length
+        polygons: returns {hex_id: [x1, y1, ..., x6, y6]} for drawing
+        hex_at: returns the hex id under each of a set of points
+    """
+    def __init__(self, columns):
+        ids, vertices = [], []
+        for i, column in enumerate(columns):
+            x = (i + 1) * COS60 + i
+            for n, hex_id in enumerate(column):
+                if hex_id is not None:
+                    ids.append(hex_id)
+                    vertices.append((x, SIN60 * (i % 2) + n * 2 * SIN60))
+        order = np.argsort(ids)
+        self.ids = np.array(ids)[order]
+        self.vertices = np.array(vertices)[order]
+        self.centers = self.vertices + [COS60, SIN60]
+        self.corners = self.vertices[:, np.newaxis, :] + UNIT_CORNERS
+        self._index = {int(k): n for n, k in enumerate(self.ids)}
+
+    def __repr__(self) -> str:
+        return "FlowerGeometry(hexes={})".format(len(self.ids))
+
+    def transform(self, side=20.0, zoom=1.0, pan=(0.0, 0.0)):
+        """
+        Returns (corners, centers) scaled by side * zoom and moved by pan.
+        If pan is an (k, 2) array of offsets, the flower is tiled k times and
+        both arrays get a leading axis of length k.
+        """
+        pan = np.asarray(pan, dtype=float)
+        scale = side * zoom
+        if pan.ndim == 2:
+            return (self.corners * scale + pan[:, np.newaxis, np.newaxis, :],
+                    self.centers * scale + pan[:, np.newaxis, :])
+        return self.corners * scale + pan, self.centers * scale + pan
+
+    def vertex(self, hex_id: int, side=20.0) -> tuple:
+        """
+        Returns the (x, y) vertex of one hex for a side length.
+        """
+        x, y = self.vertices[self._index[hex_id]] * side
+        return (float(x), float(y))
+
+    def polygons(self, side=20.0, zoom=1.0, pan=(0.0, 0.0)) -> dict:
+        """
+        Returns the corners of every hex as {hex_id: [x1, y1, ..., x6, y6]},
+        the form tkinter and PIL take for a polygon.
+        """
+        corners, _ = self.transform(side, zoom, pan)
+        flat = corners.reshape(len(self.ids), 12).tolist()
+        return dict(zip(self.ids.tolist(), flat))
+
+    def hex_at(self, points, side=20.0, zoom=1.0, pan=(0.0, 0.0)) -> np.ndarray:
+        """
+        Returns the id of the hex containing each (x, y) point, or 0 for
+        points outside the flower. points may be one point or an (m, 2)
+        array of them.
+        """
+        p = np.asarray(points, dtype=float).reshape(-1, 2)
+        _, centers = self.transform(side, zoom, pan)
+        d = p[:, np.newaxis, :] - centers[np.newaxis, :, :]
+        nearest = (d ** 2).sum(axis=2).argmin(axis=1)
+        dx, dy = np.abs(d[np.arange(len(p)), nearest]).T
+        r = side * zoom
+        # The hexes have flat tops and bottoms.
+        inside = (dy <= r * SIN60) & (SIN60 * dx + COS60 * dy <= r * SIN60)
+        return np.where(inside, self.ids[nearest], 0)
+
+@lru_cache(maxsize=None)
+def _geometry(columns: tuple) -> FlowerGeometry:
+    return FlowerGeometry(columns)
+
+def flower_geometry(columns: dict) -> FlowerGeometry:
+    """
+    Returns the shared FlowerGeometry of a layout given as a dictionary of
+    columns like HexFlower.hfcolumns.
+    """
+    return _geometry(tuple(tuple(columns[k]) for k in sorted(columns)))
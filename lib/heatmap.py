@@ -0,0 +1,47 @@
+import numpy as np
+from lib.markov import transition_matrix, stationary_distribution, expected_dwell
+from lib.palette import color_ramp
+from lib.simulation import visit_counts
+
+# The ways a Hex Flower can be shaded:
+#   frequency: share of visits to each hex in simulated or recorded walks
+#   stationary: exact long-run share of time in each hex
+#   dwell: expected number of steps in a row the walk stays in each hex
+HEAT_MODES = ('frequency', 'stationary', 'dwell')
+
+def heat_values(hf, mode='stationary', paths=None) -> np.ndarray:
+    """
+    Returns one number per hex of the HexFlower, in hex id order, for the
+    heatmap mode. The 'frequency' mode needs paths, an array of hex ids from
+    simulate_walks or any list of hex ids visited. The other modes are solved
+    exactly from the transition matrix.
+    """
+    if mode not in HEAT_MODES:
+        raise ValueError(f"mode must be one of {HEAT_MODES}")
+    if mode == 'frequency':
+        if paths is None:
+            raise ValueError("The 'frequency' heatmap needs walk paths.")
+        counts = visit_counts(paths, len(hf.hexes))
+        return counts / max(counts.sum(), 1)
+    P = transition_matrix(hf)
+    if mode == 'stationary':
+        return stationary_distribution(P)
+    return expected_dwell(P)
+
+def heat_fills(hf, values, colors=('white', 'red')) -> dict:
+    """
+    Returns {hex.id: hex color} shading each hex of the HexFlower by its
+    value on a gradient through colors.
+    """
+    return dict(zip((hex.id for hex in hf.hexes), color_ramp(values, colors)))
+
+def apply_heatmap(renderer, mode='stationary', paths=None,
+                  colors=('white', 'red')) -> np.ndarray:
+    """
+    Shades the Hex Flower drawn by a FlowerRenderer by mode. Only the fill of
+    the existing polygons changes; FlowerRenderer.clear_overlay puts the zone
+    colors back. Returns the values used.
+    """
+    values = heat_values(renderer.hf, mode=mode, paths=paths)
+    renderer.overlay(heat_fills(renderer.hf, values, colors))
+    return values
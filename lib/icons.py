@@ -0,0 +1,96 @@
+import os
+
+# The size Zone icons are drawn at in a Hex.
+ICON_SIZE = (30, 30)
+
+# Decoded PIL images and the Tk photo objects made from them are cached
+# separately, so code that never opens a window never touches tkinter. Both
+# caches map (path, size) to (mtime, image). An entry whose file has been
+# modified since it was decoded is replaced on the next request.
+_images = {}
+_photos = {}
+
+def icon_key(icon, size=ICON_SIZE) -> tuple:
+    """
+    Returns the cache key (path, size, mtime) for an icon file. The path is
+    made absolute so the same file is shared no matter how it was named.
+    """
+    path = os.path.abspath(icon)
+    return (path, tuple(size), os.path.getmtime(path))
+
+def load_icon(icon, size=ICON_SIZE):
+    """
+    Returns the icon file resized to size as a PIL Image. Each file is only
+    decoded and resized once for each size. The Image is shared, so callers
+    must copy it before drawing on it.
+    """
+    path, size, mtime = icon_key(icon, size)
+    cached = _images.get((path, size))
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    from PIL import Image
+    with Image.open(path) as source:
+        image = source.resize(size)
+    _images[(path, size)] = (mtime, image)
+    return image
+
+def photo_icon(icon, size=ICON_SIZE):
+    """
+    Returns an ImageTk.PhotoImage of the icon file that is shared by every
+    Zone using it. A Tk root window has to exist before this is called.
+    """
+    path, size, mtime = icon_key(icon, size)
+    cached = _photos.get((path, size))
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    from PIL import ImageTk
+    photo = ImageTk.PhotoImage(load_icon(path, size))
+    _photos[(path, size)] = (mtime, photo)
+    return photo
+
+def clear_icon_cache(photos_only=False):
+    """
+    Empties the icon caches. Tk photo objects belong to the Tk root they were
+    made under, so they should be cleared if that root is destroyed.
+    """
+    _photos.clear()
+    if not photos_only:
+        _images.clear()
+
+class IconAtlas():
+    """
+    Packs a set of icons into one RGBA sprite sheet so they can be pasted from
+    a single image.
+
+    Instance Attributes:
+        size: tuple, (width, height) of each icon in the atlas
+        image: PIL.Image, the sprite sheet
+        boxes: dict, absolute icon path -> (left, upper, right, lower) box of
+            that icon in image
+
+    Methods:
+        crop: returns the part of the atlas holding one icon
+    """
+    def __init__(self, icons, size=ICON_SIZE, columns=8):
+        from PIL import Image
+        self.size = tuple(size)
+        paths = list(dict.fromkeys(os.path.abspath(i) for i in icons))
+        columns = max(1, min(columns, len(paths)))
+        rows = -(-len(paths) // columns)
+        w, h = self.size
+        self.image = Image.new('RGBA', (columns * w, max(rows, 1) * h))
+        self.boxes = {}
+        for n, path in enumerate(paths):
+            x, y = (n % columns) * w, (n // columns) * h
+            self.image.paste(load_icon(path, self.size).convert('RGBA'), (x, y))
+            self.boxes[path] = (x, y, x + w, y + h)
+
+    def __repr__(self) -> str:
+        return "IconAtlas(icons={}, size={})".format(len(self.boxes), self.size)
+
+    def crop(self, icon):
+        """
+        Returns the icon as an RGBA PIL Image cut from the atlas. Raises a
+        KeyError if the icon was not packed into this atlas.
+        """
+        return self.image.crop(self.boxes[os.path.abspath(icon)])
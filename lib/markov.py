@@ -0,0 +1,223 @@
+import numpy as np
+from lib.classes import BasicWalk
+from lib.dice import Dice
+
+# A Basic Walk on a Hex Flower is a Markov chain on its hexes: where the walk
+# goes next only depends on the current hex and the dice roll. This module
+# turns a HexFlower into that chain, as a transition table for simulation and
+# as an exact transition matrix for analysis. Hex ids are 1-based everywhere
+# else in the package, while array rows and columns here are 0-based, so
+# hex id k is row k - 1.
+
+def dice_distribution(dice) -> tuple:
+    """
+    Returns (rolls, probs), the possible totals of dice such as ('d6', 'd6')
+    or '2d6+1' and the exact probability of each. See lib.dice.Dice.
+    """
+    dice = Dice(dice)
+    return dice.rolls, dice.probs
+
+def transition_table(hf) -> tuple:
+    """
+    Returns (table, probs) for a HexFlower. table is an int array of shape
+    (hexes, rolls) holding the 0-based index of the hex reached from each hex
+    on each possible roll, and probs is the probability of each roll. Blocked
+    edges and rolls without a direction keep the walk where it is.
+    """
+    rolls, probs = hf.dice_set.rolls, hf.dice_set.probs
+    outcomes = BasicWalk.flower_outcomes(hf)
+    n = len(hf.hexes)
+    table = np.empty((n, len(rolls)), dtype=np.intp)
+    for i, hex in enumerate(hf.hexes):
+        for r, roll in enumerate(rolls.tolist()):
+            new_hex = hex.adjacency.get(outcomes.get(roll))
+            table[i, r] = i if new_hex is None else new_hex - 1
+    return table, probs
+
+def table_to_matrix(table, probs) -> np.ndarray:
+    """
+    Returns the transition matrix P of a transition table, where P[i, j] is
+    the probability of moving from hex index i to hex index j in one step.
+    """
+    n = table.shape[0]
+    P = np.zeros((n, n))
+    rows = np.repeat(np.arange(n), table.shape[1])
+    np.add.at(P, (rows, table.ravel()), np.tile(probs, n))
+    return P
+
+def transition_matrix(hf) -> np.ndarray:
+    """
+    Returns the exact transition matrix of a Basic Walk on the HexFlower.
+    """
+    return table_to_matrix(*transition_table(hf))
+
+def stationary_distribution(P) -> np.ndarray:
+    """
+    Returns the long-run fraction of time the walk spends in each hex, the
+    probability vector pi with pi P = pi. For a reducible chain there is more
+    than one such vector and a least-squares one is returned. P may also be a
+    stack of matrices of shape (..., n, n), which are solved together.
+    """
+    P = np.asarray(P)
+    n = P.shape[-1]
+    A = np.swapaxes(P, -1, -2) - np.eye(n)
+    A[..., -1, :] = 1.0
+    b = np.zeros(P.shape[:-1] + (1,))
+    b[..., -1, 0] = 1.0
+    try:
+        pi = np.linalg.solve(A, b)[..., 0]
+    except np.linalg.LinAlgError:
+        flat_A, flat_b = A.reshape(-1, n, n), b.reshape(-1, n)
+        pi = np.array([np.linalg.lstsq(a, v, rcond=None)[0]
+                       for a, v in zip(flat_A, flat_b)]).reshape(P.shape[:-1])
+    pi = np.clip(pi, 0.0, None)
+    return pi / pi.sum(axis=-1, keepdims=True)
+
+def expected_dwell(P) -> np.ndarray:
+    """
+    Returns the expected number of consecutive steps spent in each hex once
+    the walk arrives there, 1 / (1 - P[i, i]). Hexes the walk can never leave
+    get infinity. P may be a stack of matrices.
+    """
+    stay = np.diagonal(P, axis1=-2, axis2=-1)
+    with np.errstate(divide='ignore'):
+        return np.where(stay < 1.0, 1.0 / (1.0 - stay), np.inf)
+
+def mixing_times(P, eps=0.25, max_steps=1000, pi=None) -> np.ndarray:
+    """
+    Returns, for each start hex, the number of steps after which the
+    distribution of the walk started there is within total variation
+    distance eps of the stationary distribution. This is the number of
+    warm-up steps to discard from that start. Starts that have not mixed
+    after max_steps (periodic walks never do) get infinity. P may be a stack
+    of matrices, giving an array of shape (..., n).
+    """
+    P = np.asarray(P)
+    if pi is None:
+        pi = stationary_distribution(P)
+    times = np.full(P.shape[:-1], np.inf)
+    Pt = P
+    for t in range(1, max_steps + 1):
+        distance = 0.5 * np.abs(Pt - pi[..., None, :]).sum(axis=-1)
+        times = np.where(np.isinf(times) & (distance <= eps), t, times)
+        if not np.isinf(times).any():
+            break
+        Pt = Pt @ P
+    return times
+
+def mixing_time(P, eps=0.25, max_steps=1000, pi=None):
+    """
+    Returns the mixing time of the walk: the number of steps after which the
+    distribution of the hex is within total variation distance eps of the
+    stationary distribution, whatever the start hex. The distance from each
+    start only shrinks with time, so this is the largest of mixing_times. P
+    may be a stack of matrices, in which case an array is returned.
+    """
+    times = mixing_times(P, eps, max_steps, pi).max(axis=-1)
+    return float(times) if np.ndim(times) == 0 else times
+
+def spectral_gap(P) -> float:
+    """
+    Returns the absolute spectral gap of the walk, 1 - |lambda_2|, where
+    lambda_2 is the eigenvalue of P of largest modulus after 1. The distance
+    from stationarity shrinks roughly by a factor |lambda_2| every step, so
+    1 / gap, the relaxation time, is the time scale of forgetting the start.
+    The gap is 0 for periodic walks and for walks that can get trapped in
+    more than one closed set of hexes.
+    """
+    moduli = np.sort(np.abs(np.linalg.eigvals(P)))[::-1]
+    if len(moduli) < 2:
+        return 1.0
+    gap = 1.0 - moduli[1]
+    # Round off eigenvalue noise, so periodic walks get exactly 0.
+    return float(gap) if gap > 1e-12 else 0.0
+
+def period(P) -> int:
+    """
+    Returns the period of an irreducible walk: the greatest common divisor
+    of the lengths of all the ways back to a hex. A walk with period 1 is
+    aperiodic. Found from the breadth first distances d from hex 1, as the
+    gcd of d[i] + 1 - d[j] over every possible move i -> j.
+    """
+    n = P.shape[0]
+    level = np.full(n, -1)
+    level[0] = 0
+    frontier = [0]
+    while frontier:
+        nxt = []
+        for i in frontier:
+            for j in np.flatnonzero(P[i] > 0):
+                if level[j] < 0:
+                    level[j] = level[i] + 1
+                    nxt.append(j)
+        frontier = nxt
+    rows, cols = np.nonzero(P > 0)
+    reached = (level[rows] >= 0) & (level[cols] >= 0)
+    return int(np.gcd.reduce(np.abs(level[rows] + 1 - level[cols])[reached]))
+
+def chain_diagnostics(hf, eps=0.25, max_steps=1000) -> dict:
+    """
+    Returns the diagnostics of a Basic Walk on the HexFlower as a
+    dictionary: 'irreducible' (every hex can reach every other), 'period'
+    (1 for an aperiodic walk), 'spectral_gap', 'relaxation_time' (1 / gap),
+    'mixing_time' (warm-up steps needed from the worst start), and
+    'mixing_times' (hex id -> warm-up steps needed from that start).
+    """
+    P = transition_matrix(hf)
+    pi = stationary_distribution(P)
+    gap = spectral_gap(P)
+    times = mixing_times(P, eps, max_steps, pi)
+    return {'irreducible': is_irreducible(P),
+            'period': period(P),
+            'spectral_gap': gap,
+            'relaxation_time': 1.0 / gap if gap > 0 else np.inf,
+            'mixing_time': float(times.max()),
+            'mixing_times': {hex.id: float(t) for hex, t in zip(hf.hexes, times)}}
+
+def is_irreducible(P) -> bool:
+    """
+    Returns True if every hex can be reached from every other hex, so the
+    walk has a single stationary distribution.
+    """
+    n = P.shape[0]
+    reach = (P > 0) | np.eye(n, dtype=bool)
+    # Squaring the reachability matrix doubles the path length it covers.
+    for _ in range(int(np.ceil(np.log2(max(n, 2))))):
+        reach = (reach.astype(np.int32) @ reach.astype(np.int32)) > 0
+    return bool(reach.all())
+
+def zone_masks(hf) -> dict:
+    """
+    Returns {zone type: boolean array}, marking the hexes of each zone type
+    in hex id order.
+    """
+    types = [hex.zone.type for hex in hf.hexes]
+    return {t: np.array([x == t for x in types]) for t in dict.fromkeys(types)}
+
+def set_dwell(P, pi, mask):
+    """
+    Returns the expected number of consecutive steps the walk spends in a set
+    of hexes once it enters it: the time in the set divided by the rate of
+    leaving it. A set the walk never leaves gets infinity. P and pi may be
+    stacks, in which case an array is returned.
+    """
+    P, pi = np.asarray(P), np.asarray(pi)
+    leave = (pi[..., mask] * P[..., mask, :][..., ~mask].sum(axis=-1)).sum(axis=-1)
+    inside = pi[..., mask].sum(axis=-1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        dwell = np.where(leave > 0.0, inside / np.where(leave > 0.0, leave, 1.0),
+                         np.where(inside > 0.0, np.inf, 0.0))
+    return float(dwell) if dwell.ndim == 0 else dwell
+
+def zone_statistics(hf, P=None) -> dict:
+    """
+    Returns {zone type: {'frequency': share of time, 'dwell': expected
+    consecutive steps}} for a Basic Walk on the HexFlower, solved exactly
+    from the transition matrix P (computed if not given).
+    """
+    if P is None:
+        P = transition_matrix(hf)
+    pi = stationary_distribution(P)
+    return {t: {'frequency': float(pi[mask].sum()),
+                'dwell': set_dwell(P, pi, mask)}
+            for t, mask in zone_masks(hf).items()}
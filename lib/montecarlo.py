@@ -0,0 +1,285 @@
+import time
+from statistics import NormalDist
+import numpy as np
+from lib.markov import (transition_table, transition_matrix,
+                        stationary_distribution, zone_masks)
+from lib.simulation import simulate_table, draw_uniforms, stratified_starts
+
+# Adaptive Monte Carlo. Walks are simulated in growing batches and the
+# requested statistics are tracked with confidence intervals; the run stops
+# as soon as every interval is narrow enough, instead of after a fixed, and
+# usually far too large, number of walks.
+
+# The statistics that can be estimated, each for a zone type or a hex id:
+#   frequency: share of the steps of a walk spent in the target
+#   hitting: probability that the walk reaches the target within its steps
+#   dwell: average number of steps in a row spent in the target
+STATISTICS = ('frequency', 'hitting', 'dwell')
+
+def parse_statistic(text) -> tuple:
+    """
+    Turns 'frequency:severe' or 'hitting:19' into ('frequency', 'severe') or
+    ('hitting', 19). Tuples are passed through.
+    """
+    if isinstance(text, (tuple, list)):
+        kind, target = text
+    else:
+        kind, sep, target = str(text).partition(':')
+        if not sep or not target:
+            raise ValueError(f"{text} is not a statistic. Use KIND:TARGET, e.g. frequency:severe.")
+        if target.isdigit():
+            target = int(target)
+    if kind not in STATISTICS:
+        raise ValueError(f"{kind} is not a statistic. Statistics must be {STATISTICS}.")
+    return kind, target
+
+def _target_mask(hf, target) -> np.ndarray:
+    # Boolean array over hex indexes for a zone type or a hex id.
+    if isinstance(target, (int, np.integer)):
+        if not 1 <= target <= len(hf.hexes):
+            raise ValueError(f"Hex id {target} is not in [1, {len(hf.hexes)}].")
+        mask = np.zeros(len(hf.hexes), dtype=bool)
+        mask[target - 1] = True
+        return mask
+    masks = zone_masks(hf)
+    if target not in masks:
+        raise ValueError(f"The Hex Flower has no zone type {target}.")
+    return masks[target]
+
+def walk_values(kind, inside) -> tuple:
+    """
+    Returns (x, y), one pair per walk, for a statistic of a batch of walks
+    whose steps are in the target where inside (shape (walks, steps + 1)) is
+    True. The statistic is sum(x) / sum(y) over all walks; y is 1 except for
+    dwell, the steps in the target over the number of runs in it.
+    """
+    ones = np.ones(inside.shape[0])
+    if kind == 'frequency':
+        return inside.mean(axis=1), ones
+    if kind == 'hitting':
+        return inside[:, 1:].any(axis=1).astype(float), ones
+    entries = inside[:, 0].astype(float) + (inside[:, 1:] & ~inside[:, :-1]).sum(axis=1)
+    return inside.sum(axis=1).astype(float), entries
+
+class RatioEstimate():
+    """
+    This class accumulates the sums needed for the ratio sum(x) / sum(y) of
+    per-walk values and its confidence interval by the delta method. When
+    every y is 1 this is the ordinary mean and standard error. With terms=2
+    it estimates the difference of two ratios, x1 / y1 - x2 / y2, from
+    walks that give values for both, as common random numbers do.
+
+    Instance Attributes:
+        terms: int, number of ratios, 1 or 2
+        n: int, number of walks (or antithetic pairs) added
+        sums: np.ndarray, running sums of the columns x1, y1, x2, y2, ...
+        products: np.ndarray, running sums of their pairwise products
+
+    Methods:
+        add: adds a batch of per-walk values
+        estimate: returns the ratio, or the difference of the ratios
+        half_width: returns the half width of the confidence interval
+    """
+    def __init__(self, terms=1):
+        self.terms = terms
+        self.n = 0
+        self.sums = np.zeros(2 * terms)
+        self.products = np.zeros((2 * terms, 2 * terms))
+
+    def add(self, values):
+        """
+        Adds values, an array of shape (walks, 2 * terms) holding the columns
+        x1, y1, x2, y2, ... of independent walks.
+        """
+        self.n += len(values)
+        self.sums += values.sum(axis=0)
+        self.products += values.T @ values
+
+    def _gradient(self) -> tuple:
+        means = self.sums / self.n
+        value, grad = 0.0, np.zeros_like(means)
+        for t in range(self.terms):
+            sign = 1.0 if t == 0 else -1.0
+            x, y = means[2 * t], means[2 * t + 1]
+            value += sign * x / y
+            grad[2 * t], grad[2 * t + 1] = sign / y, -sign * x / (y * y)
+        return value, grad
+
+    def estimate(self) -> float:
+        if self.n == 0 or np.any(self.sums[1::2] <= 0):
+            return np.nan
+        return float(self._gradient()[0])
+
+    def half_width(self, z) -> float:
+        if self.n < 2 or np.any(self.sums[1::2] <= 0):
+            return np.inf
+        n = self.n
+        means = self.sums / n
+        cov = (self.products - n * np.outer(means, means)) / (n - 1)
+        grad = self._gradient()[1]
+        var = float(grad @ cov @ grad)
+        if var <= 1e-15 * max(float(np.abs(grad @ means)) ** 2, 1e-300):
+            # Every walk agreed, e.g. none reached a rare hex yet. That says
+            # little about a small batch, so fall back to the z * z / n bound
+            # (the "rule of three" at 95%) instead of a zero width.
+            return float(z * z / n / means[1::2].min())
+        return float(z * np.sqrt(var / n))
+
+def _start_weights(hf, start):
+    # None for a fixed start hex, otherwise a start distribution over hexes.
+    if isinstance(start, str):
+        if start != 'stationary':
+            raise ValueError(f"{start} is not a start. Use a hex id, 'stationary', or weights.")
+        return stationary_distribution(transition_matrix(hf))
+    if np.ndim(start) == 0:
+        if not 1 <= start <= len(hf.hexes):
+            raise ValueError(f"Start must a valid hex id (integer [1, {len(hf.hexes)}])")
+        return None
+    weights = np.asarray(start, dtype=float)
+    if weights.shape != (len(hf.hexes),):
+        raise ValueError(f"Start weights need one weight per hex ({len(hf.hexes)}).")
+    return weights
+
+def _starts(start, weights, size, rng, stratify, antithetic) -> np.ndarray:
+    if weights is None:
+        return np.full(size, start)
+    if stratify:
+        return stratified_starts(weights, size, rng, pairs=antithetic)
+    count = (size + 1) // 2 if antithetic else size
+    starts = rng.choice(len(weights), count, p=weights / weights.sum()) + 1
+    return np.repeat(starts, 2)[:size] if antithetic else starts
+
+def _adaptive(flowers, start, steps, statistics, precision, relative,
+              confidence, batch, growth, max_walks, seed, antithetic, stratify,
+              common, caller, diagnostic) -> dict:
+    # The batch loop shared by adaptive_walks and adaptive_difference.
+    if not 0.0 < confidence < 1.0:
+        raise ValueError("confidence must be between 0 and 1.")
+    if precision <= 0.0:
+        raise ValueError("precision must be positive.")
+    if batch < 2 or growth < 1.0 or max_walks < 2:
+        raise ValueError("batch and max_walks must be at least 2 and growth at least 1.")
+    if not isinstance(steps, (int, np.integer)) or steps < 1:
+        raise ValueError("The number of steps must be a positive integer")
+    if len({len(hf.hexes) for hf in flowers}) > 1:
+        raise ValueError("Hex Flowers with different numbers of hexes cannot be compared.")
+    weights = _start_weights(flowers[0], start)
+    if stratify and weights is None:
+        raise ValueError("Stratified starts need a start distribution, not a single hex.")
+    specs = [parse_statistic(s) for s in statistics]
+    if not specs:
+        raise ValueError("At least one statistic is required.")
+    masks = [[_target_mask(hf, target) for _, target in specs] for hf in flowers]
+    names = [f"{kind}:{target}" for kind, target in specs]
+    z = NormalDist().inv_cdf(0.5 + confidence / 2.0)
+    tables = [transition_table(hf) for hf in flowers]
+    rng = np.random.default_rng(seed)
+    estimates = [RatioEstimate(len(flowers)) for _ in specs]
+
+    began = time.perf_counter()
+    walks, batches, size = 0, 0, int(batch)
+    converged = False
+    while walks < max_walks and not converged:
+        # Batches are rounded down to whole antithetic pairs before they are
+        # cut to the walks left, so max_walks is never passed.
+        left = max_walks - walks
+        if antithetic:
+            size, left = size - size % 2, left - left % 2
+        size = min(size, left)
+        if size < 2:
+            break
+        starts = _starts(start, weights, size, rng, stratify, antithetic)
+        columns = [[] for _ in specs]
+        for f, (table, probs) in enumerate(tables):
+            if f == 0 or common:
+                if f == 0:
+                    uniforms = draw_uniforms(size, steps, rng, antithetic)
+            else:
+                starts = _starts(start, weights, size, rng, stratify, antithetic)
+                uniforms = draw_uniforms(size, steps, rng, antithetic)
+            paths = simulate_table(table, probs, starts - 1, steps, uniforms=uniforms)
+            for i, (kind, _) in enumerate(specs):
+                columns[i].extend(walk_values(kind, masks[f][i][paths]))
+        for values, estimate in zip(columns, estimates):
+            values = np.column_stack(values)
+            if antithetic:
+                # The two walks of a pair are not independent, their average is.
+                values = values.reshape(-1, 2, values.shape[1]).mean(axis=1)
+            estimate.add(values)
+        walks += size
+        batches += 1
+        widths = [e.half_width(z) for e in estimates]
+        limits = [precision * abs(e.estimate()) if relative else precision
+                  for e in estimates]
+        converged = all(w <= limit for w, limit in zip(widths, limits))
+        if diagnostic:
+            print(f"{caller}: {walks} walks, widest interval "
+                  f"{max(w / max(l, 1e-300) for w, l in zip(widths, limits)):.3f} of target")
+        size = int(np.ceil(size * growth))
+
+    result = {'walks': walks, 'batches': batches,
+              'seconds': time.perf_counter() - began,
+              'converged': converged, 'statistics': {}}
+    for name, estimate in zip(names, estimates):
+        value, width = estimate.estimate(), estimate.half_width(z)
+        result['statistics'][name] = {'estimate': value, 'half_width': width,
+                                      'low': value - width, 'high': value + width}
+    return result
+
+def adaptive_walks(hf, start, steps, statistics, precision=0.005,
+                   relative=False, confidence=0.95, batch=1000, growth=2.0,
+                   max_walks=1000000, seed=None, antithetic=False,
+                   stratify=False, diagnostic=False) -> dict:
+    """
+    This function estimates statistics of Basic Walks on a HexFlower by
+    simulating batches of walks until every statistic is known to the
+    requested precision or max_walks is reached. Each batch is growth times
+    the size of the one before.
+
+    Arguments:
+        hf: HexFlower, the Hex Flower to walk on
+        start: int, str, or array, start hex id of every walk, 'stationary'
+            to start from the long-run distribution, or one weight per hex
+        steps: int, number of moves in each walk
+        statistics: list, e.g. ['frequency:severe', ('dwell', 'severe'),
+            'hitting:19'], see STATISTICS
+        precision: float, optional, the largest acceptable half width of the
+            confidence intervals
+        relative: bool, optional, precision is a fraction of each estimate
+        confidence: float, optional, confidence level of the intervals
+        batch: int, optional, walks in the first batch
+        growth: float, optional, factor by which batches grow
+        max_walks: int, optional, stop after this many walks regardless
+        seed: int or None, optional, random seed for repeatable runs
+        antithetic: bool, optional, simulate walks in antithetic pairs
+        stratify: bool, optional, spread the starts over the start
+            distribution in exact proportion. The intervals still treat the
+            starts as random, so they are conservative.
+        diagnostic: bool, optional, print progress after every batch
+
+    Returns a dictionary with 'walks' and 'batches' simulated, 'seconds'
+    taken, 'converged' (True if every interval met the precision), and
+    'statistics', 'kind:target' -> 'estimate', 'half_width', 'low', 'high'.
+    """
+    return _adaptive([hf], start, steps, statistics, precision, relative,
+                     confidence, batch, growth, max_walks, seed, antithetic,
+                     stratify, True, 'adaptive_walks', diagnostic)
+
+def adaptive_difference(hf, other, start, steps, statistics, precision=0.005,
+                        relative=False, confidence=0.95, batch=1000,
+                        growth=2.0, max_walks=1000000, seed=None,
+                        antithetic=False, stratify=False, common=True,
+                        diagnostic=False) -> dict:
+    """
+    This function estimates how statistics change from the HexFlower hf to
+    the variant other, as the value on hf minus the value on other, until
+    every difference is known to the requested precision. With common, the
+    default, walk k on both flowers uses the same start and the same random
+    numbers, so the noise of the two estimates largely cancels. The
+    arguments and result are as for adaptive_walks; 'walks' counts the
+    walks on each flower.
+    """
+    return _adaptive([hf, other], start, steps, statistics, precision,
+                     relative, confidence, batch, growth, max_walks, seed,
+                     antithetic, stratify, common, 'adaptive_difference',
+                     diagnostic)
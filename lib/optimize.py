@@ -0,0 +1,258 @@
+import math, os
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from lib.classes import HexFlower, BasicWalk
+from lib.markov import (table_to_matrix, stationary_distribution,
+                        is_irreducible, zone_masks, set_dwell)
+
+# Design search for Hex Flowers. A designer states goals for zone types, such
+# as "severe 5% of the time, 2 steps in a row on average", and the search
+# edits the Hex Flower to meet them. Every candidate is scored exactly from
+# its transition matrix, so there is no sampling noise and a candidate costs
+# one small linear solve.
+
+EDGES = 'abcdef'
+# The kinds of edits the search can make:
+#   adjacency: point an edge at another hex the Hex already borders
+#   block: block an open edge, or open a blocked one again
+#   outcomes: change the edge a single dice roll moves along
+MOVES = ('adjacency', 'block', 'outcomes')
+
+class FlowerSearch():
+    """
+    This class holds a Hex Flower as arrays for the design search, and
+    scores and edits candidate designs. A design is a pair (adjacency,
+    edges): adjacency is an int array of shape (hexes, 6) of 0-based hex
+    indexes with -1 for a blocked edge, and edges holds, for every possible
+    dice total, the index of the edge it moves along or -1 to stay put.
+
+    Arguments:
+        hf: HexFlower, the Hex Flower to start from
+        frequency: dict, optional, zone type -> target share of time
+        dwell: dict, optional, zone type -> target consecutive steps
+        moves: tuple of str, optional, the kinds of edits allowed, see MOVES
+        change_cost: float, optional, score added per edit, so that of two
+            designs that meet the goals equally well the one closer to hf wins
+
+    Instance Attributes:
+        spec: tuple, hf.pack(), the Hex Flower the edits are applied to
+        adjacency, edges: np.ndarray, the design of hf
+        rolls, probs: np.ndarray, the dice totals and their probabilities
+        neighbors: list of lists, the hex indexes each Hex may point to
+
+    Methods:
+        table: returns the transition table of a design
+        evaluate: returns (score, frequency, dwell) of a design
+        propose: returns a copy of a design with one random edit
+        anneal: simulated annealing from hf, returns the best design found
+        flower: returns a design as a HexFlower
+        changes: describes the edits of a design
+    """
+    def __init__(self, hf, frequency=None, dwell=None, moves=MOVES,
+                 change_cost=0.001):
+        self.frequency = dict(frequency or {})
+        self.dwell = dict(dwell or {})
+        if not self.frequency and not self.dwell:
+            raise ValueError("At least one frequency or dwell target is required.")
+        for kind in moves:
+            if kind not in MOVES:
+                raise ValueError(f"{kind} is not a design move. Moves must be {MOVES}.")
+        if not moves:
+            raise ValueError("At least one kind of design move is required.")
+        masks = zone_masks(hf)
+        for t, v in list(self.frequency.items()) + list(self.dwell.items()):
+            if t not in masks:
+                raise ValueError(f"The Hex Flower has no zone type {t}.")
+        for t, v in self.frequency.items():
+            if not 0.0 < v < 1.0:
+                raise ValueError(f"The frequency target for {t} must be between 0 and 1.")
+        for t, v in self.dwell.items():
+            if v < 1.0:
+                raise ValueError(f"The dwell target for {t} must be at least 1 step.")
+        self.masks = masks
+        self.moves = tuple(moves)
+        self.change_cost = change_cost
+        self.spec = hf.pack()
+        self.n = len(hf.hexes)
+        self.adjacency = np.array([[(hex.adjacency[k] or 0) - 1 for k in EDGES]
+                                   for hex in hf.hexes], dtype=np.intp)
+        self.rolls = hf.dice_set.rolls
+        self.probs = hf.dice_set.probs
+        outcomes = BasicWalk.flower_outcomes(hf)
+        self.edges = np.array([EDGES.index(outcomes[r]) if outcomes.get(r) else -1
+                               for r in self.rolls.tolist()], dtype=np.intp)
+        self.neighbors = [sorted(set(int(j) for j in row if j >= 0))
+                          for row in self.adjacency]
+
+    def table(self, adjacency, edges) -> np.ndarray:
+        """
+        Returns the transition table of a design, as lib.markov.transition_table.
+        """
+        step = adjacency[:, np.clip(edges, 0, None)]
+        stay = (edges < 0)[None, :] | (step < 0)
+        return np.where(stay, np.arange(self.n)[:, None], step)
+
+    def evaluate(self, adjacency, edges) -> tuple:
+        """
+        Returns (score, frequency, dwell) of a design, where frequency and
+        dwell hold the achieved value of each target. The score is the sum of
+        the squared relative errors plus change_cost per edit. Designs where
+        some hexes cannot be reached from others score infinity.
+        """
+        P = table_to_matrix(self.table(adjacency, edges), self.probs)
+        if not is_irreducible(P):
+            return math.inf, {}, {}
+        pi = stationary_distribution(P)
+        score = self.change_cost * self.count_changes(adjacency, edges)
+        frequency, dwell = {}, {}
+        for t, target in self.frequency.items():
+            frequency[t] = float(pi[self.masks[t]].sum())
+            score += ((frequency[t] - target) / target) ** 2
+        for t, target in self.dwell.items():
+            dwell[t] = set_dwell(P, pi, self.masks[t])
+            score += ((dwell[t] - target) / target) ** 2
+        return score, frequency, dwell
+
+    def count_changes(self, adjacency, edges) -> int:
+        return int((adjacency != self.adjacency).sum() + (edges != self.edges).sum())
+
+    def propose(self, adjacency, edges, rng) -> tuple:
+        """
+        Returns a copy of the design (adjacency, edges) with one random edit
+        of one of the allowed kinds.
+        """
+        adjacency, edges = adjacency.copy(), edges.copy()
+        kind = self.moves[rng.integers(len(self.moves))]
+        if kind == 'outcomes':
+            edges[rng.integers(len(edges))] = rng.integers(-1, 6)
+            return adjacency, edges
+        i, k = rng.integers(self.n), rng.integers(6)
+        if kind == 'block':
+            original = self.adjacency[i, k]
+            if adjacency[i, k] >= 0:
+                adjacency[i, k] = -1
+            elif original >= 0:
+                adjacency[i, k] = original
+            elif self.neighbors[i]:
+                adjacency[i, k] = self.neighbors[i][rng.integers(len(self.neighbors[i]))]
+        elif self.neighbors[i]:
+            adjacency[i, k] = self.neighbors[i][rng.integers(len(self.neighbors[i]))]
+        return adjacency, edges
+
+    def anneal(self, iterations=2000, seed=None, start_temp=0.001,
+               end_temp=1e-6) -> tuple:
+        """
+        Runs a simulated annealing search starting from the Hex Flower and
+        returns (score, adjacency, edges) of the best design seen. The
+        temperature falls geometrically from start_temp to end_temp.
+        """
+        rng = np.random.default_rng(seed)
+        current = (self.adjacency, self.edges)
+        score = self.evaluate(*current)[0]
+        best = (score,) + current
+        cooling = (end_temp / start_temp) ** (1.0 / max(iterations, 1))
+        temp = start_temp
+        for _ in range(iterations):
+            candidate = self.propose(*current, rng)
+            new = self.evaluate(*candidate)[0]
+            if new <= score or (new < math.inf and
+                                rng.random() < math.exp((score - new) / temp)):
+                current, score = candidate, new
+                if score < best[0]:
+                    best = (score,) + current
+            temp *= cooling
+        return best
+
+    def flower(self, adjacency, edges) -> HexFlower:
+        """
+        Returns the Hex Flower with the design applied. The outcome table is
+        only written out when the search changed it.
+        """
+        spec = list(self.spec)
+        spec[6] = bytes(int(j) + 1 for j in adjacency.ravel())
+        if not np.array_equal(edges, self.edges):
+            spec[7] = {r: EDGES[e] if e >= 0 else None
+                       for r, e in zip(self.rolls.tolist(), edges.tolist())}
+        return HexFlower.unpack(tuple(spec))
+
+    def changes(self, adjacency, edges) -> list:
+        """
+        Returns a description of every edit of the design, such as
+        'hex 4 edge b: 7 -> blocked' or 'roll 8: d -> e'.
+        """
+        def name(j, blocked):
+            return blocked if j < 0 else str(j + 1)
+        s = []
+        for i, k in zip(*np.nonzero(adjacency != self.adjacency)):
+            s.append(f"hex {i + 1} edge {EDGES[k]}: "
+                     f"{name(self.adjacency[i, k], 'blocked')} -> "
+                     f"{name(adjacency[i, k], 'blocked')}")
+        for r in np.nonzero(edges != self.edges)[0]:
+            old, new = self.edges[r], edges[r]
+            s.append(f"roll {self.rolls[r]}: {EDGES[old] if old >= 0 else 'stay'} -> "
+                     f"{EDGES[new] if new >= 0 else 'stay'}")
+        return s
+
+def _search(spec, frequency, dwell, moves, change_cost, iterations, seed) -> tuple:
+    # One annealing run, in a worker process. Only plain data crosses the
+    # process boundary.
+    search = FlowerSearch(HexFlower.unpack(spec), frequency, dwell, moves,
+                          change_cost)
+    return search.anneal(iterations, seed)
+
+def optimize_flower(hf, frequency=None, dwell=None, moves=MOVES,
+                    iterations=2000, restarts=None, processes=None, seed=None,
+                    change_cost=0.001, diagnostic=False) -> tuple:
+    """
+    This function searches for edits to a HexFlower that bring the long-run
+    share of time and the average run length of its zone types to targets,
+    for example frequency={'severe': 0.05}, dwell={'severe': 2}. Independent
+    annealing runs are spread over a pool of worker processes and the best
+    design wins.
+
+    Arguments:
+        hf: HexFlower, the Hex Flower to start from
+        frequency: dict, optional, zone type -> target share of time (0, 1)
+        dwell: dict, optional, zone type -> target consecutive steps (>= 1)
+        moves: tuple of str, optional, kinds of edits allowed, see MOVES
+        iterations: int, optional, candidates tried by each run
+        restarts: int or None, optional, independent runs, None uses one per
+            core
+        processes: int or None, optional, worker processes, None uses every
+            core and 1 searches in this process
+        seed: int or None, optional, random seed for repeatable searches
+        change_cost: float, optional, score added per edit
+        diagnostic: bool, optional, print the score of each run to stdio
+
+    Returns (HexFlower, report), the best design found and a dictionary with
+    its 'score', the achieved and target 'frequency' and 'dwell' of each
+    zone type as (achieved, target) tuples, and the list of 'changes'.
+    Raises a ValueError if no run found a design where every hex can be
+    reached from every other.
+    """
+    search = FlowerSearch(hf, frequency, dwell, moves, change_cost)
+    if restarts is None:
+        restarts = os.cpu_count() or 1
+    seeds = np.random.SeedSequence(seed).spawn(max(int(restarts), 1))
+    args = (search.spec, search.frequency, search.dwell, search.moves,
+            change_cost, iterations)
+    if processes == 1 or len(seeds) == 1:
+        results = [search.anneal(iterations, s) for s in seeds]
+    else:
+        with ProcessPoolExecutor(max_workers=processes) as pool:
+            results = list(pool.map(_search, *zip(*[args + (s,) for s in seeds])))
+    if diagnostic:
+        for n, result in enumerate(results):
+            print(f"optimize_flower: run {n} scored {result[0]:.6f}")
+    score, adjacency, edges = min(results, key=lambda r: r[0])
+    if math.isinf(score):
+        raise ValueError("No design was found where every hex can be reached "
+                         "from every other, so the targets cannot be measured. "
+                         "Allow more kinds of moves or start from a connected "
+                         "Hex Flower.")
+    score, frequency, dwell = search.evaluate(adjacency, edges)
+    report = {'score': score,
+              'frequency': {t: (frequency[t], v) for t, v in search.frequency.items()},
+              'dwell': {t: (dwell[t], v) for t, v in search.dwell.items()},
+              'changes': search.changes(adjacency, edges)}
+    return search.flower(adjacency, edges), report
@@ -0,0 +1,208 @@
+from functools import lru_cache
+import numpy as np
+from lib.colors import Color, color_table
+from lib.color_functions import check_outline_args, memo_get, memo_put
+
+def colors_to_array(fills, fill_type='str') -> np.ndarray:
+    """
+    Converts a sequence of colors into an (n, 3) array of RGB values. The
+    fill_type works the same way as it does for darken_outline: 'str' for color
+    names, 'hex' for hex representations, and 'rgb' for Color objects. A
+    ValueError is raised for any color name that is not defined.
+    """
+    x = color_table()
+    if fill_type == 'str':
+        rgb = [x.text_to_color(f) for f in fills]
+    elif fill_type == 'hex':
+        rgb = [x.hex_to_color(f) for f in fills]
+    else: # fill_type == 'rgb'
+        rgb = list(fills)
+    return np.array(rgb, dtype=np.int16).reshape(-1, 3)
+
+def array_to_hex(rgb: np.ndarray) -> list:
+    """
+    Returns the hex representations of an (n, 3) array of RGB values.
+    """
+    return ['#{:02X}{:02X}{:02X}'.format(*row) for row in rgb.tolist()]
+
+def darken_colors(fills, darken=40, fill_type='str', result='hex') -> list:
+    """
+    This is darken_outline for a whole sequence of colors. The colors that
+    have not been seen before are converted and darkened together in one NumPy
+    pass. Every result is stored in the memo darken_outline uses, so either
+    function gets later requests for the same color for free.
+
+    Arguments:
+        fills: list of colors, their form is determined by fill_type
+        darken: int, optional, defaults to 40
+        fill_type: str, valid options: 'hex', 'rgb', 'str', optional, default
+            'str'
+        result: str, valid options: 'hex', 'rgb', 'str', optional, default 'hex'
+
+    Like darken_outline, result='str' raises a ValueError when a darkened
+    color has no name.
+    """
+    fills = [tuple(f) if isinstance(f, list) else f for f in fills]
+    results = [memo_get((f, darken, fill_type, result)) for f in fills]
+    missing = list(dict.fromkeys(f for f, r in zip(fills, results) if r is None))
+    if missing:
+        amount = check_outline_args(darken, fill_type, result)
+        dark = np.maximum(colors_to_array(missing, fill_type) - amount, 0)
+        if result == 'hex':
+            values = array_to_hex(dark)
+        else:
+            values = [Color._make(row) for row in dark.tolist()]
+            if result == 'str':
+                x = color_table()
+                names = []
+                for c in values:
+                    try:
+                        names.append(x.color_to_text(c))
+                    except ValueError:
+                        raise ValueError(f"{c} does not have a string representation.")
+                values = names
+        computed = dict(zip(missing, values))
+        for f, value in computed.items():
+            memo_put((f, darken, fill_type, result), value)
+        results = [computed[f] if r is None else r for f, r in zip(fills, results)]
+    return results
+
+def flower_palette(hf, darken=40) -> dict:
+    """
+    Resolves the fill and outline colors of every Hex in a HexFlower in one
+    pass. Returns a dictionary of the form {hex.id: (fill, outline)}. A Hex
+    whose zone has no color gets a fill of None and a black outline.
+    """
+    colored = [hex for hex in hf.hexes if hex.zone.color]
+    outlines = darken_colors([hex.zone.color for hex in colored], darken=darken)
+    palette = {hex.id: (None, 'black') for hex in hf.hexes}
+    for hex, outline in zip(colored, outlines):
+        palette[hex.id] = (hex.zone.color, outline)
+    return palette
+
+class NearestColorIndex():
+    """
+    Finds the nearest named color for any RGB value without scanning the whole
+    color table. RGB space is cut into a grid of cells, and for every cell the
+    index keeps only the named colors that could be the closest one to some
+    point inside it. A query looks up its cell and compares against that short
+    candidate list, so it takes constant time. Distance is Euclidean in RGB
+    space, and ties go to the color listed first in Colors.
+
+    Class Attributes:
+        cell: int, the width of a grid cell along each RGB axis
+
+    Instance Attributes:
+        names: list of str, the name of each distinct named color
+        rgb: np.ndarray, (n, 3) RGB values matching names
+        candidates: np.ndarray, (cells, k) indexes into rgb for every grid
+            cell, padded with the index of a far away sentinel color
+
+    Methods:
+        nearest: returns the name of the nearest named color to one color
+        nearest_many: returns the names of the nearest named colors for a
+            sequence or array of colors
+    """
+    cell = 16
+
+    def __init__(self):
+        table = color_table()
+        self.names = list(table.by_color.values())
+        self.rgb = np.array(list(table.by_color.keys()), dtype=np.int32)
+        cells = 256 // self.cell
+        axis = np.arange(cells) * self.cell
+        lo = np.stack(np.meshgrid(axis, axis, axis, indexing='ij'), axis=-1).reshape(-1, 1, 3)
+        hi = lo + self.cell - 1
+        c = self.rgb[np.newaxis, :, :]
+        # Smallest and largest possible squared distance from each named
+        # color to any point of each cell.
+        near = np.maximum(np.maximum(lo - c, c - hi), 0)
+        far = np.maximum(np.abs(c - lo), np.abs(c - hi))
+        near = (near ** 2).sum(axis=2)
+        far = (far ** 2).sum(axis=2)
+        keep = near <= far.min(axis=1, keepdims=True)
+        width = keep.sum(axis=1).max()
+        # Column order keeps candidates sorted by table order so argmin breaks
+        # ties in favor of the first name listed.
+        sentinel = len(self.names)
+        order = np.argsort(~keep, axis=1, kind='stable')[:, :width]
+        self.candidates = np.where(np.take_along_axis(keep, order, axis=1), order, sentinel)
+        self._points = np.vstack([self.rgb, [[10000, 10000, 10000]]])
+
+    def __repr__(self) -> str:
+        return "NearestColorIndex(colors={}, candidates={})".format(
+            len(self.names), self.candidates.shape[1])
+
+    def nearest_many(self, colors) -> list:
+        """
+        Returns the name of the nearest named color for each color in colors,
+        which can be a sequence of Color objects or an (n, 3) array of RGB
+        values in the range 0-255.
+        """
+        c = np.asarray(colors, dtype=np.int32).reshape(-1, 3)
+        if c.size and (c.min() < 0 or c.max() > 255):
+            raise ValueError("RGB values must be between 0 and 255.")
+        cells = 256 // self.cell
+        q = c // self.cell
+        flat = (q[:, 0] * cells + q[:, 1]) * cells + q[:, 2]
+        cand = self.candidates[flat]
+        dist = ((self._points[cand] - c[:, np.newaxis, :]) ** 2).sum(axis=2)
+        best = cand[np.arange(len(c)), dist.argmin(axis=1)]
+        return [self.names[i] for i in best.tolist()]
+
+    def nearest(self, color) -> str:
+        """
+        Returns the name of the nearest named color to a single Color.
+        """
+        return self.nearest_many([color])[0]
+
+@lru_cache(maxsize=None)
+def nearest_color_index() -> NearestColorIndex:
+    """
+    Returns the NearestColorIndex shared by the process, building it the first
+    time it is needed.
+    """
+    return NearestColorIndex()
+
+def nearest_color_name(color, fill_type='rgb') -> str:
+    """
+    Returns the name of the named color closest to color. Unlike
+    Colors.color_to_text, this always has an answer. fill_type works the same
+    way as it does for darken_outline.
+    """
+    return nearest_color_names([color], fill_type)[0]
+
+def nearest_color_names(colors, fill_type='rgb') -> list:
+    """
+    Returns the names of the named colors closest to each color in colors.
+    This is meant for labeling many computed shades at once.
+    """
+    if isinstance(colors, np.ndarray):
+        rgb = colors
+    else:
+        rgb = colors_to_array(colors, fill_type)
+    return nearest_color_index().nearest_many(rgb)
+
+def color_ramp(values, colors=('white', 'red'), fill_type='str') -> list:
+    """
+    Maps every number in values to a color on a gradient through colors, in
+    one vectorized pass, and returns the hex representations. The smallest
+    value gets the first color and the largest the last. NaN values get the
+    first color and infinite ones the end of the ramp they point to.
+    """
+    v = np.asarray(values, dtype=float).ravel()
+    stops = colors_to_array(colors, fill_type).astype(float)
+    finite = v[np.isfinite(v)]
+    if finite.size == 0 or finite.max() == finite.min():
+        t = np.zeros_like(v)
+    else:
+        t = (v - finite.min()) / (finite.max() - finite.min())
+    t = np.clip(np.nan_to_num(t, nan=0.0, posinf=1.0, neginf=0.0), 0.0, 1.0)
+    if len(stops) == 1:
+        rgb = np.repeat(stops, len(t), axis=0)
+    else:
+        position = t * (len(stops) - 1)
+        lower = np.minimum(position.astype(int), len(stops) - 2)
+        frac = (position - lower)[:, np.newaxis]
+        rgb = stops[lower] + frac * (stops[lower + 1] - stops[lower])
+    return array_to_hex(np.rint(rgb).astype(int))
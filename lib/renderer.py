@@ -0,0 +1,159 @@
+from lib.palette import flower_palette
+from lib.icons import photo_icon
+
+class FlowerRenderer():
+    """
+    This class draws a HexFlower on a tkinter.Canvas using only canvas items:
+    a polygon for each Hex and a text or image item for its label or icon.
+    Every item is tagged 'hexflower' and 'hex<id>', and the item handles are
+    kept, so a walk only has to restyle the Hex it left and the Hex it moved
+    to instead of redrawing the whole flower.
+
+    Instance Attributes:
+        canvas: tkinter.Canvas, where the Hex Flower is drawn
+        hf: HexFlower, the Hex Flower being drawn
+        width: int, width of the Hex outlines
+        highlight_color: str, outline color of the current Hex
+        zoom: float, zoom factor applied on top of hf.side
+        pan: tuple, (x, y) offset of the drawing
+        points: dict, hex.id -> list of polygon coordinates
+        centers: dict, hex.id -> (x, y) center of the Hex
+        items: dict, hex.id -> {'polygon': item id, 'label': item id}
+        styles: dict, hex.id -> (fill, outline) used when not highlighted
+        current: int or None, hex.id of the highlighted Hex
+        overlaid: set, hex.id of every Hex whose fill an overlay replaced
+
+    Methods:
+        tag: returns the canvas tag of a Hex
+        draw: draws the whole Hex Flower, replacing any earlier drawing
+        highlight: moves the highlight to another Hex
+        restyle: changes the fill or outline of one Hex
+        view: zooms and pans the drawing without redrawing it
+        overlay: fills Hexes with other colors, such as a heatmap
+        clear_overlay: restores the fills changed by overlay
+    """
+    def __init__(self, canvas, hf, width=3, highlight_color='yellow',
+                 diagnostic=False):
+        self.canvas = canvas
+        self.hf = hf
+        self.width = width
+        self.highlight_color = highlight_color
+        self.items = {}
+        self.styles = {}
+        self.current = None
+        self.overlaid = set()
+        self.zoom = 1.0
+        self.pan = (0.0, 0.0)
+        self._place()
+        if diagnostic:
+            print(f"Hex points: {self.points}")
+
+    def __repr__(self) -> str:
+        return "FlowerRenderer(canvas={}, hf={}, width={}, current={})".format(
+            self.canvas, self.hf.type, self.width, self.current)
+
+    def _place(self):
+        # The unit geometry of the layout is shared, so placing the flower is
+        # one affine transform for the current side, zoom, and pan.
+        geometry = self.hf.geometry
+        corners, centers = geometry.transform(self.hf.side, self.zoom, self.pan)
+        ids = geometry.ids.tolist()
+        self.points = dict(zip(ids, corners.reshape(len(ids), 12).tolist()))
+        self.centers = dict(zip(ids, map(tuple, centers.tolist())))
+
+    @staticmethod
+    def tag(hex_id: int) -> str:
+        """
+        Returns the canvas tag shared by all items of the Hex hex_id.
+        """
+        return f"hex{hex_id}"
+
+    def draw(self, diagnostic=False):
+        """
+        Draws every Hex of the Hex Flower on the canvas. Anything drawn by an
+        earlier call is deleted first.
+        """
+        self.canvas.delete('hexflower')
+        self.items = {}
+        self.current = None
+        self.overlaid = set()
+        self.styles = flower_palette(self.hf)
+        for hex in self.hf.hexes:
+            tags = ('hexflower', self.tag(hex.id))
+            fill, outline = self.styles[hex.id]
+            polygon = self.canvas.create_polygon(self.points[hex.id],
+                outline=outline, fill=fill, width=self.width, tags=tags)
+            x_c, y_c = self.centers[hex.id]
+            if hex.zone.icon:
+                label = self.canvas.create_image(x_c, y_c, anchor='center',
+                    image=photo_icon(hex.zone.icon), tags=tags)
+            else:
+                label = self.canvas.create_text(x_c, y_c, anchor='center',
+                    text=hex.zone.label, tags=tags)
+            self.items[hex.id] = {'polygon': polygon, 'label': label}
+            if diagnostic:
+                print(f"Drew hex {hex.id} as items {self.items[hex.id]}")
+
+    def restyle(self, hex_id: int, fill=None, outline=None):
+        """
+        Changes the fill and/or outline of a single Hex. The new values become
+        the Hex's normal style, so they survive the highlight moving on.
+        """
+        old_fill, old_outline = self.styles[hex_id]
+        if fill is not None:
+            old_fill = fill
+        if outline is not None:
+            old_outline = outline
+        self.styles[hex_id] = (old_fill, old_outline)
+        options = {'fill': old_fill}
+        if hex_id != self.current:
+            options['outline'] = old_outline
+        self.canvas.itemconfigure(self.items[hex_id]['polygon'], **options)
+
+    def overlay(self, fills: dict):
+        """
+        Temporarily fills Hexes with other colors, such as a heatmap, given as
+        {hex.id: color}. Hexes not in fills keep their fill. Only the fill of
+        the polygons is changed, and clear_overlay restores it.
+        """
+        for hex_id, fill in fills.items():
+            self.canvas.itemconfigure(self.items[hex_id]['polygon'], fill=fill)
+            self.overlaid.add(hex_id)
+
+    def clear_overlay(self):
+        """
+        Puts back the zone fill of every Hex changed by overlay.
+        """
+        for hex_id in self.overlaid:
+            self.canvas.itemconfigure(self.items[hex_id]['polygon'],
+                                      fill=self.styles[hex_id][0])
+        self.overlaid = set()
+
+    def highlight(self, hex_id: int):
+        """
+        Marks hex_id as the current Hex of a walk. Only the previously
+        highlighted Hex and the new one are changed on the canvas.
+        """
+        if hex_id == self.current:
+            return
+        if self.current is not None:
+            self.canvas.itemconfigure(self.items[self.current]['polygon'],
+                outline=self.styles[self.current][1], width=self.width)
+        self.current = hex_id
+        polygon = self.items[hex_id]['polygon']
+        self.canvas.itemconfigure(polygon, outline=self.highlight_color,
+                                  width=self.width + 2)
+        self.canvas.tag_raise(self.tag(hex_id))
+
+    def view(self, zoom=1.0, pan=(0.0, 0.0)):
+        """
+        Zooms and pans the drawn Hex Flower. The existing canvas items are
+        moved with Canvas.coords instead of being drawn again, so this is
+        cheap enough to follow a mouse wheel or window resize.
+        """
+        self.zoom = zoom
+        self.pan = tuple(pan)
+        self._place()
+        for hex_id, items in self.items.items():
+            self.canvas.coords(items['polygon'], *self.points[hex_id])
+            self.canvas.coords(items['label'], *self.centers[hex_id])
@@ -0,0 +1,194 @@
+import csv, os
+import numpy as np
+from lib.walklog import HEADER
+
+# Run-length analytics over walk histories. A history is an array of hex ids,
+# either one walk or a (walks, steps + 1) array from simulate_walks. Hexes
+# are mapped to zone types, effects, or kept as hex ids by one array lookup,
+# and runs are found by comparing each step with the one before, so millions
+# of steps take a handful of array operations and no Python loop.
+
+GROUPINGS = ('zone', 'effect', 'hex')
+
+def walk_path(moves) -> np.ndarray:
+    """
+    Returns the hex ids of a walk as an array. moves may be BasicWalk.moves,
+    tuples of (hex_id, zone, effect), or hex ids.
+    """
+    moves = list(moves)
+    if moves and isinstance(moves[0], (tuple, list)):
+        moves = [move[0] for move in moves]
+    return np.asarray(moves, dtype=np.intp)
+
+def save_walk_paths(path, paths):
+    """
+    Saves walk paths from simulate_walks as a binary .npy log, the fastest
+    way to store and reload millions of steps.
+    """
+    np.save(path, np.asarray(paths, dtype=np.int8))
+
+def load_walk_paths(path, flower=None) -> tuple:
+    """
+    Loads a walk log and returns (paths, walks): the hex ids of every step
+    as a 1-D array and the walk number of every step, or None for a single
+    walk. Four kinds of log are read:
+        .npy: binary logs from save_walk_paths, one row per walk
+        seekable walk logs from 'cli.py walk --format log', read straight
+            through without the index
+        CSV with a header: logs from 'cli.py walk --format csv', where
+            flower picks the rows of one flower if the log holds several.
+            Each flower numbers its walks from 0, so walks are renumbered
+            in the order they appear and never join across flowers.
+        CSV without a header: logs from BasicWalk.showMove, rows of
+            hex_id, zone, effect, read as one walk
+    """
+    if os.path.splitext(path)[1].lower() == '.npy':
+        paths = np.load(path, mmap_mode='r')
+        if paths.ndim == 1:
+            return np.asarray(paths, dtype=np.intp), None
+        walks = np.repeat(np.arange(paths.shape[0]), paths.shape[1])
+        return np.asarray(paths, dtype=np.intp).ravel(), walks
+    with open(path, newline='') as myfile:
+        first = next(csv.reader(myfile), None)
+    if first is None:
+        return np.empty(0, dtype=np.intp), None
+    if tuple(first) == HEADER:
+        data = np.loadtxt(path, delimiter=',', skiprows=1, quotechar='"',
+                          usecols=(HEADER.index('walk'), HEADER.index('hex')),
+                          dtype=np.intp, ndmin=2)
+        return data[:, 1], data[:, 0]
+    if first[0] != 'flower':
+        paths = np.loadtxt(path, delimiter=',', usecols=0, dtype=np.intp, ndmin=1)
+        return paths, None
+    walk_col, hex_col = first.index('walk'), first.index('hex')
+    data = np.loadtxt(path, delimiter=',', skiprows=1, usecols=(walk_col, hex_col),
+                      quotechar='"', dtype=np.intp, ndmin=2)
+    names = np.loadtxt(path, delimiter=',', skiprows=1, usecols=0,
+                       quotechar='"', dtype=str, ndmin=1)
+    if flower is not None:
+        keep = names == flower
+        data, names = data[keep], names[keep]
+    if not len(data):
+        return data[:, 1], data[:, 0]
+    change = np.ones(len(data), dtype=bool)
+    change[1:] = (data[1:, 0] != data[:-1, 0]) | (names[1:] != names[:-1])
+    return data[:, 1], np.cumsum(change) - 1
+
+def run_length_encode(labels, walks=None) -> tuple:
+    """
+    Returns (values, lengths, starts, censored) for the runs of equal labels
+    in a 1-D array. Runs never cross from one walk to the next when walks,
+    the walk number of each label, is given. censored marks the runs cut
+    short by the start or end of a walk, whose true length is unknown.
+    """
+    labels = np.asarray(labels).ravel()
+    n = len(labels)
+    if n == 0:
+        empty = np.empty(0, dtype=np.intp)
+        return labels, empty, empty, np.empty(0, dtype=bool)
+    edge = np.zeros(n + 1, dtype=bool)
+    edge[0] = edge[n] = True
+    if walks is not None:
+        walks = np.asarray(walks).ravel()
+        edge[1:n] = walks[1:] != walks[:-1]
+    change = edge[:n].copy()
+    change[1:] |= labels[1:] != labels[:-1]
+    starts = np.flatnonzero(change)
+    lengths = np.diff(np.append(starts, n))
+    censored = edge[starts] | edge[starts + lengths]
+    return labels[starts], lengths, starts, censored
+
+def hex_labels(hf, by='zone') -> list:
+    """
+    Returns the label of every hex of the HexFlower in hex id order: its
+    zone type, its zone effect, or its hex id.
+    """
+    if by not in GROUPINGS:
+        raise ValueError(f"by must be one of {GROUPINGS}")
+    if by == 'zone':
+        return [hex.zone.type for hex in hf.hexes]
+    if by == 'effect':
+        return [str(hex.zone.effect) for hex in hf.hexes]
+    return [hex.id for hex in hf.hexes]
+
+def analyze_walks(hf, paths, walks=None, by='zone', complete_only=False) -> dict:
+    """
+    This function works out how long the walk stays in each zone type,
+    effect, or hex, and how it moves between them.
+
+    Arguments:
+        hf: HexFlower, the Hex Flower walked on
+        paths: array, hex ids, either one walk, a (walks, steps + 1) array
+            from simulate_walks, or a 1-D array with walks given
+        walks: array or None, optional, the walk number of each step
+        by: str, optional, 'zone', 'effect', or 'hex'
+        complete_only: bool, optional, leave out runs cut short by the start
+            or end of a walk, which otherwise shorten the averages
+
+    Returns a dictionary with 'by', 'steps' (number of steps read), 'runs'
+    (label -> 'runs', 'steps', 'mean', 'max', and 'lengths', an array
+    whose entry k is the number of runs of length k), and 'transitions'
+    (label -> label -> share of the steps out of the first label that land
+    in the second, counting stays).
+    """
+    paths = np.asarray(paths)
+    if paths.ndim == 2 and walks is None:
+        walks = np.repeat(np.arange(paths.shape[0]), paths.shape[1])
+    paths = paths.ravel().astype(np.intp)
+    if len(paths) and (paths.min() < 1 or paths.max() > len(hf.hexes)):
+        raise ValueError(f"Walk paths must hold hex ids [1, {len(hf.hexes)}].")
+    names = list(dict.fromkeys(hex_labels(hf, by)))
+    lookup = np.array([names.index(x) for x in hex_labels(hf, by)], dtype=np.intp)
+    codes = lookup[paths - 1]
+    k = len(names)
+
+    values, lengths, starts, censored = run_length_encode(codes, walks)
+    if complete_only:
+        values, lengths = values[~censored], lengths[~censored]
+    longest = int(lengths.max()) if len(lengths) else 0
+    runs = np.bincount(values, minlength=k)
+    steps = np.bincount(values, weights=lengths, minlength=k)
+    top = np.zeros(k, dtype=np.intp)
+    np.maximum.at(top, values, lengths)
+    histogram = np.bincount(values * (longest + 1) + lengths,
+                            minlength=k * (longest + 1)).reshape(k, longest + 1)
+
+    # Step to step moves between labels, leaving out the joins between walks.
+    pairs = codes[:-1] * k + codes[1:]
+    if walks is not None:
+        walks = np.asarray(walks).ravel()
+        pairs = pairs[walks[1:] == walks[:-1]]
+    counts = np.bincount(pairs, minlength=k * k).reshape(k, k)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        shares = np.nan_to_num(counts / counts.sum(axis=1, keepdims=True))
+
+    report = {'by': by, 'steps': len(paths), 'runs': {}, 'transitions': {}}
+    for i, name in enumerate(names):
+        report['runs'][name] = {
+            'runs': int(runs[i]), 'steps': int(steps[i]),
+            'mean': float(steps[i] / runs[i]) if runs[i] else 0.0,
+            'max': int(top[i]), 'lengths': histogram[i]}
+        report['transitions'][name] = {names[j]: float(shares[i, j])
+                                       for j in range(k) if counts[i, j]}
+    return report
+
+def format_runs(report, lengths=8) -> str:
+    """
+    Returns the report of analyze_walks as text, with the share of runs of
+    each length up to lengths and the longer ones together.
+    """
+    lines = [f"{report['steps']} steps by {report['by']}",
+             f"  {'label':<20}{'runs':>9}{'mean':>8}{'max':>6}  share of runs of length 1.."
+             f"{lengths}, longer"]
+    for name, run in report['runs'].items():
+        hist = run['lengths'][1:]
+        total = max(run['runs'], 1)
+        shares = [hist[i] / total if i < len(hist) else 0.0 for i in range(lengths)]
+        shares.append(hist[lengths:].sum() / total)
+        lines.append(f"  {name!s:<20}{run['runs']:>9}{run['mean']:>8.3f}{run['max']:>6}  "
+                     + " ".join(f"{s:.3f}" for s in shares))
+    lines.append("Transitions (share of steps from each row):")
+    for name, row in report['transitions'].items():
+        moves = ", ".join(f"{to} {share:.3f}" for to, share in row.items())
+        lines.append(f"  {name!s:<20}{moves}")
+    return "\n".join(lines)
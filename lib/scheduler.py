@@ -0,0 +1,161 @@
+import queue, threading
+
+class WalkScheduler():
+    """
+    This class plays a walk on the tkinter event loop without blocking it. An
+    engine makes the moves, by default in a background thread, and puts them
+    on a thread-safe queue. The Tk thread takes one move off the queue every
+    interval milliseconds using root.after and hands it to on_move, so the
+    window stays responsive while the walk runs and can be paused, resumed, or
+    stopped at any time.
+
+    Instance Attributes:
+        root: tkinter.Tk, the window whose event loop runs the walk
+        walk: BasicWalk (or any object with step()), the walk to play
+        interval: int, milliseconds between displayed moves
+        on_move: callable, called on the Tk thread as on_move(number, move)
+        on_finish: callable or None, called on the Tk thread as
+            on_finish(stopped) when the walk ends or is stopped
+        threaded: bool, whether moves are made in a background thread
+        queue: queue.Queue, moves waiting to be displayed as (number, move)
+        state: str, 'ready', 'running', 'paused', 'finished', or 'stopped'
+        displayed: int, number of the last move handed to on_move, 0 before
+            the first, so walk.moves[:displayed + 1] is what was shown
+
+    Methods:
+        start: begins the walk
+        pause: stops displaying moves until resume is called
+        resume: continues a paused walk
+        stop: ends the walk early
+    """
+    # How often to check the queue when the engine has not caught up, in ms.
+    poll = 50
+
+    def __init__(self, root, walk, on_move, interval=3000, on_finish=None,
+                 threaded=True, buffer=256, diagnostic=False):
+        if not isinstance(interval, int) or interval < 0:
+            raise ValueError("interval must be a non-negative integer of milliseconds.")
+        self.root = root
+        self.walk = walk
+        self.interval = interval
+        self.on_move = on_move
+        self.on_finish = on_finish
+        self.threaded = threaded
+        self.diagnostic = diagnostic
+        self.queue = queue.Queue(maxsize=buffer)
+        self.state = 'ready'
+        self.displayed = 0
+        self._job = None
+        self._engine = None
+        self._done = threading.Event()
+        self._halt = threading.Event()
+
+    def __repr__(self) -> str:
+        return "WalkScheduler(walk={}, interval={}, state={})".format(
+            self.walk.current_move, self.interval, self.state)
+
+    def _next_move(self):
+        # Returns the next (number, move) of the walk, or None when done.
+        move = self.walk.step(diagnostic=self.diagnostic)
+        if move is None:
+            return None
+        return (self.walk.current_move, move)
+
+    def _produce(self):
+        # Engine thread: fills the queue until the walk ends or is stopped.
+        # The queue is bounded, so the engine waits for the display when it
+        # gets too far ahead.
+        while not self._halt.is_set():
+            item = self._next_move()
+            if item is None:
+                break
+            while not self._halt.is_set():
+                try:
+                    self.queue.put(item, timeout=0.1)
+                    break
+                except queue.Full:
+                    continue
+        self._done.set()
+
+    def _schedule(self, delay):
+        self._job = self.root.after(delay, self._tick)
+
+    def _cancel(self):
+        if self._job is not None:
+            self.root.after_cancel(self._job)
+            self._job = None
+
+    def _tick(self):
+        # Runs on the Tk thread: displays at most one move.
+        self._job = None
+        if self.state != 'running':
+            return
+        if self.threaded:
+            # Check _done before the queue so the last move is never missed.
+            done = self._done.is_set()
+            try:
+                item = self.queue.get_nowait()
+            except queue.Empty:
+                if done:
+                    self._finish('finished')
+                else:
+                    self._schedule(self.poll)
+                return
+        else:
+            item = self._next_move()
+            if item is None:
+                self._finish('finished')
+                return
+        self.displayed = item[0]
+        self.on_move(*item)
+        self._schedule(self.interval)
+
+    def _finish(self, state):
+        self._cancel()
+        self._halt.set()
+        if self._engine is not None:
+            # The engine stops within one queue timeout; after the join it no
+            # longer appends to walk.moves while on_finish reads them.
+            self._engine.join()
+            self._engine = None
+        self.state = state
+        if self.diagnostic:
+            print(f"Walk {state} at move {self.walk.current_move}.")
+        if self.on_finish is not None:
+            self.on_finish(state == 'stopped')
+
+    def start(self):
+        """
+        Begins the walk. The first move is displayed right away.
+        """
+        if self.state != 'ready':
+            raise RuntimeError(f"A walk that is {self.state} cannot be started.")
+        self.state = 'running'
+        if self.threaded:
+            self._engine = threading.Thread(target=self._produce, daemon=True)
+            self._engine.start()
+        self._schedule(0)
+
+    def pause(self):
+        """
+        Stops displaying moves until resume is called. Moves already made by
+        the engine stay on the queue.
+        """
+        if self.state == 'running':
+            self.state = 'paused'
+            self._cancel()
+
+    def resume(self):
+        """
+        Continues a paused walk with the next move.
+        """
+        if self.state == 'paused':
+            self.state = 'running'
+            self._schedule(0)
+
+    def stop(self):
+        """
+        Ends the walk early. Moves that have not been displayed are dropped.
+        """
+        if self.state in ('ready', 'running', 'paused'):
+            self._finish('stopped')
@@ -0,0 +1,216 @@
+import hashlib, sqlite3
+from datetime import datetime, timezone
+import numpy as np
+
+# SQLite store for walk results. Every batch of walks is a run, tagged with
+# its campaign, flower, seed, and time, so separate runs never blur together
+# the way rows appended to one CSV file do. Moves only hold hex ids; the zone
+# and effect of each hex are stored once per run and joined back in by the
+# move_zones view.
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    campaign TEXT,
+    flower TEXT NOT NULL,
+    flower_hash TEXT NOT NULL,
+    dice TEXT,
+    seed INTEGER,
+    created TEXT NOT NULL,
+    note TEXT
+);
+CREATE TABLE IF NOT EXISTS run_hexes (
+    run_id INTEGER NOT NULL REFERENCES runs(id) ON DELETE CASCADE,
+    hex INTEGER NOT NULL,
+    zone TEXT,
+    effect TEXT,
+    PRIMARY KEY (run_id, hex)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS walks (
+    id INTEGER PRIMARY KEY,
+    run_id INTEGER NOT NULL REFERENCES runs(id) ON DELETE CASCADE,
+    number INTEGER NOT NULL,
+    start INTEGER NOT NULL,
+    steps INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS moves (
+    walk_id INTEGER NOT NULL REFERENCES walks(id) ON DELETE CASCADE,
+    step INTEGER NOT NULL,
+    hex INTEGER NOT NULL,
+    PRIMARY KEY (walk_id, step)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS runs_campaign ON runs (campaign);
+CREATE INDEX IF NOT EXISTS runs_flower ON runs (flower);
+CREATE UNIQUE INDEX IF NOT EXISTS walks_run ON walks (run_id, number);
+CREATE INDEX IF NOT EXISTS moves_hex ON moves (hex);
+CREATE VIEW IF NOT EXISTS move_zones AS
+    SELECT walks.run_id, walks.number AS walk, moves.step, moves.hex,
+           run_hexes.zone, run_hexes.effect
+    FROM moves
+    JOIN walks ON walks.id = moves.walk_id
+    JOIN run_hexes ON run_hexes.run_id = walks.run_id AND run_hexes.hex = moves.hex;
+"""
+
+# Moves are inserted in chunks of this many rows, all in one transaction.
+CHUNK = 200000
+
+def flower_hash(hf) -> str:
+    """
+    Returns a short hash of everything that affects walks on a HexFlower,
+    so runs on edited flowers of the same name can be told apart.
+    """
+    return hashlib.sha256(repr(hf.pack()).encode()).hexdigest()[:16]
+
+class WalkStore():
+    """
+    This class stores walks in a SQLite database with tables for runs,
+    walks, and moves. Moves are written with executemany in one transaction
+    per call, and runs are indexed by campaign and flower and moves by hex,
+    so one campaign's day N can be read without scanning everything else.
+
+    Arguments:
+        path: str, optional, the database file, ':memory:' by default
+
+    Instance Attributes:
+        connection: sqlite3.Connection
+
+    Methods:
+        start_run: records a new run and returns its id
+        add_walks: bulk inserts an array of walks, as from simulate_walks
+        add_walk: inserts one walk, such as BasicWalk.moves
+        runs: lists the runs, optionally of one campaign or flower
+        walk: returns the moves of one walk
+        day: returns where every walk of a run or campaign was at one step
+        close: closes the database
+    """
+    def __init__(self, path=':memory:'):
+        self.connection = sqlite3.connect(path)
+        self.connection.execute("PRAGMA foreign_keys = ON")
+        if path != ':memory:':
+            self.connection.execute("PRAGMA journal_mode = WAL")
+            self.connection.execute("PRAGMA synchronous = NORMAL")
+        with self.connection:
+            self.connection.executescript(SCHEMA)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self.connection.close()
+
+    def start_run(self, hf, flower: str, campaign=None, seed=None,
+                  note=None) -> int:
+        """
+        Records a run of walks on the HexFlower hf, named flower (usually
+        its XML file), with the zone and effect of every hex, and returns
+        the run id.
+        """
+        created = datetime.now(timezone.utc).isoformat(timespec='seconds')
+        with self.connection:
+            cursor = self.connection.execute(
+                "INSERT INTO runs (campaign, flower, flower_hash, dice, seed, created, note)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (campaign, flower, flower_hash(hf), str(hf.dice_set), seed,
+                 created, note))
+            run_id = cursor.lastrowid
+            self.connection.executemany(
+                "INSERT INTO run_hexes (run_id, hex, zone, effect) VALUES (?, ?, ?, ?)",
+                [(run_id, hex.id, hex.zone.type, hex.zone.effect) for hex in hf.hexes])
+        return run_id
+
+    def add_walks(self, run_id: int, paths, first=None) -> int:
+        """
+        Inserts walks into a run in one transaction. paths is an array of
+        hex ids of shape (walks, steps + 1), as simulate_walks returns, and
+        the walks are numbered from first (by default, after the walks the
+        run already has). Returns the number of the first walk added.
+        """
+        paths = np.atleast_2d(np.asarray(paths, dtype=np.int64))
+        count, length = paths.shape
+        with self.connection:
+            # Take the write lock before reading the next walk ids, so that
+            # another writer cannot take the same ids in the meantime.
+            if not self.connection.in_transaction:
+                self.connection.execute("BEGIN IMMEDIATE")
+            if first is None:
+                first = self.connection.execute(
+                    "SELECT COALESCE(MAX(number) + 1, 0) FROM walks WHERE run_id = ?",
+                    (run_id,)).fetchone()[0]
+            base = self.connection.execute(
+                "SELECT COALESCE(MAX(id), 0) + 1 FROM walks").fetchone()[0]
+            self.connection.executemany(
+                "INSERT INTO walks (id, run_id, number, start, steps) VALUES (?, ?, ?, ?, ?)",
+                zip(range(base, base + count), [run_id] * count,
+                    range(first, first + count), paths[:, 0].tolist(),
+                    [length - 1] * count))
+            per_chunk = max(1, CHUNK // max(length, 1))
+            steps = list(range(length)) * per_chunk
+            for at in range(0, count, per_chunk):
+                block = paths[at:at + per_chunk]
+                ids = np.repeat(np.arange(base + at, base + at + len(block)), length)
+                self.connection.executemany(
+                    "INSERT INTO moves (walk_id, step, hex) VALUES (?, ?, ?)",
+                    zip(ids.tolist(), steps, block.ravel().tolist()))
+        return first
+
+    def add_walk(self, run_id: int, moves, first=None) -> int:
+        """
+        Inserts one walk, given as BasicWalk.moves or a list of hex ids,
+        and returns its number.
+        """
+        moves = list(moves)
+        if moves and isinstance(moves[0], (tuple, list)):
+            moves = [move[0] for move in moves]
+        return self.add_walks(run_id, [moves], first)
+
+    def runs(self, campaign=None, flower=None) -> list:
+        """
+        Returns the runs as (id, campaign, flower, flower_hash, dice, seed,
+        created, note) tuples, optionally only those of one campaign or
+        flower, oldest first.
+        """
+        query = "SELECT id, campaign, flower, flower_hash, dice, seed, created, note FROM runs"
+        terms, values = [], []
+        for column, value in (('campaign', campaign), ('flower', flower)):
+            if value is not None:
+                terms.append(f"{column} = ?")
+                values.append(value)
+        if terms:
+            query += " WHERE " + " AND ".join(terms)
+        return self.connection.execute(query + " ORDER BY id", values).fetchall()
+
+    def walk(self, run_id: int, number=0, start=0, stop=None) -> list:
+        """
+        Returns the moves of walk number of a run as (step, hex, zone,
+        effect) tuples, for the steps from start up to but not including
+        stop.
+        """
+        query = ("SELECT step, hex, zone, effect FROM move_zones"
+                 " WHERE run_id = ? AND walk = ? AND step >= ?")
+        values = [run_id, number, start]
+        if stop is not None:
+            query += " AND step < ?"
+            values.append(stop)
+        return self.connection.execute(query + " ORDER BY step", values).fetchall()
+
+    def day(self, step: int, run_id=None, campaign=None) -> list:
+        """
+        Returns where every walk was at one step (day) as (run_id, walk,
+        hex, zone, effect) tuples, for one run or every run of a campaign.
+        """
+        if (run_id is None) == (campaign is None):
+            raise ValueError("Give either a run_id or a campaign.")
+        if run_id is not None:
+            where, value = "runs.id = ?", run_id
+        else:
+            where, value = "runs.campaign = ?", campaign
+        return self.connection.execute(
+            "SELECT walks.run_id, walks.number, moves.hex, run_hexes.zone, run_hexes.effect"
+            " FROM runs JOIN walks ON walks.run_id = runs.id"
+            " JOIN moves ON moves.walk_id = walks.id AND moves.step = ?"
+            " JOIN run_hexes ON run_hexes.run_id = runs.id AND run_hexes.hex = moves.hex"
+            f" WHERE {where} ORDER BY walks.run_id, walks.number",
+            (step, value)).fetchall()
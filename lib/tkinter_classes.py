@@ -2,6 +2,8 @@ import tkinter as tk
 from tkinter import ttk
 from tkinter import filedialog as fd
 import sys
+from lib.walklist import (format_row, scroll_target, yview_target,
+                          append_target, scrollbar_span)
 
 class ControlPanel(tk.Tk):
     def __init__(self):
@@ -14,6 +16,15 @@ class ControlPanel(tk.Tk):
         filemenu = tk.Menu(menu)
         menu.add_cascade(label='File', menu=filemenu)
         filemenu.add_command(label='Exit', command=sys.exit)
+        # Walk moves are shown in one virtualized list, and messages about
+        # the walk in one status line, so repeated walks reuse the same
+        # widgets.
+        self.results = WalkResultList(self.frame)
+        self.results.grid(row=0, column=0, sticky=tk.NSEW)
+        self.status = tk.Label(self.frame, text='')
+        self.status.grid(row=1, column=0, sticky=tk.W)
+        self.rowconfigure(0, weight=1)
+        self.columnconfigure(0, weight=1)
        
     def openfile(self):
         name = fd.askopenfilename(initialdir="./data", title="Select XML File")
@@ -26,4 +37,99 @@ class BoardWindow(tk.Toplevel):
         self.title("Hex Flower")
         self.canvas = tk.Canvas(self, width=width, height=height)
         self.canvas.grid(row=0, column=0)
-        self.canvas.labels = []
\ No newline at end of file
+        self.renderer = None
+
+class WalkResultList(tk.Frame):
+    """
+    A scrolling list of walk moves that only draws the rows that can be seen.
+    The list keeps the (number, move) pairs it is given, and a fixed pool of
+    canvas text items, one per visible row, is refilled as it scrolls. The
+    widget count stays the same no matter how long the walk is. Which rows
+    to show is worked out by the plain functions of lib.walklist.
+
+    Class Attributes:
+        row_height: int, height of one row in pixels
+
+    Methods:
+        format_row: returns the text shown for one move
+        append: adds a move to the end of the list
+        clear: removes every move
+        yview: scrolls the list, it is the command of the scrollbar
+    """
+    row_height = 20
+
+    def __init__(self, parent, width=1000, height=540):
+        super().__init__(parent)
+        self.rows = []
+        self.first = 0
+        self.follow = True
+        self.items = []
+        self.canvas = tk.Canvas(self, width=width, height=height,
+                                highlightthickness=0)
+        self.scrollbar = ttk.Scrollbar(self, orient=tk.VERTICAL,
+                                       command=self.yview)
+        self.canvas.grid(row=0, column=0, sticky=tk.NSEW)
+        self.scrollbar.grid(row=0, column=1, sticky=tk.NS)
+        self.rowconfigure(0, weight=1)
+        self.columnconfigure(0, weight=1)
+        self.canvas.bind('<Configure>', self._resize)
+        self.canvas.bind('<MouseWheel>',
+            lambda e: self.yview('scroll', -e.delta // 120, 'units'))
+        self.canvas.bind('<Button-4>', lambda e: self.yview('scroll', -3, 'units'))
+        self.canvas.bind('<Button-5>', lambda e: self.yview('scroll', 3, 'units'))
+        self._resize()
+
+    format_row = staticmethod(format_row)
+
+    def visible_rows(self) -> int:
+        height = self.canvas.winfo_height()
+        if height <= 1:
+            # The canvas has not been laid out yet.
+            height = int(self.canvas.cget('height'))
+        return max(1, height // self.row_height)
+
+    def _resize(self, event=None):
+        # Keep exactly one text item per visible row.
+        needed = self.visible_rows()
+        while len(self.items) < needed:
+            y = len(self.items) * self.row_height
+            self.items.append(self.canvas.create_text(4, y, anchor=tk.NW, text=''))
+        while len(self.items) > needed:
+            self.canvas.delete(self.items.pop())
+        self._scroll_to(self.first)
+
+    def _scroll_to(self, first):
+        visible = len(self.items)
+        self.first, self.follow = scroll_target(first, len(self.rows), visible)
+        for k, item in enumerate(self.items):
+            n = self.first + k
+            text = self.format_row(*self.rows[n]) if n < len(self.rows) else ''
+            self.canvas.itemconfigure(item, text=text)
+        self.scrollbar.set(*scrollbar_span(self.first, len(self.rows), visible))
+
+    def yview(self, *args):
+        """
+        Scrolls the list. Accepts the same arguments as Canvas.yview:
+        ('moveto', fraction) or ('scroll', number, 'units' or 'pages').
+        """
+        target = yview_target(args, self.first, len(self.rows), len(self.items))
+        if target is not None:
+            self._scroll_to(target)
+
+    def append(self, number: int, move: tuple):
+        """
+        Adds a move to the end of the list. If the list was showing its last
+        row, it scrolls to keep the new move in view.
+        """
+        self.rows.append((number, move))
+        target = append_target(self.first, self.follow, len(self.rows),
+                               len(self.items))
+        if target is not None:
+            self._scroll_to(target)
+
+    def clear(self):
+        """
+        Removes every move from the list.
+        """
+        self.rows = []
+        self._scroll_to(0)
\ No newline at end of file
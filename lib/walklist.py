@@ -0,0 +1,59 @@
+# The row and scrolling logic of WalkResultList (lib/tkinter_classes.py) as
+# plain functions of the row count and the number of visible rows, so it can
+# be used and tested without a Tk display.
+
+def format_row(number: int, move: tuple) -> str:
+    """
+    Returns the text for a move of the form (hex_id, zone.type, zone.effect).
+    Move number 0 is the start of the walk.
+    """
+    if number == 0:
+        return "Start: Hex: {}, Zone: {}, Effect: {}".format(*move)
+    return "Move #{}: Hex: {}, Zone: {}, Effect: {}".format(number, *move)
+
+def scroll_target(first, rows: int, visible: int) -> tuple:
+    """
+    Returns (first, follow): the index of the first row to show when asked to
+    scroll to first, kept so the last page is full, and whether that shows
+    the last row, so the list follows new moves.
+    """
+    last_start = max(0, rows - visible)
+    first = min(max(0, int(first)), last_start)
+    return first, first >= last_start
+
+def yview_target(args: tuple, first: int, rows: int, visible: int):
+    """
+    Returns the first row asked for by scrollbar or Canvas.yview arguments,
+    ('moveto', fraction) or ('scroll', number, 'units' or 'pages'), before
+    scroll_target limits it, or None for no scroll.
+    """
+    if not args:
+        return None
+    if args[0] == 'moveto':
+        return float(args[1]) * rows
+    if args[0] == 'scroll':
+        step = int(args[1])
+        if args[2] == 'pages':
+            step *= visible
+        return first + step
+    return None
+
+def append_target(first: int, follow: bool, rows: int, visible: int):
+    """
+    Returns the first row to show after a move is added, making rows rows in
+    all, or None when the new move is out of view and nothing changes.
+    """
+    if follow:
+        return rows
+    if first + visible >= rows - 1:
+        return first
+    return None
+
+def scrollbar_span(first: int, rows: int, visible: int) -> tuple:
+    """
+    Returns the (top, bottom) fractions for the scrollbar when the list shows
+    visible rows from first on.
+    """
+    if not rows:
+        return (0.0, 1.0)
+    return (first / rows, min(1.0, (first + visible) / rows))
@@ -0,0 +1,266 @@
+import csv, os
+import numpy as np
+
+# Seekable walk logs. The log is a CSV file of walk, step, hex, zone, effect
+# rows that opens in any spreadsheet program, like the output of showMove.
+# Next to it, a sidecar index (the log name plus '.idx') holds the byte
+# offset of the first move of every walk and of every N-th move after it, as
+# fixed size binary records. A reader looks up the nearest indexed move at or
+# before the one it wants, seeks there, and reads at most N - 1 rows before
+# reaching it, however large the log is. Every move is one line of the log:
+# line breaks in zone and effect text are written as \n and \r (and a
+# backslash as \\), so that the offsets and line reads stay in step.
+
+HEADER = ('walk', 'step', 'hex', 'zone', 'effect')
+INDEX_DTYPE = np.dtype([('walk', '<i8'), ('step', '<i8'), ('offset', '<i8')])
+
+def index_path(path) -> str:
+    return path + '.idx'
+
+_ESCAPES = {'\\': '\\\\', '\r': '\\r', '\n': '\\n'}
+_UNESCAPES = {v[1]: k for k, v in _ESCAPES.items()}
+
+def _unescape(value: str) -> str:
+    if '\\' not in value:
+        return value
+    out, chars = [], iter(value)
+    for c in chars:
+        out.append(_UNESCAPES.get(next(chars, ''), '') if c == '\\' else c)
+    return ''.join(out)
+
+def _row(walk, step, hex_id, zone, effect) -> bytes:
+    def text(value):
+        value = '' if value is None else str(value)
+        value = ''.join(_ESCAPES.get(c, c) for c in value)
+        if any(c in value for c in ',"'):
+            value = '"' + value.replace('"', '""') + '"'
+        return value
+    return f"{walk},{step},{hex_id},{text(zone)},{text(effect)}\r\n".encode('utf-8')
+
+class WalkLogWriter():
+    """
+    This class appends walks to a seekable walk log and its sidecar index.
+    Walks are numbered on from the walks the log already holds. A log that
+    holds walks but has lost its index is indexed again first.
+
+    Arguments:
+        path: str, the log file, created if needed
+        hf: HexFlower or None, optional, used to look up the zone and effect
+            of moves given as plain hex ids
+        every: int, optional, index every this many moves of a walk
+
+    Instance Attributes:
+        walks: int, number of walks in the log
+        walk: int or None, number of the walk being written
+        step: int, number of the next move of that walk
+
+    Methods:
+        begin_walk: starts a new walk and returns its number
+        write_move: writes the next move of the current walk
+        write_walk: writes a whole walk, such as BasicWalk.moves
+        write_paths: writes an array of walks from simulate_walks
+        flush, close: write buffered rows to disk, and close the files
+    """
+    def __init__(self, path, hf=None, every=64):
+        if every < 1:
+            raise ValueError("every must be at least 1.")
+        self.path = path
+        self.hf = hf
+        self.every = int(every)
+        self._log = open(path, 'ab')
+        self.offset = self._log.seek(0, os.SEEK_END)
+        if self.offset == 0:
+            self._write(_row(*HEADER))
+        elif not len(read_index(path)):
+            # Without the index the walks would be numbered from 0 again,
+            # repeating numbers already in the log.
+            build_index(path, self.every)
+        self._index = open(index_path(path), 'ab')
+        entries = read_index(path)
+        self.walks = int(entries['walk'].max()) + 1 if len(entries) else 0
+        self.walk = None
+        self.step = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _write(self, data: bytes):
+        self._log.write(data)
+        self.offset += len(data)
+
+    def _zone(self, move) -> tuple:
+        if isinstance(move, (tuple, list)):
+            return move[0], move[1], move[2]
+        hex_id = int(move)
+        if self.hf is None:
+            return hex_id, None, None
+        zone = self.hf.hexes[hex_id - 1].zone
+        return hex_id, zone.type, zone.effect
+
+    def begin_walk(self) -> int:
+        self.walk = self.walks
+        self.walks += 1
+        self.step = 0
+        return self.walk
+
+    def write_move(self, move):
+        """
+        Writes the next move of the current walk, either a (hex_id, zone,
+        effect) tuple or a hex id. The first move of a walk is its start.
+        """
+        if self.walk is None:
+            self.begin_walk()
+        if self.step % self.every == 0:
+            entry = np.array([(self.walk, self.step, self.offset)], dtype=INDEX_DTYPE)
+            self._index.write(entry.tobytes())
+        self._write(_row(self.walk, self.step, *self._zone(move)))
+        self.step += 1
+
+    def write_walk(self, moves) -> int:
+        """
+        Writes a whole walk, start first, and returns its number.
+        """
+        walk = self.begin_walk()
+        for move in moves:
+            self.write_move(move)
+        return walk
+
+    def write_paths(self, paths) -> int:
+        """
+        Writes every walk of an array of hex ids of shape (walks, steps + 1),
+        as simulate_walks returns, and returns the number of the first.
+        """
+        paths = np.atleast_2d(np.asarray(paths))
+        first = self.walks
+        # The end of a row only depends on the hex, so it is made once per hex.
+        hexes = len(self.hf.hexes) if self.hf else int(paths.max())
+        ends = [_row('', '', *self._zone(h))[2:] for h in range(1, hexes + 1)]
+        for row in paths.tolist():
+            walk = self.begin_walk()
+            lines = [b'%d,%d,' % (walk, step) + ends[h - 1] for step, h in enumerate(row)]
+            offsets = self.offset + np.concatenate(([0], np.cumsum([len(l) for l in lines[:-1]])))
+            marks = np.arange(0, len(lines), self.every)
+            entries = np.empty(len(marks), dtype=INDEX_DTYPE)
+            entries['walk'], entries['step'], entries['offset'] = walk, marks, offsets[marks]
+            self._index.write(entries.tobytes())
+            self._write(b''.join(lines))
+            self.step = len(lines)
+        return first
+
+    def flush(self):
+        # The log is flushed before the index, so an index entry never
+        # points past the end of the log.
+        self._log.flush()
+        self._index.flush()
+
+    def close(self):
+        self.flush()
+        self._log.close()
+        self._index.close()
+
+def read_index(path) -> np.ndarray:
+    """
+    Returns the sidecar index of a walk log as a structured array of (walk,
+    step, offset) records, or an empty one if there is none.
+    """
+    try:
+        return np.fromfile(index_path(path), dtype=INDEX_DTYPE)
+    except (FileNotFoundError, ValueError):
+        return np.empty(0, dtype=INDEX_DTYPE)
+
+def build_index(path, every=64) -> int:
+    """
+    Rebuilds the sidecar index of a walk log by reading it once, for logs
+    whose index was lost. Returns the number of index records written.
+    """
+    entries = []
+    with open(path, 'rb') as myfile:
+        offset = len(myfile.readline())
+        for line in myfile:
+            walk, step = line.split(b',', 2)[:2]
+            if int(step) % every == 0:
+                entries.append((int(walk), int(step), offset))
+            offset += len(line)
+    np.array(entries, dtype=INDEX_DTYPE).tofile(index_path(path))
+    return len(entries)
+
+class WalkLogReader():
+    """
+    This class reads moves from a seekable walk log without scanning it:
+    the index gives the offset of a nearby move and only the rows from
+    there to the wanted move are read.
+
+    Arguments:
+        path: str, the log file, with its sidecar index
+
+    Instance Attributes:
+        index: np.ndarray, the (walk, step, offset) records of the index
+        walks: int, number of walks in the log
+
+    Methods:
+        locate: returns the byte offset to start reading a move from
+        replay: yields the moves of a walk from a given step on
+        move: returns one move of one walk
+        close: closes the log
+    """
+    def __init__(self, path):
+        self.path = path
+        self.index = read_index(path)
+        if not len(self.index):
+            raise ValueError(f"{path} has no index. Use build_index to make one.")
+        self._keys = (self.index['walk'] << 32) | self.index['step']
+        self.walks = int(self.index['walk'].max()) + 1
+        self._log = open(path, 'rb')
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self._log.close()
+
+    def locate(self, walk: int, step=0) -> int:
+        """
+        Returns the offset of the nearest indexed move at or before move
+        step of walk. Raises a ValueError if the log has no such walk.
+        """
+        if not 0 <= walk < self.walks or step < 0:
+            raise ValueError(f"The log has walks 0 to {self.walks - 1} and steps from 0.")
+        at = np.searchsorted(self._keys, (walk << 32) | step, side='right') - 1
+        if at < 0 or self.index['walk'][at] != walk:
+            raise ValueError(f"Walk {walk} is not in the index of {self.path}.")
+        return int(self.index['offset'][at])
+
+    def replay(self, walk: int, step=0, count=None):
+        """
+        Yields the moves of walk from move step on, as (walk, step, hex_id,
+        zone, effect) tuples, until the walk ends or count moves are read.
+        """
+        self._log.seek(self.locate(walk, step))
+        read = 0
+        for line in self._log:
+            row = next(csv.reader([line.decode('utf-8')]))
+            w, s = int(row[0]), int(row[1])
+            if w != walk:
+                break
+            if s < step:
+                continue
+            yield (w, s, int(row[2]), _unescape(row[3]) or None,
+                   _unescape(row[4]) or None)
+            read += 1
+            if count is not None and read >= count:
+                break
+
+    def move(self, walk: int, step: int) -> tuple:
+        """
+        Returns move step of walk, as a (walk, step, hex_id, zone, effect)
+        tuple. Raises a ValueError if the walk is shorter.
+        """
+        for move in self.replay(walk, step, 1):
+            return move
+        raise ValueError(f"Walk {walk} has no step {step}.")
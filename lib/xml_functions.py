@@ -1,6 +1,13 @@
 from collections import defaultdict
-from xml.etree import cElementTree as ElementTree
+from xml.sax.saxutils import escape
+try:
+    from xml.etree import cElementTree as ElementTree
+except ImportError:
+    # cElementTree was removed in Python 3.9. ElementTree uses the C
+    # accelerator on its own.
+    from xml.etree import ElementTree
 from lib.classes import HexFlower, Hex, Zone
+from lib.dice import parse_roll_range
 
 def xml2dict(t):
     d = {t.tag: {} if t.attrib else None}
@@ -97,9 +104,22 @@ def process_xml_hex_flower(xmlfile, diagnostic=False, side=20,
         if hfdice[i] == 'null':
             chk_dice[i] = None
         hfdice = tuple(chk_dice)
+    # Hex Flowers can declare their own outcome table, which they need for
+    # dice without a built-in one:
+    #   <outcomes><roll value="2-3">a</roll>...<roll value="12">null</roll></outcomes>
+    # A roll value is a single total or an inclusive range of totals.
+    outcomes = None
+    outcomedata = root.find('outcomes')
+    if outcomedata is not None:
+        outcomes = {}
+        for roll in outcomedata.findall('roll'):
+            edge = (roll.text or '').strip()
+            for total in parse_roll_range(roll.get('value', '')):
+                outcomes[total] = None if edge in ('null', '') else edge
     if diagnostic:
         print(f"Extracted Hex Flower type: {hftype}")
         print(f"Extracted hfdice as type {type(hfdice)}: {hfdice}")
+        print(f"Extracted outcomes: {outcomes}")
         print(f"Extracted hexdata as type {type(hexdata)}: {hexdata}")
     
     # Now, we have a list of dictionaries of hex data that need to be converted.
@@ -156,4 +176,49 @@ def process_xml_hex_flower(xmlfile, diagnostic=False, side=20,
     # Hexes have been assembled. We are ready to make a Hex Flower.
     return HexFlower(hexes=hexes, type=hftype, dice=hfdice, side=side,
                      height=canvas_height, width=canvas_width,
-                     diagnostic=diagnostic)
+                     outcomes=outcomes, diagnostic=diagnostic)
+
+def _attr(value) -> str:
+    return 'null' if value is None else escape(str(value), {'"': '&quot;'})
+
+def write_xml_hex_flower(hf: HexFlower, xmlfile, diagnostic=False):
+    """
+    This function writes a HexFlower to an xml file in the same layout that
+    process_xml_hex_flower reads, so tools that change a Hex Flower can save
+    it for the app and for hand editing. Outcome tables are written with
+    consecutive rolls to the same edge collapsed into ranges.
+    """
+    dice = hf.dice if isinstance(hf.dice, (tuple, list)) else (hf.dice,)
+    lines = ["<?xml version=\"1.0\" standalone='yes'?>",
+             f'<hex_flower type="{_attr(hf.type)}" '
+             f'dice="({",".join(_attr(d) for d in dice)})">']
+    for hex in hf.hexes:
+        zone = hex.zone
+        x, y = hex.vertex
+        lines.append(f'    <hex id="{hex.id}" vertex="({round(x)},{round(y)})">')
+        lines.append(f'        <zone type="{_attr(zone.type)}" label="{_attr(zone.label)}" '
+                     f'icon="{_attr(zone.icon)}" color="{_attr(zone.color)}" '
+                     f'effect="{_attr(zone.effect)}"></zone>')
+        lines.append('        <adjacency>')
+        for k in 'abcdef':
+            lines.append(f'            <{k}>{_attr(hex.adjacency[k])}</{k}>')
+        lines.append('        </adjacency>')
+        lines.append('    </hex>')
+    if hf.outcomes:
+        lines.append('    <outcomes>')
+        rolls = sorted(hf.outcomes)
+        start = rolls[0]
+        for i, roll in enumerate(rolls):
+            last = i + 1 == len(rolls)
+            if last or rolls[i + 1] != roll + 1 or \
+                    hf.outcomes[rolls[i + 1]] != hf.outcomes[start]:
+                value = str(start) if start == roll else f"{start}-{roll}"
+                lines.append(f'        <roll value="{value}">{_attr(hf.outcomes[start])}</roll>')
+                if not last:
+                    start = rolls[i + 1]
+        lines.append('    </outcomes>')
+    lines.append('</hex_flower>')
+    with open(xmlfile, 'w', newline='\r\n') as myfile:
+        myfile.write('\n'.join(lines) + '\n')
+    if diagnostic:
+        print(f"Wrote {hf.type} Hex Flower to {xmlfile}")
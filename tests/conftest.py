@@ -0,0 +1,23 @@
+import os, sys
+import pytest
+
+# The tests import lib the way app.py and cli.py do, from the repository root.
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+def data_path(*parts) -> str:
+    return os.path.join(ROOT, 'data', *parts)
+
+@pytest.fixture(scope='session')
+def load_flower():
+    """
+    Returns a function that loads a Hex Flower from the data directory by
+    file name, parsing each file only once per test session.
+    """
+    from lib.xml_functions import process_xml_hex_flower
+    cache = {}
+    def load(name='basic_hex_flower.xml'):
+        if name not in cache:
+            cache[name] = process_xml_hex_flower(xmlfile=data_path(name))
+        return cache[name]
+    return load
@@ -0,0 +1,62 @@
+import numpy as np
+import pytest
+from lib.campaign import Region, month_seasons, simulate_campaign, write_campaign
+from lib.markov import transition_matrix
+
+@pytest.fixture
+def flowers(load_flower):
+    return (load_flower('basic_hex_flower.xml'),
+            load_flower('uniform_basic_hex_flower.xml'),
+            load_flower('nuniform_basic_hex_flower.xml'))
+
+def test_every_day_is_a_legal_move(flowers):
+    basic, uniform, nuniform = flowers
+    regions = [Region('north', basic, start=3),
+               Region('south', [uniform, nuniform, basic, uniform], start=10),
+               Region('west', nuniform, start=19)]
+    columns = simulate_campaign(regions, 400, start_date='2026-01-01', seed=50)
+    assert columns['hex'].dtype == np.intp
+    hexes = columns['hex'].reshape(400, 3)
+    flower = columns['flower'].reshape(400, 3)
+    seasons = month_seasons('2026-01-01', 400)
+    np.testing.assert_array_equal(flower[:, 1], seasons)
+    assert np.all(flower[:, [0, 2]] == 0)
+    for r, region in enumerate(regions):
+        previous = np.concatenate(([region.start], hexes[:-1, r]))
+        P = np.stack([transition_matrix(hf) for hf in region.flowers])
+        assert np.all(P[flower[:, r], previous - 1, hexes[:, r] - 1] > 0)
+        zones = [region.flowers[f].hexes[h - 1].zone.type
+                 for f, h in zip(flower[:, r], hexes[:, r])]
+        assert columns['zone'].reshape(400, 3)[:, r].tolist() == zones
+
+def test_several_steps_a_day_reach_two_steps_away(flowers):
+    basic = flowers[0]
+    P = transition_matrix(basic)
+    columns = simulate_campaign([Region('r', basic, start=1, steps_per_day=2)],
+                                300, seed=5)
+    hexes = np.concatenate(([1], columns['hex']))
+    assert np.all((P @ P)[hexes[:-1] - 1, hexes[1:] - 1] > 0)
+
+def test_seasonal_regions_need_a_calendar(flowers):
+    basic, uniform, _ = flowers
+    regions = [Region('r', [basic, uniform, basic, uniform])]
+    with pytest.raises(ValueError):
+        simulate_campaign(regions, 10)
+    columns = simulate_campaign(regions, 10, seasons=[0, 1] * 5, seed=1)
+    assert columns['flower'].tolist() == [0, 1] * 5
+
+def test_month_seasons():
+    assert month_seasons('2026-11-30', 3).tolist() == [3, 0, 0]
+    assert month_seasons('2026-03-01', 1).tolist() == [1]
+
+def test_write_campaign_npz_and_csv(flowers, tmp_path):
+    columns = simulate_campaign([Region('a', flowers[0]), Region('b', flowers[1])],
+                                20, start_date='2026-06-01', seed=2)
+    write_campaign(columns, str(tmp_path / 'c.npz'))
+    with np.load(str(tmp_path / 'c.npz')) as data:
+        np.testing.assert_array_equal(data['hex'], columns['hex'])
+        assert data['regions'].tolist() == ['a', 'b']
+    write_campaign(columns, str(tmp_path / 'c.csv'))
+    lines = (tmp_path / 'c.csv').read_text().splitlines()
+    assert lines[0] == 'day,date,region_name,region,flower,hex,zone,effect'
+    assert len(lines) == 41
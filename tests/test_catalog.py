@@ -0,0 +1,80 @@
+import json, os, shutil
+import pytest
+from conftest import data_path
+from lib.catalog import MANIFEST, export_catalog, thumbnail_name
+
+pytest.importorskip('PIL')
+
+FLOWERS = ('basic_hex_flower.xml', 'generic_wind_speed_hex_flower.xml')
+
+@pytest.fixture
+def flowers(tmp_path, monkeypatch):
+    # A copy of two flowers and the icons, with the icon paths of the wind
+    # flower resolved from tmp_path as they are from the repository root.
+    monkeypatch.chdir(tmp_path)
+    shutil.copytree(data_path('icons'), tmp_path / 'data' / 'icons')
+    xml_dir = tmp_path / 'flowers'
+    xml_dir.mkdir()
+    for name in FLOWERS:
+        shutil.copy(data_path(name), xml_dir / name)
+    return str(xml_dir), str(tmp_path / 'thumbs')
+
+def touch(path, data=b'\n'):
+    # Changes the file and moves its mtime on, as an editor would.
+    with open(path, 'ab') as myfile:
+        myfile.write(data)
+    stat = os.stat(path)
+    os.utime(path, (stat.st_atime, stat.st_mtime + 10))
+
+def test_thumbnails_and_skipping(flowers):
+    xml_dir, out_dir = flowers
+    summary = export_catalog(xml_dir, out_dir, sizes=(64, 128), processes=2)
+    assert [os.path.basename(f) for f in summary['rendered']] == list(FLOWERS)
+    assert summary['skipped'] == [] and summary['failed'] == {}
+    from PIL import Image
+    for name in FLOWERS:
+        for size in (64, 128):
+            with Image.open(os.path.join(out_dir, thumbnail_name(name, size))) as image:
+                assert image.width == size
+    with open(os.path.join(out_dir, MANIFEST)) as myfile:
+        assert sorted(json.load(myfile)) == list(FLOWERS)
+    summary = export_catalog(xml_dir, out_dir, sizes=(64, 128), processes=1)
+    assert summary['rendered'] == [] and len(summary['skipped']) == 2
+    # A missing thumbnail, new settings, or force render again.
+    os.remove(os.path.join(out_dir, thumbnail_name(FLOWERS[0], 64)))
+    summary = export_catalog(xml_dir, out_dir, sizes=(64, 128), processes=1)
+    assert [os.path.basename(f) for f in summary['rendered']] == [FLOWERS[0]]
+    assert len(export_catalog(xml_dir, out_dir, sizes=(64,), processes=1)['rendered']) == 2
+    assert len(export_catalog(xml_dir, out_dir, sizes=(64,), processes=1,
+                              force=True)['rendered']) == 2
+
+def test_changed_xml_or_icon_renders_again(flowers, tmp_path):
+    xml_dir, out_dir = flowers
+    export_catalog(xml_dir, out_dir, sizes=(64,), processes=1)
+    touch(os.path.join(xml_dir, FLOWERS[0]))
+    summary = export_catalog(xml_dir, out_dir, sizes=(64,), processes=1)
+    assert [os.path.basename(f) for f in summary['rendered']] == [FLOWERS[0]]
+    # Only the wind flower uses the icon.
+    touch(str(tmp_path / 'data' / 'icons' / 'wi-wind-beaufort-3.png'), b'\0')
+    summary = export_catalog(xml_dir, out_dir, sizes=(64,), processes=1)
+    assert [os.path.basename(f) for f in summary['rendered']] == [FLOWERS[1]]
+    assert len(export_catalog(xml_dir, out_dir, sizes=(64,), processes=1)['skipped']) == 2
+
+def test_failures_are_reported_and_tried_again(flowers):
+    xml_dir, out_dir = flowers
+    broken = os.path.join(xml_dir, 'broken.xml')
+    with open(broken, 'w') as myfile:
+        myfile.write('<hexflower><hexes>')
+    empty = os.path.join(xml_dir, 'empty.xml')
+    with open(empty, 'w') as myfile:
+        myfile.write('<hexflower></hexflower>')
+    summary = export_catalog(xml_dir, out_dir, sizes=(64,), processes=1)
+    assert sorted(summary['failed']) == [broken, empty]
+    assert len(summary['rendered']) == 2
+    with open(os.path.join(out_dir, MANIFEST)) as myfile:
+        manifest = json.load(myfile)
+    # Failed flowers are left out of the manifest, so the next run tries them again.
+    assert sorted(manifest) == list(FLOWERS)
+    summary = export_catalog(xml_dir, out_dir, sizes=(64,), processes=1)
+    assert sorted(summary['failed']) == [broken, empty]
+    assert len(summary['skipped']) == 2
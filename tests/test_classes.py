@@ -0,0 +1,28 @@
+import pickle
+import numpy as np
+import pytest
+from lib.classes import HexFlower
+from lib.markov import transition_matrix
+
+FLOWERS = ('basic_hex_flower.xml', 'uniform_basic_hex_flower.xml',
+           'nuniform_basic_hex_flower.xml', 'generic_wind_speed_hex_flower.xml')
+
+@pytest.mark.parametrize('name', FLOWERS)
+def test_pack_unpack_round_trip(load_flower, name):
+    hf = load_flower(name)
+    copy = HexFlower.unpack(hf.pack())
+    assert copy.pack() == hf.pack()
+    assert (copy.type, copy.dice, copy.side) == (hf.type, hf.dice, hf.side)
+    for a, b in zip(hf.hexes, copy.hexes):
+        assert a.id == b.id
+        assert a.adjacency == b.adjacency
+        assert (a.zone.type, a.zone.label, a.zone.color, a.zone.icon, a.zone.effect) == \
+               (b.zone.type, b.zone.label, b.zone.color, b.zone.icon, b.zone.effect)
+    np.testing.assert_array_equal(transition_matrix(copy), transition_matrix(hf))
+
+@pytest.mark.parametrize('name', FLOWERS)
+def test_pickle_round_trip(load_flower, name):
+    hf = load_flower(name)
+    copy = pickle.loads(pickle.dumps(hf))
+    assert copy.pack() == hf.pack()
+    assert [h.center(hf.side) for h in copy.hexes] == [h.center(hf.side) for h in hf.hexes]
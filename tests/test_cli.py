@@ -0,0 +1,81 @@
+import json, os, subprocess, sys
+import pytest
+from conftest import ROOT, data_path
+import cli
+
+BASIC = data_path('basic_hex_flower.xml')
+UNIFORM = data_path('uniform_basic_hex_flower.xml')
+
+def test_import_leaves_out_tkinter_and_pil():
+    # A fresh interpreter, since other tests import both.
+    code = ("import sys, cli\n"
+            "assert cli.main(['walk', sys.argv[1], '--walks', '2', '--format', 'summary']) == 0\n"
+            "print(sorted(m for m in ('tkinter', 'PIL') if m in sys.modules))\n")
+    out = subprocess.run([sys.executable, '-c', code, BASIC], cwd=ROOT,
+                         capture_output=True, text=True, check=True).stdout
+    assert out.strip().splitlines()[-1] == '[]'
+
+def test_render(tmp_path, capsys):
+    pytest.importorskip('PIL')
+    from PIL import Image
+    out_dir = str(tmp_path / 'out')
+    assert cli.main(['render', BASIC, UNIFORM, '--out-dir', out_dir, '--scale', '0.5']) == 0
+    paths = capsys.readouterr().out.split()
+    assert [os.path.basename(p) for p in paths] == ['basic_hex_flower.png',
+                                                    'uniform_basic_hex_flower.png']
+    with Image.open(paths[0]) as image:
+        assert image.size == (200, 200)
+    assert cli.main(['render', BASIC, '--out-dir', out_dir, '--format', 'svg',
+                     '--heatmap', 'stationary']) == 0
+    path = capsys.readouterr().out.strip()
+    assert path.endswith('basic_hex_flower_stationary.svg')
+    with open(path) as myfile:
+        assert myfile.read().count('<polygon') == 19
+    # --log reads one flower's walks only.
+    assert cli.main(['render', BASIC, UNIFORM, '--out-dir', out_dir,
+                     '--heatmap', 'frequency', '--log', 'walks.csv']) == 1
+    assert '--log needs exactly one flower' in capsys.readouterr().err
+
+def test_compare(tmp_path, capsys):
+    assert cli.main(['compare', BASIC, UNIFORM, '--top', '2']) == 0
+    assert capsys.readouterr().out.startswith(f"Baseline: {BASIC}")
+    path = str(tmp_path / 'compare.json')
+    assert cli.main(['compare', BASIC, UNIFORM, '--format', 'json',
+                     '--no-sensitivity', '--output', path]) == 0
+    with open(path) as myfile:
+        report = json.load(myfile)
+    assert sorted(report['flowers']) == sorted([BASIC, UNIFORM])
+
+def test_estimate(capsys):
+    assert cli.main(['estimate', BASIC, '--stat', 'frequency:normal', '--precision', '0.05',
+                     '--batch', '200', '--length', '50', '--seed', '40']) == 0
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[0].startswith(f"{BASIC}: ") and 'converged' in lines[0]
+    name, estimate, _, half_width = lines[1].split()
+    assert 0.0 < float(estimate) < 1.0 and float(half_width) <= 0.05
+    assert cli.main(['estimate', BASIC, '--stat', 'hitting:19', '--versus', UNIFORM,
+                     '--precision', '1e-9', '--batch', '100', '--max-walks', '400',
+                     '--length', '20', '--seed', '40']) == 0
+    out = capsys.readouterr().out
+    assert f"{BASIC} minus {UNIFORM}" in out and 'stopped at --max-walks' in out
+    assert cli.main(['estimate', BASIC, '--stat', 'nonsense']) == 1
+
+def test_mixing(tmp_path, capsys, load_flower):
+    from lib.classes import HexFlower
+    from lib.xml_functions import write_xml_hex_flower
+    assert cli.main(['mixing', BASIC, '--check']) == 0
+    out = capsys.readouterr().out
+    assert out.startswith(f"{BASIC}:") and 'WARNING' not in out
+    # A flower whose hexes all have every edge blocked never moves.
+    stuck = HexFlower.unpack(load_flower().pack())
+    for hex in stuck.hexes:
+        for k in hex.adjacency:
+            hex.adjacency[k] = None
+    path = str(tmp_path / 'stuck.xml')
+    write_xml_hex_flower(stuck, path)
+    assert cli.main(['mixing', path]) == 0
+    assert 'WARNING reducible' in capsys.readouterr().out
+    assert cli.main(['mixing', BASIC, path, '--check', '--format', 'json']) == 1
+    report = json.loads(capsys.readouterr().out)
+    assert [r['flower'] for r in report] == [BASIC, path]
+    assert report[0]['problems'] == [] and report[1]['irreducible'] is False
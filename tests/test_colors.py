@@ -0,0 +1,49 @@
+import csv, os
+import pytest
+from lib.colors import Color, Colors, ColorTable, color_table
+
+# baseline_colors.csv holds every (name, red, green, blue) of the original
+# Colors class, which spelled each color out as a class constant, in the
+# order its __init__ added them.
+BASELINE = os.path.join(os.path.dirname(__file__), 'data', 'baseline_colors.csv')
+
+@pytest.fixture(scope='module')
+def baseline():
+    with open(BASELINE, newline='') as myfile:
+        return [(row['name'], Color(int(row['red']), int(row['green']), int(row['blue'])))
+                for row in csv.DictReader(myfile)]
+
+def test_packed_table_matches_original_colors(baseline):
+    assert list(Colors().items()) == baseline
+
+def test_class_constants_match_original_colors(baseline):
+    for name, color in baseline:
+        assert getattr(Colors, name.upper()) == color
+        assert getattr(Colors(), name.upper()) == color
+    with pytest.raises(AttributeError):
+        Colors.NOTACOLOR
+
+def test_shared_table_is_read_only():
+    table = color_table()
+    assert table is color_table()
+    assert isinstance(table, ColorTable)
+    with pytest.raises(TypeError):
+        table['newcolor'] = Color(1, 2, 3)
+    with pytest.raises(TypeError):
+        table.pop('black')
+    copy = table.copy()
+    copy['newcolor'] = Color(1, 2, 3)
+    assert 'newcolor' not in table
+
+def test_lookups_agree_with_colors(baseline):
+    table, colors = color_table(), Colors()
+    for name, color in baseline:
+        h = colors.color_to_hex(color)
+        assert table.color_to_hex(color) == h
+        assert table.hex_to_color(h) == color
+        assert table.hex_to_color(h.lower()) == color
+        # The first name listed wins for colors with several names.
+        assert table.color_to_text(color) == colors.color_to_text(color)
+        assert table.text_to_color(name) == color
+    with pytest.raises(ValueError):
+        table.color_to_text(Color(1, 2, 3))
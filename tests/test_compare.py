@@ -0,0 +1,48 @@
+import json
+import numpy as np
+import pytest
+from lib.classes import HexFlower
+from lib.compare import edge_variants, compare_flowers, comparison_json, format_comparison
+from lib.markov import transition_matrix, zone_statistics
+
+def blocked(hf, hex_id, edge) -> HexFlower:
+    # A copy of hf with one edge of one hex blocked.
+    copy = HexFlower.unpack(hf.pack())
+    copy.hexes[hex_id - 1].adjacency[edge] = None
+    return copy
+
+def test_edge_variants_match_blocked_flowers(load_flower):
+    hf = load_flower()
+    edges, Ps = edge_variants(hf)
+    assert len(edges) == len(Ps) > 0
+    np.testing.assert_allclose(Ps.sum(axis=-1), 1.0)
+    for (hex_id, edge, target), P in list(zip(edges, Ps))[::7]:
+        assert hf.hexes[hex_id - 1].adjacency[edge] == target
+        np.testing.assert_allclose(P, transition_matrix(blocked(hf, hex_id, edge)))
+
+def test_compare_flowers_matches_zone_statistics(load_flower):
+    flowers = {'basic': load_flower(),
+               'uniform': load_flower('uniform_basic_hex_flower.xml')}
+    report = compare_flowers(flowers)
+    for name, hf in flowers.items():
+        for zone, stats in zone_statistics(hf).items():
+            got = report['flowers'][name]['zones'][zone]
+            assert got['frequency'] == pytest.approx(stats['frequency'])
+            assert got['dwell'] == pytest.approx(stats['dwell'])
+    base, other = report['flowers']['basic'], report['flowers']['uniform']
+    np.testing.assert_allclose(report['differences']['uniform']['stationary'],
+                               other['stationary'] - base['stationary'])
+    hex_id, edge, target, change = report['sensitivity']['basic'][0]
+    variant = zone_statistics(blocked(flowers['basic'], hex_id, edge))
+    for zone, stats in variant.items():
+        assert change['zones'][zone]['frequency'] == pytest.approx(
+            stats['frequency'] - base['zones'][zone]['frequency'], abs=1e-12)
+
+def test_comparison_output(load_flower):
+    report = compare_flowers({'a': load_flower(),
+                              'b': load_flower('nuniform_basic_hex_flower.xml')})
+    json.dumps(comparison_json(report))
+    text = format_comparison(report)
+    assert text.startswith('Baseline: a')
+    with pytest.raises(ValueError):
+        compare_flowers({})
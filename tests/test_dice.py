@@ -0,0 +1,64 @@
+import itertools, random
+import numpy as np
+import pytest
+from lib.classes import BasicWalk
+from lib.dice import Dice, parse_roll_range, check_outcomes
+
+def brute_force(*faces, modifier=0) -> dict:
+    # Exact distribution of a sum of dice by listing every combination.
+    counts = {}
+    for combo in itertools.product(*(range(1, f + 1) for f in faces)):
+        total = sum(combo) + modifier
+        counts[total] = counts.get(total, 0) + 1
+    n = float(np.prod(faces))
+    return {t: c / n for t, c in sorted(counts.items())}
+
+@pytest.mark.parametrize('expression, faces, modifier', [
+    ('2d6', (6, 6), 0), ('d6+d8', (6, 8), 0), ('3d4', (4, 4, 4), 0),
+    ('1d8', (8,), 0), ('2d6+1', (6, 6), 1), ('d10+d4-3', (10, 4), -3)])
+def test_distribution_matches_brute_force(expression, faces, modifier):
+    exact = brute_force(*faces, modifier=modifier)
+    got = Dice(expression).distribution()
+    assert list(got) == list(exact)
+    assert list(got.values()) == pytest.approx(list(exact.values()))
+
+def test_tuple_form_and_expressions_agree():
+    assert Dice(('d6', 'd6')) == Dice('2d6')
+    assert Dice((None, 'd8')) == Dice('d8')
+    assert Dice(('d6', 'd8')).expression == 'd6+d8'
+    assert Dice(('d8', 'd6')).expression == 'd6+d8'
+    assert Dice('d8+d6') == Dice('d6+d8')
+    assert Dice('d8+d6').distribution() == Dice('d6+d8').distribution()
+    assert Dice('-d4+d10+3+d4-1').expression == 'd4+d10-d4+2'
+    assert Dice('2d6-d4').rolls.tolist() == list(range(-2, 12))
+    for bad in ('', '3', 'two dice', 'd0', 5):
+        with pytest.raises(ValueError):
+            Dice(bad)
+
+def test_rolls_follow_the_distribution():
+    dice = Dice('d6+d8')
+    rng = random.Random(41)
+    rolls = [dice.roll(rng) for _ in range(40000)]
+    for total, p in dice.distribution().items():
+        assert rolls.count(total) / len(rolls) == pytest.approx(p, abs=0.01)
+
+def test_parse_roll_range():
+    assert parse_roll_range('7') == [7]
+    assert parse_roll_range('3-5') == [3, 4, 5]
+    assert parse_roll_range('-2--1') == [-2, -1]
+    for bad in ('5-3', 'a', '1-2-3'):
+        with pytest.raises(ValueError):
+            parse_roll_range(bad)
+
+def test_builtin_tables_cover_every_roll():
+    for expression in BasicWalk.builtin_tables:
+        table = check_outcomes(Dice(expression), BasicWalk.outcomes_for(expression))
+        assert set(table.values()) <= {None, 'a', 'b', 'c', 'd', 'e', 'f'}
+    with pytest.raises(ValueError):
+        check_outcomes(Dice('2d6'), {r: 'a' for r in range(2, 12)})
+    with pytest.raises(ValueError):
+        BasicWalk.outcomes_for('d20')
+
+@pytest.mark.parametrize('dice', ['d6+d8', 'd8+d6', ('d6', 'd8'), ('d8', 'd6')])
+def test_dice_order_finds_the_builtin_table(dice):
+    assert BasicWalk.outcomes_for(dice) == BasicWalk.outcomes_for('d6+d8')
@@ -0,0 +1,112 @@
+import os, re
+import numpy as np
+import pytest
+from conftest import ROOT
+from lib.classes import HexFlower
+from lib.export import render_image, render_svg, _css
+from lib.icons import load_icon, ICON_SIZE
+
+pytest.importorskip('PIL')
+
+def centers(hf, scale=1.0) -> dict:
+    return {hex_id: np.array(points).reshape(6, 2).mean(axis=0)
+            for hex_id, points in hf.polygons(zoom=scale).items()}
+
+def rgb(color) -> tuple:
+    color = _css(color)
+    return tuple(int(color[i:i + 2], 16) for i in (1, 3, 5))
+
+def test_image_size(load_flower):
+    hf = load_flower()
+    assert render_image(hf).size == (hf.canvas_width, hf.canvas_height)
+    assert render_image(hf, scale=0.25).size == (round(hf.canvas_width * 0.25),
+                                                 round(hf.canvas_height * 0.25))
+    assert render_image(hf, background=None).getpixel((0, 0)) == (0, 0, 0, 0)
+
+@pytest.mark.parametrize('scale', (1.0, 2.0))
+def test_polygon_fills(load_flower, scale):
+    hf = load_flower()
+    fills = {hex_id: '#%02x00%02x' % (10 * hex_id, 255 - 10 * hex_id)
+             for hex_id in range(1, 20, 2)}
+    image = render_image(hf, scale=scale, fills=fills).convert('RGB')
+    corners = {k: np.array(v).reshape(6, 2) for k, v in hf.polygons(zoom=scale).items()}
+    for hex in hf.hexes:
+        # Halfway from the center to a corner is clear of the label and outline.
+        x, y = (centers(hf, scale)[hex.id] + corners[hex.id][1]) / 2
+        expected = fills.get(hex.id, hex.zone.color)
+        assert image.getpixel((round(x), round(y))) == rgb(expected)
+
+def test_icon_placement(load_flower, monkeypatch):
+    monkeypatch.chdir(ROOT)
+    hf = load_flower('generic_wind_speed_hex_flower.xml')
+    # The same flower with no icons and empty labels shows only the fills,
+    # so every pixel that differs belongs to an icon.
+    plain = HexFlower.unpack(hf.pack())
+    for hex in plain.hexes:
+        hex.zone.icon, hex.zone.label = None, ''
+    changed = np.any(np.asarray(render_image(hf)) != np.asarray(render_image(plain)),
+                     axis=2)
+    boxes = np.zeros_like(changed)
+    w, h = ICON_SIZE
+    for hex_id, (x, y) in centers(hf).items():
+        left, top = round(x - w / 2), round(y - h / 2)
+        boxes[top:top + h, left:left + w] = True
+        ys, xs = np.nonzero(changed[top:top + h, left:left + w])
+        icon = load_icon(hf.hexes[hex_id - 1].zone.icon)
+        assert (xs.min(), ys.min(), xs.max() + 1, ys.max() + 1) == icon.getbbox()
+    assert not np.any(changed & ~boxes)
+
+def test_svg_matches_the_image(load_flower, monkeypatch):
+    hf = load_flower()
+    svg = render_svg(hf, scale=2.0, fills={3: 'red'})
+    assert 'width="{:g}" height="{:g}"'.format(2 * hf.canvas_width,
+                                               2 * hf.canvas_height) in svg
+    polygons = re.findall(r'<polygon id="hex(\d+)" points="([^"]*)" fill="([^"]*)"', svg)
+    assert [int(p[0]) for p in polygons] == list(range(1, 20))
+    for hex_id, points, fill in polygons:
+        xy = [float(v) for v in re.split('[ ,]', points)]
+        np.testing.assert_allclose(xy, hf.polygons(zoom=2.0)[int(hex_id)], atol=1e-3)
+        assert fill == _css('red' if hex_id == '3' else hf.hexes[int(hex_id) - 1].zone.color)
+    monkeypatch.chdir(ROOT)
+    wind = load_flower('generic_wind_speed_hex_flower.xml')
+    images = re.findall(r'<image x="([^"]*)" y="([^"]*)" width="30" height="30"',
+                        render_svg(wind))
+    assert len(images) == len(wind.hexes)
+    for (x, y), (cx, cy) in zip(images, centers(wind).values()):
+        assert (float(x), float(y)) == pytest.approx((cx - 15, cy - 15), abs=1e-3)
+
+def test_walk_frames_highlight_the_move(load_flower):
+    from lib.export import walk_frames
+    hf = load_flower()
+    moves = [(1, 'normal', None), 2, 9, 9, 19]
+    frames = list(walk_frames(hf, moves, highlight='yellow'))
+    assert len(frames) == len(moves)
+    for move, frame in zip(moves, frames):
+        hex_id = move[0] if isinstance(move, tuple) else move
+        assert frame.mode == 'P' and frame.size == (hf.canvas_width, hf.canvas_height)
+        assert frame.getpalette()[765:768] == [255, 255, 0]
+        pixels = np.asarray(frame)
+        ys, xs = np.nonzero(pixels == 255)
+        # Only the outline of the current hex uses the highlight index.
+        corners = np.array(hf.polygons()[hex_id]).reshape(6, 2)
+        assert xs.min() >= corners[:, 0].min() - 4 and xs.max() <= corners[:, 0].max() + 4
+        assert ys.min() >= corners[:, 1].min() - 4 and ys.max() <= corners[:, 1].max() + 4
+        x, y = np.round(corners[0]).astype(int)
+        assert pixels[y, x] == 255
+    assert np.array_equal(np.asarray(frames[2]), np.asarray(frames[3]))
+
+def test_walk_gif_and_frames(load_flower, tmp_path):
+    from PIL import Image, ImageSequence
+    from lib.export import export_walk_gif, export_walk_frames
+    hf = load_flower()
+    moves = [1, 2, 3, 10, 11, 12, 4]
+    path = export_walk_gif(hf, moves, str(tmp_path / 'walk.gif'), duration=120)
+    with Image.open(path) as gif:
+        assert gif.n_frames == len(moves)
+        assert gif.info['duration'] == 120
+        for frame in ImageSequence.Iterator(gif):
+            assert 255 in np.asarray(frame)
+    paths = export_walk_frames(hf, moves, str(tmp_path / 'frames'), prefix='day')
+    assert [os.path.basename(p) for p in paths] == [f"day_{n}.png" for n in range(7)]
+    with pytest.raises(ValueError):
+        export_walk_gif(hf, [], str(tmp_path / 'empty.gif'))
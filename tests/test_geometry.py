@@ -0,0 +1,77 @@
+import math
+import numpy as np
+import pytest
+from lib.geometry import flower_geometry, COS60, SIN60
+
+# The layout math from before the geometry was cached. It rounded the hex
+# height and vertices to 0.01, so for the usual sides the two agree to within
+# about 0.008 px.
+TOLERANCE = 0.01
+
+def baseline_vertices(hf, side) -> dict:
+    h = round(side * math.sin(math.pi / 3), 2)
+    b = round(side * math.cos(math.pi / 3), 2)
+    vertices = {}
+    for i in range(hf.hfcols):
+        x = round(((i + 1) * b) + (i * side), 2)
+        for n, hex_id in enumerate(hf.hfcolumns[i]):
+            if hex_id is not None:
+                vertices[hex_id] = (x, round(h * (i % 2) + n * 2 * h, 2))
+    return vertices
+
+def baseline_polygon(vertex, side) -> list:
+    b, h = side * math.cos(math.pi / 3), side * math.sin(math.pi / 3)
+    x, y = vertex
+    return [x, y, x + side, y, x + b + side, y + h,
+            x + side, y + 2 * h, x, y + 2 * h, x - b, y + h]
+
+@pytest.mark.parametrize('name', ('basic_hex_flower.xml', 'generic_wind_speed_hex_flower.xml'))
+@pytest.mark.parametrize('side', (20, 25, 40))
+def test_polygons_match_the_baseline(load_flower, name, side):
+    hf = load_flower(name)
+    vertices = baseline_vertices(hf, side)
+    polygons = hf.geometry.polygons(side)
+    assert sorted(polygons) == sorted(vertices)
+    for hex_id, vertex in vertices.items():
+        np.testing.assert_allclose(polygons[hex_id], baseline_polygon(vertex, side),
+                                   atol=TOLERANCE)
+        np.testing.assert_allclose(hf.geometry.vertex(hex_id, side), vertex, atol=TOLERANCE)
+
+def test_flower_vertices_and_centers(load_flower):
+    hf = load_flower()
+    vertices = baseline_vertices(hf, hf.side)
+    for hex in hf.hexes:
+        np.testing.assert_allclose(hex.vertex, vertices[hex.id], atol=TOLERANCE)
+        x, y = vertices[hex.id]
+        assert hex.center(hf.side) == (round(hf.side * COS60 + x), round(hf.side * SIN60 + y))
+    np.testing.assert_allclose(hf.polygons(zoom=2.0, pan=(5, -3))[7],
+                               np.array(baseline_polygon(vertices[7], hf.side)) * 2
+                               + [5, -3] * 6, atol=2 * TOLERANCE)
+
+def test_layouts_share_one_geometry(load_flower):
+    hf, other = load_flower(), load_flower('uniform_basic_hex_flower.xml')
+    assert hf.geometry is other.geometry is flower_geometry(hf.hfcolumns)
+
+def test_proximity_inside_and_outside(load_flower):
+    hf = load_flower()
+    for hex in hf.hexes:
+        assert hf.proximity(hex.center(hf.side)) == hex.id
+        corners = np.array(hf.polygons()[hex.id]).reshape(6, 2)
+        center = corners.mean(axis=0)
+        for corner in corners:
+            # Just inside each corner, where three hexes meet.
+            assert hf.proximity(tuple(center + 0.9 * (corner - center))) == hex.id
+    top = min(hf.hexes, key=lambda hex: hex.vertex[1])
+    x, y = top.center(hf.side)
+    assert hf.proximity((x, y - hf.side * SIN60 - 1)) is None
+    for point in ((-1, -1), (0, 0), (hf.canvas_width, hf.canvas_height), (-50, 200)):
+        assert hf.proximity(point) is None
+
+def test_hex_at_takes_many_points(load_flower):
+    hf = load_flower()
+    _, centers = hf.geometry.transform(20, zoom=2.0)
+    points = centers.tolist() + [(-10, -10)]
+    ids = hf.geometry.hex_at(points, side=20, zoom=2.0)
+    assert ids.tolist() == [hex.id for hex in hf.hexes] + [0]
+    panned = np.array(points[:3]) / 2 + [100, 50]
+    assert hf.geometry.hex_at(panned, 20, pan=(100, 50)).tolist() == [1, 2, 3]
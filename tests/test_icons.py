@@ -0,0 +1,76 @@
+import os, shutil
+import pytest
+from conftest import data_path
+import lib.icons as icons
+from lib.icons import ICON_SIZE, IconAtlas, clear_icon_cache, icon_key, load_icon
+
+pytest.importorskip('PIL')
+
+@pytest.fixture
+def icon(tmp_path):
+    clear_icon_cache()
+    path = str(tmp_path / 'wind.png')
+    shutil.copy(data_path('icons', 'wi-wind-beaufort-3.png'), path)
+    yield path
+    clear_icon_cache()
+
+def test_cache_hits_share_one_image(icon, monkeypatch):
+    first = load_icon(icon)
+    assert first.size == ICON_SIZE
+    # A relative path to the same file is the same cache entry.
+    monkeypatch.chdir(os.path.dirname(icon))
+    assert load_icon('wind.png') is first
+    small = load_icon(icon, (10, 10))
+    assert small.size == (10, 10) and small is not first
+    assert load_icon(icon, (10, 10)) is small
+
+def test_modified_files_are_decoded_again(icon):
+    first = load_icon(icon)
+    shutil.copy(data_path('icons', 'wi-wind-beaufort-9.png'), icon)
+    stat = os.stat(icon)
+    os.utime(icon, (stat.st_atime, stat.st_mtime + 10))
+    assert icon_key(icon)[2] == stat.st_mtime + 10
+    second = load_icon(icon)
+    assert second is not first
+    assert second.tobytes() != first.tobytes()
+    assert load_icon(icon) is second
+
+def test_pil_and_tk_caches_are_separate(icon):
+    load_icon(icon)
+    key = (os.path.abspath(icon), ICON_SIZE)
+    assert key in icons._images and key not in icons._photos
+    tkinter = pytest.importorskip('tkinter')
+    try:
+        root = tkinter.Tk()
+    except tkinter.TclError:
+        pytest.skip("no display for Tk")
+    try:
+        photo = icons.photo_icon(icon)
+        assert icons.photo_icon(icon) is photo
+        assert icons._photos[key][1] is photo and icons._images[key][1] is not photo
+        clear_icon_cache(photos_only=True)
+        assert key not in icons._photos and key in icons._images
+    finally:
+        clear_icon_cache(photos_only=True)
+        root.destroy()
+
+def test_clear_icon_cache(icon):
+    first = load_icon(icon)
+    clear_icon_cache(photos_only=True)
+    assert load_icon(icon) is first
+    clear_icon_cache()
+    assert load_icon(icon) is not first
+
+def test_atlas_layout(icon):
+    paths = [data_path('icons', f'wi-wind-beaufort-{n}.png') for n in range(5)]
+    atlas = IconAtlas(paths + [paths[0]], size=(20, 16), columns=3)
+    assert atlas.image.size == (60, 32) and atlas.image.mode == 'RGBA'
+    assert len(atlas.boxes) == 5
+    for n, path in enumerate(paths):
+        x, y = (n % 3) * 20, (n // 3) * 16
+        assert atlas.boxes[os.path.abspath(path)] == (x, y, x + 20, y + 16)
+        assert atlas.crop(path).tobytes() == \
+            load_icon(path, (20, 16)).convert('RGBA').tobytes()
+    assert IconAtlas(paths[:2], columns=8).image.size == (2 * ICON_SIZE[0], ICON_SIZE[1])
+    with pytest.raises(KeyError):
+        atlas.crop(icon)
@@ -0,0 +1,58 @@
+import numpy as np
+import pytest
+from lib.markov import (stationary_distribution, mixing_times, mixing_time,
+                        spectral_gap, period, is_irreducible, chain_diagnostics)
+
+FLOWERS = ('basic_hex_flower.xml', 'uniform_basic_hex_flower.xml',
+           'nuniform_basic_hex_flower.xml', 'generic_wind_speed_hex_flower.xml')
+
+def cycle(n) -> np.ndarray:
+    # A walk that always moves on around a ring of n states.
+    return np.roll(np.eye(n), 1, axis=1)
+
+def test_periodic_walks():
+    assert period(cycle(2)) == 2
+    assert period(cycle(5)) == 5
+    assert spectral_gap(cycle(3)) == 0.0
+    assert np.all(np.isinf(mixing_times(cycle(3), max_steps=50)))
+    lazy = 0.5 * (cycle(4) + np.eye(4))
+    assert period(lazy) == 1
+    assert spectral_gap(lazy) > 0.0
+
+def test_reducible_walks():
+    P = np.zeros((4, 4))
+    P[:2, :2] = 0.5
+    P[2:, 2:] = 0.5
+    assert not is_irreducible(P)
+    assert spectral_gap(P) == 0.0
+    assert is_irreducible(0.5 * (cycle(4) + np.eye(4)))
+
+def test_mixing_times_match_matrix_powers():
+    P = np.array([[0.9, 0.1, 0.0], [0.1, 0.8, 0.1], [0.0, 0.2, 0.8]])
+    pi = stationary_distribution(P)
+    times = mixing_times(P, eps=0.1)
+    for start, t in enumerate(times):
+        t = int(t)
+        distance = lambda k: 0.5 * np.abs(np.linalg.matrix_power(P, k)[start] - pi).sum()
+        assert distance(t) <= 0.1 < distance(t - 1)
+    assert mixing_time(P, eps=0.1) == times.max()
+
+def test_stacked_matrices_solve_like_single_ones():
+    Ps = np.stack([cycle(3) * 0.5 + np.eye(3) * 0.5,
+                   np.array([[0.9, 0.1, 0.0], [0.1, 0.8, 0.1], [0.0, 0.2, 0.8]])])
+    pis = stationary_distribution(Ps)
+    for P, pi in zip(Ps, pis):
+        np.testing.assert_allclose(pi, stationary_distribution(P))
+    np.testing.assert_array_equal(mixing_times(Ps),
+                                  np.stack([mixing_times(P) for P in Ps]))
+
+@pytest.mark.parametrize('name', FLOWERS)
+def test_bundled_flowers_are_well_behaved(load_flower, name):
+    hf = load_flower(name)
+    d = chain_diagnostics(hf)
+    assert d['irreducible']
+    assert d['period'] == 1
+    assert 0.0 < d['spectral_gap'] <= 1.0
+    assert d['relaxation_time'] == pytest.approx(1.0 / d['spectral_gap'])
+    assert d['mixing_time'] == max(d['mixing_times'].values())
+    assert sorted(d['mixing_times']) == [hex.id for hex in hf.hexes]
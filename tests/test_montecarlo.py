@@ -0,0 +1,48 @@
+import numpy as np
+import pytest
+from lib.markov import transition_matrix, stationary_distribution, zone_masks
+from lib.montecarlo import (RatioEstimate, adaptive_walks, adaptive_difference,
+                            parse_statistic)
+
+def test_ratio_estimate_is_the_mean_when_y_is_one():
+    x = np.random.default_rng(45).random(500)
+    estimate = RatioEstimate()
+    estimate.add(np.column_stack((x[:200], np.ones(200))))
+    estimate.add(np.column_stack((x[200:], np.ones(300))))
+    assert estimate.estimate() == pytest.approx(x.mean())
+    assert estimate.half_width(1.96) == pytest.approx(1.96 * x.std(ddof=1) / np.sqrt(500))
+
+def test_parse_statistic():
+    assert parse_statistic('frequency:severe') == ('frequency', 'severe')
+    assert parse_statistic('hitting:19') == ('hitting', 19)
+    with pytest.raises(ValueError):
+        parse_statistic('often:severe')
+
+def test_stationary_frequency_is_within_the_interval(load_flower):
+    hf = load_flower()
+    pi = stationary_distribution(transition_matrix(hf))
+    zone = hf.hexes[0].zone.type
+    exact = pi[zone_masks(hf)[zone]].sum()
+    result = adaptive_walks(hf, 'stationary', 20, [f'frequency:{zone}'],
+                            precision=0.005, seed=45)
+    s = result['statistics'][f'frequency:{zone}']
+    assert result['converged']
+    assert s['half_width'] <= 0.005
+    # Three half widths keeps the test from failing by chance.
+    assert abs(s['estimate'] - exact) <= 3 * s['half_width']
+
+@pytest.mark.parametrize('max_walks', [2, 7, 1001, 1003])
+@pytest.mark.parametrize('antithetic', [False, True])
+def test_max_walks_is_never_passed(load_flower, max_walks, antithetic):
+    result = adaptive_walks(load_flower(), 1, 30, ['frequency:normal'],
+                            precision=1e-9, batch=3, max_walks=max_walks,
+                            antithetic=antithetic, seed=1)
+    assert not result['converged']
+    assert max_walks - 1 <= result['walks'] <= max_walks
+
+def test_difference_of_a_flower_with_itself_is_zero(load_flower):
+    hf = load_flower()
+    result = adaptive_difference(hf, hf, 1, 30, ['frequency:normal'], seed=2)
+    s = result['statistics']['frequency:normal']
+    assert s['estimate'] == 0.0
+    assert result['converged']
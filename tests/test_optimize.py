@@ -0,0 +1,80 @@
+import numpy as np
+import pytest
+from lib.markov import transition_matrix, zone_statistics
+from lib.optimize import FlowerSearch, optimize_flower
+from lib.xml_functions import process_xml_hex_flower, write_xml_hex_flower
+
+def test_evaluate_agrees_with_zone_statistics(load_flower):
+    hf = load_flower()
+    zones = zone_statistics(hf)
+    zone = hf.hexes[0].zone.type
+    search = FlowerSearch(hf, frequency={zone: 0.5}, dwell={zone: 3.0})
+    score, frequency, dwell = search.evaluate(search.adjacency, search.edges)
+    assert frequency[zone] == pytest.approx(zones[zone]['frequency'])
+    assert dwell[zone] == pytest.approx(zones[zone]['dwell'])
+    assert search.count_changes(search.adjacency, search.edges) == 0
+
+def test_design_table_matches_transition_table(load_flower):
+    from lib.markov import transition_table
+    hf = load_flower('nuniform_basic_hex_flower.xml')
+    search = FlowerSearch(hf, frequency={hf.hexes[0].zone.type: 0.5})
+    np.testing.assert_array_equal(search.table(search.adjacency, search.edges),
+                                  transition_table(hf)[0])
+
+def test_propose_handles_hexes_without_neighbors(load_flower):
+    search = FlowerSearch(load_flower(), frequency={'normal': 0.5}, moves=('block',))
+    # Hex 1 has no edges at all, in the flower and in the design.
+    search.neighbors[0] = []
+    search.adjacency = search.adjacency.copy()
+    search.adjacency[0, :] = -1
+    adjacency = search.adjacency
+    rng = np.random.default_rng(42)
+    for _ in range(300):
+        new, _ = search.propose(adjacency, search.edges, rng)
+        assert np.all(new[0] == -1)
+
+def test_optimize_moves_toward_the_target(load_flower, tmp_path):
+    hf = load_flower()
+    zone = hf.hexes[0].zone.type
+    before = zone_statistics(hf)[zone]['frequency']
+    target = min(0.95, before + 0.2)
+    new, report = optimize_flower(hf, frequency={zone: target}, iterations=400,
+                                  restarts=2, processes=1, seed=42)
+    achieved = zone_statistics(new)[zone]['frequency']
+    assert report['frequency'][zone] == (pytest.approx(achieved), target)
+    assert abs(achieved - target) < abs(before - target)
+    assert len(report['changes']) > 0
+    # The design survives a trip through the XML writer and reader.
+    path = str(tmp_path / 'optimized.xml')
+    write_xml_hex_flower(new, path)
+    np.testing.assert_allclose(transition_matrix(process_xml_hex_flower(xmlfile=path)),
+                               transition_matrix(new))
+
+@pytest.mark.parametrize('name', ('basic_hex_flower.xml', 'generic_wind_speed_hex_flower.xml'))
+def test_write_xml_round_trip(load_flower, tmp_path, name):
+    hf = load_flower(name)
+    path = str(tmp_path / name)
+    write_xml_hex_flower(hf, path)
+    assert process_xml_hex_flower(xmlfile=path).pack() == hf.pack()
+
+def test_search_rejects_bad_targets(load_flower):
+    hf = load_flower()
+    with pytest.raises(ValueError):
+        FlowerSearch(hf)
+    with pytest.raises(ValueError):
+        FlowerSearch(hf, frequency={'nowhere': 0.5})
+    with pytest.raises(ValueError):
+        FlowerSearch(hf, frequency={'normal': 1.5})
+    with pytest.raises(ValueError):
+        FlowerSearch(hf, dwell={'normal': 0.5})
+
+def test_optimize_without_a_connected_design(load_flower):
+    from lib.classes import HexFlower
+    hf = HexFlower.unpack(load_flower().pack())
+    # With every edge blocked and no hex to point one at, no move connects it.
+    for hex in hf.hexes:
+        for k in hex.adjacency:
+            hex.adjacency[k] = None
+    with pytest.raises(ValueError, match='reached'):
+        optimize_flower(hf, frequency={'normal': 0.5}, moves=('adjacency', 'block'),
+                        iterations=50, restarts=2, processes=1, seed=42)
@@ -0,0 +1,82 @@
+import numpy as np
+import pytest
+from lib.colors import color_table
+from lib.palette import NearestColorIndex, nearest_color_index
+
+def brute_force(rgb) -> list:
+    # Nearest named color by scanning the whole table, first listed on ties.
+    table = color_table()
+    names = list(table.by_color.values())
+    colors = np.array(list(table.by_color.keys()), dtype=np.int64)
+    dist = ((np.asarray(rgb, dtype=np.int64)[:, None, :] - colors[None, :, :]) ** 2).sum(axis=2)
+    return [names[i] for i in dist.argmin(axis=1)]
+
+def test_nearest_matches_brute_force_on_random_colors():
+    rgb = np.random.default_rng(29).integers(0, 256, size=(5000, 3))
+    assert nearest_color_index().nearest_many(rgb) == brute_force(rgb)
+
+def test_nearest_matches_brute_force_on_cell_edges():
+    # Cell borders and the corners of RGB space are where a grid index
+    # would go wrong if it dropped a candidate.
+    edges = np.unique(np.concatenate([np.arange(0, 256, NearestColorIndex.cell),
+                                      np.arange(NearestColorIndex.cell - 1, 256,
+                                                NearestColorIndex.cell)]))
+    rgb = np.stack(np.meshgrid(edges, edges[::3], edges[::5], indexing='ij'),
+                   axis=-1).reshape(-1, 3)
+    assert nearest_color_index().nearest_many(rgb) == brute_force(rgb)
+
+def test_named_colors_are_their_own_nearest():
+    table = color_table()
+    for color, name in table.by_color.items():
+        assert nearest_color_index().nearest(color) == name
+
+def test_nearest_rejects_out_of_range():
+    with pytest.raises(ValueError):
+        nearest_color_index().nearest_many([[0, 0, 256]])
+
+@pytest.mark.parametrize('fill_type, result', [('str', 'hex'), ('str', 'rgb'),
+                                               ('hex', 'hex'), ('rgb', 'rgb')])
+def test_darken_colors_matches_darken_outline(fill_type, result):
+    from lib.color_functions import darken_outline, memo_clear
+    from lib.palette import darken_colors
+    table = color_table()
+    names = list(table)[:600]
+    fills = {'str': names, 'hex': [table.text_to_hex(n) for n in names],
+             'rgb': [table[n] for n in names]}[fill_type]
+    for darken in (0, 40, 255):
+        memo_clear()
+        batch = darken_colors(fills + fills[:5], darken, fill_type, result)
+        memo_clear()
+        single = [darken_outline(f, darken, fill_type, result) for f in fills]
+        assert batch == single + single[:5]
+
+def test_darken_colors_names_like_darken_outline():
+    from lib.color_functions import darken_outline, memo_clear
+    from lib.palette import darken_colors
+    for name in ('white', 'gray50', 'black'):
+        memo_clear()
+        try:
+            expected = darken_outline(name, 40, 'str', 'str')
+        except ValueError:
+            with pytest.raises(ValueError):
+                darken_colors([name], 40, 'str', 'str')
+        else:
+            assert darken_colors([name], 40, 'str', 'str') == [expected]
+
+def test_outline_memo_stays_bounded():
+    import lib.color_functions as color_functions
+    from lib.color_functions import OUTLINE_MEMO_SIZE, darken_outline, memo_clear
+    from lib.palette import darken_colors
+    assert OUTLINE_MEMO_SIZE == 1024
+    memo_clear()
+    names = list(color_table())
+    for darken in range(0, 60, 5):
+        darken_colors(names, darken)
+        assert len(color_functions._outline_memo) <= OUTLINE_MEMO_SIZE
+        for name in names[:300]:
+            darken_outline(name, darken + 1)
+        assert len(color_functions._outline_memo) <= OUTLINE_MEMO_SIZE
+    assert len(color_functions._outline_memo) == OUTLINE_MEMO_SIZE
+    # The most recent results are the ones kept.
+    assert color_functions.memo_get((names[299], 56, 'str', 'hex')) is not None
+    memo_clear()
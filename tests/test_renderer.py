@@ -0,0 +1,130 @@
+import numpy as np
+import pytest
+from lib.palette import flower_palette
+from lib.renderer import FlowerRenderer
+
+class FakeCanvas():
+    # Stands in for tkinter.Canvas: hands out item ids and records every call.
+    def __init__(self):
+        self.calls = []
+        self.items = {}
+
+    def _create(self, kind, *args, **options):
+        item = len(self.items) + 1
+        self.items[item] = (kind, args, options)
+        self.calls.append((kind,) + args)
+        return item
+
+    def create_polygon(self, *args, **options):
+        return self._create('create_polygon', *args, **options)
+
+    def create_text(self, *args, **options):
+        return self._create('create_text', *args, **options)
+
+    def create_image(self, *args, **options):
+        return self._create('create_image', *args, **options)
+
+    def delete(self, tag):
+        self.calls.append(('delete', tag))
+
+    def itemconfigure(self, item, **options):
+        self.calls.append(('itemconfigure', item, options))
+
+    def coords(self, item, *points):
+        self.calls.append(('coords', item, points))
+
+    def tag_raise(self, tag):
+        self.calls.append(('tag_raise', tag))
+
+@pytest.fixture
+def drawn(load_flower):
+    canvas = FakeCanvas()
+    renderer = FlowerRenderer(canvas, load_flower(), width=3)
+    renderer.draw()
+    canvas.calls = []
+    return canvas, renderer
+
+def test_draw_makes_tagged_items(load_flower):
+    hf = load_flower()
+    canvas = FakeCanvas()
+    renderer = FlowerRenderer(canvas, hf)
+    renderer.draw()
+    assert canvas.calls[0] == ('delete', 'hexflower')
+    palette = flower_palette(hf)
+    for hex in hf.hexes:
+        polygon, label = renderer.items[hex.id]['polygon'], renderer.items[hex.id]['label']
+        kind, args, options = canvas.items[polygon]
+        assert kind == 'create_polygon'
+        assert args[0] == hf.polygons()[hex.id]
+        assert (options['fill'], options['outline']) == palette[hex.id]
+        assert options['tags'] == ('hexflower', f"hex{hex.id}")
+        kind, args, options = canvas.items[label]
+        assert kind == 'create_text' and options['text'] == hex.zone.label
+        assert args == pytest.approx(renderer.centers[hex.id])
+
+def test_icons_are_canvas_images(load_flower, monkeypatch):
+    import lib.renderer
+    # photo_icon needs a Tk root; the renderer only passes its result on.
+    monkeypatch.setattr(lib.renderer, 'photo_icon', lambda icon: ('photo', icon))
+    hf = load_flower('generic_wind_speed_hex_flower.xml')
+    canvas = FakeCanvas()
+    FlowerRenderer(canvas, hf).draw()
+    images = [item for item in canvas.items.values() if item[0] == 'create_image']
+    assert [options['image'] for _, _, options in images] == \
+        [('photo', hex.zone.icon) for hex in hf.hexes]
+
+def test_highlight_only_touches_two_hexes(drawn):
+    canvas, renderer = drawn
+    renderer.highlight(5)
+    polygon = renderer.items[5]['polygon']
+    assert canvas.calls == [('itemconfigure', polygon, {'outline': 'yellow', 'width': 5}),
+                            ('tag_raise', 'hex5')]
+    canvas.calls = []
+    renderer.highlight(5)
+    assert canvas.calls == []
+    renderer.highlight(6)
+    assert canvas.calls == [
+        ('itemconfigure', polygon, {'outline': renderer.styles[5][1], 'width': 3}),
+        ('itemconfigure', renderer.items[6]['polygon'], {'outline': 'yellow', 'width': 5}),
+        ('tag_raise', 'hex6')]
+    assert renderer.current == 6
+
+def test_restyle_keeps_the_highlight(drawn):
+    canvas, renderer = drawn
+    renderer.highlight(2)
+    canvas.calls = []
+    renderer.restyle(2, fill='red', outline='blue')
+    assert canvas.calls == [('itemconfigure', renderer.items[2]['polygon'], {'fill': 'red'})]
+    assert renderer.styles[2] == ('red', 'blue')
+    renderer.restyle(3, outline='green')
+    assert canvas.calls[-1] == ('itemconfigure', renderer.items[3]['polygon'],
+                                {'fill': renderer.styles[3][0], 'outline': 'green'})
+    # Moving the highlight on puts back the new outline.
+    renderer.highlight(3)
+    assert canvas.calls[-3] == ('itemconfigure', renderer.items[2]['polygon'],
+                                {'outline': 'blue', 'width': 3})
+
+def test_overlay_and_clear(drawn):
+    canvas, renderer = drawn
+    renderer.overlay({1: '#ff0000', 4: '#00ff00'})
+    renderer.clear_overlay()
+    configured = [(call[1], call[2]['fill']) for call in canvas.calls]
+    assert configured[:2] == [(renderer.items[1]['polygon'], '#ff0000'),
+                              (renderer.items[4]['polygon'], '#00ff00')]
+    assert sorted(configured[2:]) == sorted([(renderer.items[1]['polygon'], renderer.styles[1][0]),
+                                             (renderer.items[4]['polygon'], renderer.styles[4][0])])
+    assert renderer.overlaid == set()
+
+def test_view_moves_items_without_redrawing(drawn, load_flower):
+    canvas, renderer = drawn
+    hf = load_flower()
+    renderer.view(zoom=1.5, pan=(10, 20))
+    assert all(call[0] == 'coords' for call in canvas.calls)
+    assert len(canvas.calls) == 2 * len(hf.hexes)
+    moved = {call[1]: call[2] for call in canvas.calls}
+    for hex in hf.hexes:
+        items = renderer.items[hex.id]
+        np.testing.assert_allclose(moved[items['polygon']],
+                                   hf.polygons(zoom=1.5, pan=(10, 20))[hex.id])
+        corners = np.array(moved[items['polygon']]).reshape(6, 2)
+        np.testing.assert_allclose(moved[items['label']], corners.mean(axis=0))
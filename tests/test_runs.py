@@ -0,0 +1,65 @@
+import numpy as np
+import pytest
+from conftest import data_path
+from lib.markov import transition_matrix, expected_dwell
+from lib.runs import (run_length_encode, analyze_walks, load_walk_paths,
+                      save_walk_paths)
+from lib.simulation import simulate_walks
+
+def test_run_length_encode_splits_walks():
+    labels = [1, 1, 2, 2, 2, 2, 3]
+    walks = [0, 0, 0, 1, 1, 1, 1]
+    values, lengths, starts, censored = run_length_encode(labels, walks)
+    assert values.tolist() == [1, 2, 2, 3]
+    assert lengths.tolist() == [2, 1, 3, 1]
+    assert starts.tolist() == [0, 2, 3, 6]
+    assert censored.tolist() == [True, True, True, True]
+    values, lengths, _, censored = run_length_encode([5, 6, 6, 6, 5, 5])
+    assert lengths.tolist() == [1, 3, 2]
+    assert censored.tolist() == [True, False, True]
+
+def test_hex_runs_match_expected_dwell(load_flower):
+    hf = load_flower()
+    dwell = expected_dwell(transition_matrix(hf))
+    paths = simulate_walks(hf, 1, 2000, walks=200, seed=44)
+    report = analyze_walks(hf, paths, by='hex', complete_only=True)
+    for hex_id, run in report['runs'].items():
+        if run['runs'] > 2000:
+            assert run['mean'] == pytest.approx(dwell[hex_id - 1], rel=0.05)
+
+def test_npy_log_round_trip(load_flower, tmp_path):
+    hf = load_flower()
+    paths = simulate_walks(hf, 1, 30, walks=4, seed=1)
+    save_walk_paths(str(tmp_path / 'walks.npy'), paths)
+    flat, walks = load_walk_paths(str(tmp_path / 'walks.npy'))
+    np.testing.assert_array_equal(flat, paths.ravel())
+    np.testing.assert_array_equal(walks, np.repeat(np.arange(4), 31))
+
+def test_csv_log_keeps_flowers_apart(tmp_path):
+    import cli
+    log = str(tmp_path / 'walks.csv')
+    first, second = data_path('basic_hex_flower.xml'), data_path('uniform_basic_hex_flower.xml')
+    assert cli.main(['walk', first, second, '--walks', '3', '--length', '10',
+                     '--seed', '1', '--output', log]) == 0
+    paths, walks = load_walk_paths(log)
+    assert len(paths) == 66
+    # Walk 0 of each flower is its own walk, so no run crosses flowers.
+    assert np.unique(walks).tolist() == list(range(6))
+    assert np.all(np.bincount(walks) == 11)
+    paths, walks = load_walk_paths(log, flower=second)
+    assert len(paths) == 33 and np.unique(walks).tolist() == [0, 1, 2]
+
+def test_seekable_log_round_trip(tmp_path, capsys):
+    import cli
+    from lib.walklog import WalkLogReader
+    log = str(tmp_path / 'walks.log')
+    flower = data_path('basic_hex_flower.xml')
+    assert cli.main(['walk', flower, '--walks', '3', '--length', '10',
+                     '--seed', '1', '--format', 'log', '--output', log]) == 0
+    paths, walks = load_walk_paths(log)
+    with WalkLogReader(log) as reader:
+        moves = [m for w in range(3) for m in reader.replay(w)]
+    assert paths.tolist() == [m[2] for m in moves]
+    assert walks.tolist() == [m[0] for m in moves]
+    assert cli.main(['runs', flower, '--log', log]) == 0
+    assert 'walks 0 to 2' in capsys.readouterr().out
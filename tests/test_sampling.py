@@ -0,0 +1,42 @@
+import numpy as np
+import pytest
+from lib.markov import transition_matrix, stationary_distribution
+from lib.simulation import (draw_uniforms, rolls_from_uniforms, stratified_starts,
+                            simulate_walks, simulate_variants)
+
+def test_antithetic_uniforms_come_in_pairs():
+    u = draw_uniforms(7, 20, seed=47, antithetic=True)
+    assert u.shape == (7, 20)
+    np.testing.assert_allclose(u[0:6:2] + u[1:6:2], 1.0)
+    assert np.all((u >= 0.0) & (u <= 1.0))
+
+def test_rolls_from_uniforms_edges():
+    probs = np.array([0.25, 0.5, 0.25])
+    rolls = rolls_from_uniforms(np.array([0.0, 0.2499, 0.25, 0.7499, 0.75, 1.0]), probs)
+    assert rolls.tolist() == [0, 0, 1, 1, 2, 2]
+
+def test_stratified_starts_are_proportional():
+    weights = np.array([0.5, 0.0, 0.3, 0.2])
+    starts = stratified_starts(weights, 1000, seed=1)
+    np.testing.assert_allclose(np.bincount(starts, minlength=5)[1:], weights * 1000, atol=1)
+    pairs = stratified_starts(weights, 11, seed=1, pairs=True)
+    assert len(pairs) == 11
+    assert np.all(pairs[0:10:2] == pairs[1:10:2])
+    with pytest.raises(ValueError):
+        stratified_starts([0.0, 0.0], 4)
+
+def test_antithetic_walks_keep_the_distribution(load_flower):
+    hf = load_flower()
+    pi = stationary_distribution(transition_matrix(hf))
+    paths = simulate_walks(hf, 1, 400, walks=1000, seed=47, antithetic=True)
+    counts = np.bincount(paths[:, 100:].ravel() - 1, minlength=len(hf.hexes))
+    np.testing.assert_allclose(counts / counts.sum(), pi, atol=0.01)
+
+def test_common_random_numbers_match_for_the_same_flower(load_flower):
+    hf = load_flower()
+    a, b = simulate_variants([hf, hf], 1, 50, walks=20, seed=3)
+    np.testing.assert_array_equal(a, b)
+    other = load_flower('uniform_basic_hex_flower.xml')
+    c, d = simulate_variants([hf, other], 1, 50, walks=20, seed=3)
+    np.testing.assert_array_equal(c, a)
+    assert d.shape == c.shape
@@ -0,0 +1,49 @@
+import time
+from lib.classes import BasicWalk
+from lib.scheduler import WalkScheduler
+
+class FakeRoot():
+    # Stands in for tkinter.Tk: after() callbacks are queued and run by the
+    # test instead of an event loop.
+    def __init__(self):
+        self.jobs = []
+
+    def after(self, delay, callback):
+        self.jobs.append(callback)
+        return len(self.jobs)
+
+    def after_cancel(self, job):
+        pass
+
+    def run(self, count):
+        for _ in range(count):
+            self.jobs.pop(0)()
+
+def test_stop_reports_only_displayed_moves(load_flower):
+    walk = BasicWalk(hf=load_flower(), start=1, moves=15)
+    root, shown, finished = FakeRoot(), [], []
+    scheduler = WalkScheduler(root, walk, on_move=lambda n, move: shown.append(n),
+                              on_finish=lambda stopped: finished.append(
+                                  (stopped, scheduler.displayed, len(walk.moves))))
+    scheduler.start()
+    # Give the engine time to make every move ahead of the display.
+    deadline = time.time() + 5
+    while len(walk.moves) < 16 and time.time() < deadline:
+        time.sleep(0.01)
+    root.run(3)
+    scheduler.stop()
+    assert shown == [1, 2, 3]
+    assert finished == [(True, 3, 16)]
+    assert scheduler.state == 'stopped'
+    assert len(walk.moves[:scheduler.displayed + 1]) == 4
+
+def test_finished_walk_displays_every_move(load_flower):
+    walk = BasicWalk(hf=load_flower(), start=1, moves=5)
+    root, shown = FakeRoot(), []
+    scheduler = WalkScheduler(root, walk, on_move=lambda n, move: shown.append(move),
+                              threaded=False)
+    scheduler.start()
+    root.run(6)
+    assert scheduler.state == 'finished'
+    assert shown == walk.moves[1:]
+    assert scheduler.displayed == 5
@@ -0,0 +1,63 @@
+import numpy as np
+import pytest
+from lib.markov import transition_matrix, stationary_distribution, expected_dwell
+from lib.simulation import simulate_walks, visit_counts
+from lib.heatmap import heat_values, heat_fills
+from lib.palette import color_ramp
+
+FLOWERS = ('basic_hex_flower.xml', 'uniform_basic_hex_flower.xml',
+           'nuniform_basic_hex_flower.xml', 'generic_wind_speed_hex_flower.xml')
+
+@pytest.mark.parametrize('name', FLOWERS)
+def test_transition_matrix_is_stochastic(load_flower, name):
+    P = transition_matrix(load_flower(name))
+    assert np.all(P >= 0)
+    np.testing.assert_allclose(P.sum(axis=1), 1.0)
+    pi = stationary_distribution(P)
+    np.testing.assert_allclose(pi @ P, pi, atol=1e-12)
+    assert pi.sum() == pytest.approx(1.0)
+
+@pytest.mark.parametrize('name', FLOWERS)
+def test_visit_frequencies_match_stationary_distribution(load_flower, name):
+    hf = load_flower(name)
+    pi = stationary_distribution(transition_matrix(hf))
+    paths = simulate_walks(hf, 1, 600, walks=2000, seed=39)
+    # Leave out the warm-up, while the walk still remembers its start.
+    counts = visit_counts(paths[:, 100:], len(hf.hexes))
+    np.testing.assert_allclose(counts / counts.sum(), pi, atol=0.01)
+
+def test_one_step_moves_follow_the_transition_matrix(load_flower):
+    hf = load_flower()
+    P = transition_matrix(hf)
+    n = len(hf.hexes)
+    paths = simulate_walks(hf, np.repeat(np.arange(1, n + 1), 4000), 1,
+                           walks=4000 * n, seed=3)
+    counts = np.zeros((n, n))
+    np.add.at(counts, (paths[:, 0] - 1, paths[:, 1] - 1), 1)
+    np.testing.assert_allclose(counts / 4000, P, atol=0.03)
+    assert np.all(counts[P == 0] == 0)
+
+def test_simulate_walks_is_repeatable_and_checks_start(load_flower):
+    hf = load_flower()
+    a = simulate_walks(hf, 1, 50, walks=10, seed=7)
+    assert a.shape == (10, 51)
+    assert np.all(a[:, 0] == 1)
+    np.testing.assert_array_equal(a, simulate_walks(hf, 1, 50, walks=10, seed=7))
+    with pytest.raises(ValueError):
+        simulate_walks(hf, 0, 5)
+
+def test_heat_values(load_flower):
+    hf = load_flower()
+    P = transition_matrix(hf)
+    np.testing.assert_allclose(heat_values(hf, 'stationary'), stationary_distribution(P))
+    np.testing.assert_allclose(heat_values(hf, 'dwell'), expected_dwell(P))
+    paths = simulate_walks(hf, 1, 20, walks=5, seed=1)
+    assert heat_values(hf, 'frequency', paths).sum() == pytest.approx(1.0)
+    with pytest.raises(ValueError):
+        heat_values(hf, 'frequency')
+    fills = heat_fills(hf, heat_values(hf, 'stationary'))
+    assert sorted(fills) == [hex.id for hex in hf.hexes]
+
+def test_color_ramp_ends():
+    assert color_ramp([0.0, 0.5, 1.0], ('white', 'red')) == ['#FFFFFF', '#FF8080', '#FF0000']
+    assert color_ramp([2.0, 2.0]) == ['#FFFFFF', '#FFFFFF']
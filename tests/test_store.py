@@ -0,0 +1,97 @@
+import pytest
+from lib.classes import BasicWalk
+from lib.simulation import simulate_walks
+from lib.store import WalkStore, flower_hash
+
+def test_walks_round_trip(load_flower, tmp_path):
+    hf = load_flower()
+    paths = simulate_walks(hf, 1, 40, walks=25, seed=48)
+    path = str(tmp_path / 'walks.sqlite')
+    with WalkStore(path) as store:
+        run_id = store.start_run(hf, 'basic', campaign='test', seed=48)
+        assert store.add_walks(run_id, paths) == 0
+        assert store.add_walks(run_id, paths[:5]) == 25
+    with WalkStore(path) as store:
+        for number in (0, 7, 24, 29):
+            rows = store.walk(run_id, number)
+            assert [r[0] for r in rows] == list(range(41))
+            assert [r[1] for r in rows] == paths[number % 25].tolist()
+            assert [r[2] for r in rows] == [hf.hexes[h - 1].zone.type
+                                            for h in paths[number % 25]]
+        assert [r[1] for r in store.walk(run_id, 3, start=10, stop=13)] == \
+            paths[3, 10:13].tolist()
+
+def test_day_and_runs(load_flower):
+    hf, other = load_flower(), load_flower('uniform_basic_hex_flower.xml')
+    with WalkStore() as store:
+        a = store.start_run(hf, 'basic', campaign='east')
+        b = store.start_run(other, 'uniform', campaign='east')
+        c = store.start_run(hf, 'basic', campaign='west')
+        pa = simulate_walks(hf, 1, 10, walks=3, seed=1)
+        pb = simulate_walks(other, 1, 10, walks=2, seed=2)
+        store.add_walks(a, pa)
+        store.add_walks(b, pb)
+        store.add_walks(c, pa)
+        day = store.day(4, campaign='east')
+        assert [(r[0], r[1], r[2]) for r in day] == \
+            [(a, w, int(pa[w, 4])) for w in range(3)] + [(b, w, int(pb[w, 4])) for w in range(2)]
+        assert [r[2] for r in store.day(4, run_id=c)] == pa[:, 4].tolist()
+        assert [r[0] for r in store.runs(campaign='east')] == [a, b]
+        assert [r[0] for r in store.runs(flower='basic')] == [a, c]
+        assert store.runs(campaign='west')[0][3] == flower_hash(hf)
+        with pytest.raises(ValueError):
+            store.day(4)
+
+def test_add_walk_takes_basic_walk_moves(load_flower):
+    hf = load_flower()
+    walk = BasicWalk(hf=hf, start=5, moves=12)
+    while walk.step() is not None:
+        pass
+    with WalkStore() as store:
+        run_id = store.start_run(hf, 'basic')
+        number = store.add_walk(run_id, walk.moves)
+        assert store.walk(run_id, number) == [(i, *move) for i, move in enumerate(walk.moves)]
+
+def test_concurrent_writers_get_their_own_walks(load_flower, tmp_path):
+    import threading
+    hf = load_flower()
+    path = str(tmp_path / 'walks.sqlite')
+    with WalkStore(path) as store:
+        runs = [store.start_run(hf, 'basic', seed=seed) for seed in range(4)]
+    paths = [simulate_walks(hf, 1, 30, walks=20, seed=seed) for seed in range(4)]
+    errors = []
+    def write(run_id, walks):
+        try:
+            with WalkStore(path) as store:
+                for at in range(0, 20, 4):
+                    store.add_walks(run_id, walks[at:at + 4])
+        except Exception as e:
+            errors.append(e)
+    threads = [threading.Thread(target=write, args=args) for args in zip(runs, paths)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert errors == []
+    with WalkStore(path) as store:
+        for run_id, walks in zip(runs, paths):
+            for number in (0, 9, 19):
+                assert [r[1] for r in store.walk(run_id, number)] == walks[number].tolist()
+
+def test_cli_runs_each_get_a_seed(tmp_path):
+    import cli
+    from conftest import data_path
+    from lib.xml_functions import process_xml_hex_flower
+    path = str(tmp_path / 'walks.sqlite')
+    flower = data_path('basic_hex_flower.xml')
+    assert cli.main(['walk', flower, flower, '--walks', '5', '--length', '20',
+                     '--seed', '48', '--format', 'sqlite', '--output', path]) == 0
+    hf = process_xml_hex_flower(xmlfile=flower)
+    with WalkStore(path) as store:
+        runs = store.runs()
+        assert len(runs) == 2 and runs[0][5] != runs[1][5]
+        for run in runs:
+            # The stored seed repeats the run on its own.
+            paths = simulate_walks(hf, 1, 20, walks=5, seed=run[5])
+            for number in (0, 4):
+                assert [r[1] for r in store.walk(run[0], number)] == paths[number].tolist()
@@ -0,0 +1,55 @@
+import pytest
+from lib.walklist import (format_row, scroll_target, yview_target,
+                          append_target, scrollbar_span)
+
+def test_format_row():
+    assert format_row(0, (1, 'normal', None)) == "Start: Hex: 1, Zone: normal, Effect: None"
+    assert format_row(12, (9, 'hazardous', 'rain')) == \
+        "Move #12: Hex: 9, Zone: hazardous, Effect: rain"
+
+def test_scroll_target_keeps_the_last_page_full():
+    assert scroll_target(-5, 100, 10) == (0, False)
+    assert scroll_target(42.7, 100, 10) == (42, False)
+    assert scroll_target(90, 100, 10) == (90, True)
+    assert scroll_target(500, 100, 10) == (90, True)
+    # A list shorter than the view always shows its last row.
+    assert scroll_target(3, 4, 10) == (0, True)
+    assert scroll_target(0, 0, 10) == (0, True)
+
+@pytest.mark.parametrize('args, target', [
+    ((), None), (('moveto', '0.5'), 50.0), (('moveto', 1.0), 100.0),
+    (('scroll', '3', 'units'), 23), (('scroll', -1, 'units'), 19),
+    (('scroll', '2', 'pages'), 40), (('scroll', '-1', 'pages'), 10),
+    (('other',), None)])
+def test_yview_target(args, target):
+    assert yview_target(args, 20, 100, 10) == target
+
+def test_append_follows_only_at_the_end():
+    assert append_target(90, True, 101, 10) == 101
+    # Scrolled back, the view only changes if the new row shows in it.
+    assert append_target(91, False, 101, 10) == 91
+    assert append_target(90, False, 101, 10) == 90
+    assert append_target(50, False, 101, 10) is None
+
+def test_scrollbar_span():
+    assert scrollbar_span(0, 0, 10) == (0.0, 1.0)
+    assert scrollbar_span(0, 5, 10) == (0.0, 1.0)
+    assert scrollbar_span(25, 100, 10) == (0.25, 0.35)
+
+def test_a_walk_of_appends_and_scrolls():
+    # The list as WalkResultList drives it: 27 rows seen 8 at a time.
+    visible, rows, first, follow = 8, 0, 0, True
+    for _ in range(27):
+        rows += 1
+        target = append_target(first, follow, rows, visible)
+        if target is not None:
+            first, follow = scroll_target(target, rows, visible)
+    assert (first, follow) == (19, True)
+    first, follow = scroll_target(yview_target(('scroll', -1, 'pages'), first, rows, visible),
+                                  rows, visible)
+    assert (first, follow) == (11, False)
+    rows += 1
+    assert append_target(first, follow, rows, visible) is None
+    first, follow = scroll_target(yview_target(('moveto', 1.0), first, rows, visible),
+                                  rows, visible)
+    assert (first, follow) == (20, True)
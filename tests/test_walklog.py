@@ -0,0 +1,86 @@
+import csv, os
+import numpy as np
+import pytest
+from lib.simulation import simulate_walks
+from lib.walklog import (HEADER, WalkLogWriter, WalkLogReader, build_index,
+                         index_path, read_index)
+
+@pytest.fixture
+def log(load_flower, tmp_path):
+    # A log of 30 walks of 150 moves, indexed every 16 moves.
+    hf = load_flower()
+    paths = simulate_walks(hf, 1, 149, walks=30, seed=49)
+    path = str(tmp_path / 'walks.csv')
+    with WalkLogWriter(path, hf, every=16) as writer:
+        assert writer.write_paths(paths) == 0
+    return hf, paths, path
+
+def test_random_access_matches_paths(log):
+    hf, paths, path = log
+    with WalkLogReader(path) as reader:
+        assert reader.walks == 30
+        for walk, step in ((0, 0), (3, 15), (3, 16), (17, 100), (29, 149)):
+            w, s, hex_id, zone, effect = reader.move(walk, step)
+            assert (w, s, hex_id) == (walk, step, paths[walk, step])
+            assert zone == hf.hexes[hex_id - 1].zone.type
+        replay = list(reader.replay(12, 140))
+        assert [m[2] for m in replay] == paths[12, 140:].tolist()
+        with pytest.raises(ValueError):
+            reader.move(30, 0)
+        with pytest.raises(ValueError):
+            reader.move(2, 150)
+
+def test_log_is_plain_csv(log):
+    hf, paths, path = log
+    with open(path, newline='') as myfile:
+        rows = list(csv.reader(myfile))
+    assert tuple(rows[0]) == HEADER
+    assert [int(r[2]) for r in rows[1:]] == paths.ravel().tolist()
+
+def test_write_move_and_write_walk_agree_with_write_paths(log, tmp_path):
+    hf, paths, _ = log
+    path = str(tmp_path / 'moves.csv')
+    with WalkLogWriter(path, hf, every=16) as writer:
+        writer.write_walk([(int(h), hf.hexes[h - 1].zone.type, hf.hexes[h - 1].zone.effect)
+                           for h in paths[0]])
+        writer.write_walk(paths[1].tolist())
+    with WalkLogReader(path) as reader:
+        assert [m[2] for m in reader.replay(0)] == paths[0].tolist()
+        assert [m[2] for m in reader.replay(1)] == paths[1].tolist()
+
+def test_build_index_matches_written_index(log):
+    _, _, path = log
+    written = read_index(path)
+    os.remove(index_path(path))
+    assert build_index(path, every=16) == len(written)
+    np.testing.assert_array_equal(read_index(path), written)
+
+def test_append_numbers_on_even_without_index(log):
+    hf, paths, path = log
+    os.remove(index_path(path))
+    with WalkLogWriter(path, hf, every=16) as writer:
+        assert writer.write_paths(paths[:2]) == 30
+    with WalkLogReader(path) as reader:
+        assert reader.walks == 32
+        keys = (reader.index['walk'] << 32) | reader.index['step']
+        assert np.all(np.diff(keys) > 0)
+        assert [m[2] for m in reader.replay(31)] == paths[1].tolist()
+        assert [m[2] for m in reader.replay(5)] == paths[5].tolist()
+
+def test_multiline_effects_stay_on_one_line(tmp_path):
+    path = str(tmp_path / 'walks.csv')
+    effects = ['rain,\nthen "hail"', 'C:\\new\r\nroad', None, 'calm']
+    moves = [(i + 1, 'storm', effect) for i, effect in enumerate(effects)]
+    with WalkLogWriter(path, every=2) as writer:
+        writer.write_walk(moves)
+        writer.write_walk(moves[::-1])
+    with open(path, 'rb') as myfile:
+        assert len(myfile.read().splitlines()) == 1 + 2 * len(moves)
+    indexed = read_index(path)
+    os.remove(index_path(path))
+    assert build_index(path, every=2) == len(indexed)
+    np.testing.assert_array_equal(read_index(path), indexed)
+    with WalkLogReader(path) as reader:
+        assert [m[4] for m in reader.replay(0)] == effects
+        assert reader.move(1, 3) == (1, 3, 1, 'storm', effects[0])
+        assert reader.move(0, 2)[4] is None